@@ -0,0 +1,177 @@
+import math
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+# The size of each square cell in the uniform grid, in meters. Most objects
+# and every hole/lava area span only a few cells at this size.
+GRID_CELL_SIZE = 1.0
+
+
+def _find_cells(box_xz: List[Any]) -> List[Tuple[int, int]]:
+    """Return every grid cell touched by the axis-aligned X/Z extent of the
+    given box (a list of points, or an array of X/Z points). The extent is
+    inclusive, so boxes that only touch one another on an edge still share a
+    cell."""
+    if isinstance(box_xz, np.ndarray):
+        xs = box_xz[:, 0]
+        zs = box_xz[:, 1]
+    else:
+        xs = [
+            point.x if hasattr(point, 'x') else point['x']
+            for point in box_xz
+        ]
+        zs = [
+            point.z if hasattr(point, 'z') else point['z']
+            for point in box_xz
+        ]
+    min_x = math.floor(float(min(xs)) / GRID_CELL_SIZE)
+    max_x = math.floor(float(max(xs)) / GRID_CELL_SIZE)
+    min_z = math.floor(float(min(zs)) / GRID_CELL_SIZE)
+    max_z = math.floor(float(max(zs)) / GRID_CELL_SIZE)
+    return [
+        (cell_x, cell_z)
+        for cell_x in range(min_x, max_x + 1)
+        for cell_z in range(min_z, max_z + 1)
+    ]
+
+
+class IndexedBoundsList(list):
+    """A list of ObjectBounds that also keeps a uniform grid over the X/Z
+    extent of each bounds, so collision checks can test only the bounds near
+    a candidate location rather than scanning the whole list. It behaves like
+    a normal list: appending or extending updates the grid incrementally, and
+    any other change to the list rebuilds the grid on the next query."""
+
+    def __init__(self, iterable: Iterable = ()):
+        super().__init__(iterable)
+        self._grid: Dict[Tuple[int, int], List[Any]] = {}
+        # Copies share their grid (and its cell lists) until one of them
+        # changes it. Then it copies the grid, and each cell list it changes.
+        self._grid_shared = False
+        self._owned_cells: Optional[Set[Tuple[int, int]]] = None
+        self._indexed = 0
+        self._dirty = False
+        self._index_new_items()
+
+    def _add_to_grid(self, cell: Tuple[int, int], bounds: Any) -> None:
+        if self._grid_shared:
+            self._grid = dict(self._grid)
+            self._grid_shared = False
+            self._owned_cells = set()
+        items = self._grid.get(cell)
+        if items is None:
+            self._grid[cell] = [bounds]
+            if self._owned_cells is not None:
+                self._owned_cells.add(cell)
+        elif self._owned_cells is not None and cell not in self._owned_cells:
+            self._grid[cell] = items + [bounds]
+            self._owned_cells.add(cell)
+        else:
+            items.append(bounds)
+
+    def _index_new_items(self) -> None:
+        for bounds in self[self._indexed:]:
+            for cell in _find_cells(bounds.points_xz):
+                self._add_to_grid(cell, bounds)
+        self._indexed = len(self)
+
+    def _rebuild(self) -> None:
+        self._grid = {}
+        self._grid_shared = False
+        self._owned_cells = None
+        self._indexed = 0
+        self._dirty = False
+        self._index_new_items()
+
+    def _mark_dirty(self) -> None:
+        self._dirty = True
+
+    def append(self, bounds: Any) -> None:
+        super().append(bounds)
+        if not self._dirty:
+            self._index_new_items()
+
+    def extend(self, iterable: Iterable) -> None:
+        super().extend(iterable)
+        if not self._dirty:
+            self._index_new_items()
+
+    def __iadd__(self, iterable: Iterable) -> 'IndexedBoundsList':
+        self.extend(iterable)
+        return self
+
+    def __add__(self, other: Iterable) -> 'IndexedBoundsList':
+        result = self.copy()
+        result.extend(other)
+        return result
+
+    def copy(self) -> 'IndexedBoundsList':
+        """Return a copy of this list. The copy shares this list's grid until
+        either of them is changed, so copying doesn't rebuild the grid."""
+        if self._dirty:
+            self._rebuild()
+        result = IndexedBoundsList.__new__(IndexedBoundsList)
+        list.extend(result, self)
+        result._grid = self._grid
+        result._grid_shared = True
+        result._owned_cells = None
+        result._indexed = self._indexed
+        result._dirty = False
+        self._grid_shared = True
+        return result
+
+    def __copy__(self) -> 'IndexedBoundsList':
+        return self.copy()
+
+    def __reduce_ex__(self, protocol):
+        # Rebuild the grid when copied or pickled rather than serializing it.
+        return (IndexedBoundsList, (list(self),))
+
+    def __setitem__(self, key, value) -> None:
+        super().__setitem__(key, value)
+        self._mark_dirty()
+
+    def __delitem__(self, key) -> None:
+        super().__delitem__(key)
+        self._mark_dirty()
+
+    def insert(self, index: int, bounds: Any) -> None:
+        super().insert(index, bounds)
+        self._mark_dirty()
+
+    def pop(self, *args) -> Any:
+        bounds = super().pop(*args)
+        self._mark_dirty()
+        return bounds
+
+    def remove(self, bounds: Any) -> None:
+        super().remove(bounds)
+        self._mark_dirty()
+
+    def clear(self) -> None:
+        super().clear()
+        self._rebuild()
+
+    def reverse(self) -> None:
+        super().reverse()
+        self._mark_dirty()
+
+    def sort(self, *args, **kwargs) -> None:
+        super().sort(*args, **kwargs)
+        self._mark_dirty()
+
+    def find_nearby(self, box_xz: List[Any]) -> List[Any]:
+        """Return each bounds in this list whose X/Z extent overlaps or
+        touches the X/Z extent of the given box. Any bounds that could
+        collide with the given box is always returned."""
+        if self._dirty:
+            self._rebuild()
+        nearby = []
+        seen = set()
+        for cell in _find_cells(box_xz):
+            for bounds in self._grid.get(cell, []):
+                if id(bounds) not in seen:
+                    seen.add(id(bounds))
+                    nearby.append(bounds)
+        return nearby
@@ -0,0 +1,119 @@
+import hashlib
+import json
+import logging
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Any, List, Optional, Tuple
+
+from . import materials
+
+logger = logging.getLogger(__name__)
+
+# Increment whenever the format of the cached datasets changes.
+DATASET_CACHE_VERSION = 1
+
+# The directory of the on-disk cache of expanded definition datasets, or None
+# to disable the cache. Override it using the MCS_DATASET_CACHE_DIR
+# environment variable (set it to an empty string to disable the cache).
+DATASET_CACHE_DIR = os.environ.get(
+    'MCS_DATASET_CACHE_DIR',
+    os.path.join(
+        os.path.expanduser('~'),
+        '.cache',
+        'mcs-scene-generator',
+        'datasets'
+    )
+) or None
+
+
+def _json_default(data: Any) -> Any:
+    if isinstance(data, (set, frozenset)):
+        return sorted(data)
+    # Shapely geometry (like an object definition's poly).
+    if hasattr(data, 'wkt'):
+        return data.wkt
+    if hasattr(data, '__dict__'):
+        return vars(data)
+    return repr(data)
+
+
+def _cache_key(definition_list: List) -> str:
+    """Return a hash of the given source definition list, the materials used
+    to expand it, and the code used to expand it, so any change to them will
+    invalidate the cached dataset."""
+    digest = hashlib.sha256()
+    digest.update(str(DATASET_CACHE_VERSION).encode())
+    digest.update(Path(__file__).with_name('definitions.py').read_bytes())
+    digest.update(json.dumps([
+        definition_list,
+        {
+            name: value for name, value in vars(materials).items()
+            if name.endswith('_MATERIALS')
+        },
+        materials.UNTRAINED_COLOR_LIST
+    ], default=_json_default, sort_keys=True).encode())
+    return digest.hexdigest()
+
+
+def find_dataset_cache_path(name: str, definition_list: List) -> Optional[
+    Path
+]:
+    """Return the path to the cached dataset with the given name for the
+    given source definition list, or None if the cache is disabled."""
+    if not DATASET_CACHE_DIR:
+        return None
+    return Path(DATASET_CACHE_DIR, (
+        f'{name}-{_cache_key(definition_list)[:32]}.pickle'
+    ))
+
+
+def load_cached_dataset(path: Optional[Path]) -> Optional[Tuple]:
+    """Return the expanded definition groups from the cached dataset at the
+    given path, or None if it doesn't exist or can't be loaded."""
+    if not path:
+        return None
+    try:
+        with open(path, 'rb') as cache_file:
+            return pickle.load(cache_file)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f'Ignoring cached dataset {path}: {e!r}')
+        return None
+
+
+def save_cached_dataset(
+    path: Optional[Path],
+    definition_groups: Tuple
+) -> None:
+    """Save the given expanded definition groups as the cached dataset at the
+    given path, and remove any outdated cached dataset with the same name.
+    Failing to save the cached dataset is not an error."""
+    if not path:
+        return
+    temp_file = None
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first so other processes loading the
+        # cached dataset at the same time never see a partial file.
+        with tempfile.NamedTemporaryFile(
+            dir=path.parent,
+            suffix='.tmp',
+            delete=False
+        ) as temp_file:
+            pickle.dump(
+                definition_groups,
+                temp_file,
+                protocol=pickle.HIGHEST_PROTOCOL
+            )
+        os.replace(temp_file.name, path)
+        name = path.name.rsplit('-', 1)[0]
+        for outdated_path in path.parent.glob(f'{name}-*.pickle'):
+            if outdated_path != path:
+                outdated_path.unlink(missing_ok=True)
+    except Exception as e:
+        logger.warning(f'Failed to save cached dataset {path}: {e!r}')
+        if temp_file:
+            Path(temp_file.name).unlink(missing_ok=True)
@@ -4,14 +4,14 @@ import copy
 import math
 import random
 from abc import ABC, abstractmethod
-from collections import namedtuple
+from collections import defaultdict, namedtuple
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 
 from machine_common_sense.config_manager import Vector3d
 
-from . import materials, tags
+from . import dataset_cache, materials, tags
 from .objects import SceneObject
 
 MAX_SIZE_DIFF = 0.05
@@ -307,6 +307,17 @@ class ObjectDefinition(
         if len(self.chooseTypeList) == 1:
             self.assign_chosen_type(self.chooseTypeList[0])
 
+    def __deepcopy__(self, memo: Dict[int, Any]) -> ObjectDefinition:
+        definition = self.__class__.__new__(self.__class__)
+        memo[id(self)] = definition
+        for prop, data in self.__dict__.items():
+            # Share the immutable source of a copy-on-read definition (see
+            # create_definition_from_immutable) rather than copying it.
+            definition.__dict__[prop] = data if prop == '_immutable' else (
+                copy.deepcopy(data, memo)
+            )
+        return definition
+
     # Override
     def get_debug_props(self) -> List[str]:
         return (
@@ -831,43 +842,232 @@ ImmutableObjectDefinition = namedtuple(
     defaults=(None,) * len(_object_definition_properties)
 )
 
+_IMMUTABLE_TYPES = (bool, float, int, str, type(None))
+
+# The default values of the ObjectDefinition properties that its constructor
+# sets if they're not given (or are falsy).
+_OBJECT_DEFINITION_DEFAULTS = {
+    'attributes': list,
+    'chooseMaterialList': list,
+    'chooseSizeList': list,
+    'chooseTypeList': list,
+    'massMultiplier': lambda: 1,
+    'materialCategory': list,
+    'offset': Vector3d,
+    'rotation': Vector3d,
+    'shape': list
+}
+
+
+def _copy_property(data: Any) -> Any:
+    if isinstance(data, _IMMUTABLE_TYPES):
+        return data
+    if isinstance(data, list) and all(
+        isinstance(item, _IMMUTABLE_TYPES) for item in data
+    ):
+        return data.copy()
+    return copy.deepcopy(data)
+
+
+class _CopyOnReadProperty():
+    """An ObjectDefinition property that, for a definition made by
+    create_definition_from_immutable, copies the property from the definition's
+    immutable source the first time it's used. Since this doesn't define
+    __set__, the copy (or any newly set value) is saved in the definition's own
+    __dict__, which then takes precedence over this property."""
+
+    def __init__(self, prop: str, default: Any):
+        self.prop = prop
+        self.default = default
+
+    def __get__(self, definition: ObjectDefinition, owner: type = None) -> Any:
+        if definition is None or '_immutable' not in definition.__dict__:
+            return self.default
+        data = getattr(definition.__dict__['_immutable'], self.prop)
+        if not data and self.prop in _OBJECT_DEFINITION_DEFAULTS:
+            data = _OBJECT_DEFINITION_DEFAULTS[self.prop]()
+        else:
+            data = _copy_property(data)
+        definition.__dict__[self.prop] = data
+        return data
+
+
+for _prop in _object_definition_properties:
+    setattr(ObjectDefinition, _prop, _CopyOnReadProperty(
+        _prop,
+        getattr(ObjectDefinition, _prop, None)
+    ))
+
+
+def create_definition_from_immutable(
+    immutable_definition: ImmutableObjectDefinition
+) -> ObjectDefinition:
+    """Return a new mutable ObjectDefinition with the same properties as the
+    given immutable definition. Rather than copying all of its properties now,
+    copy each property only when it's first used, so choosing definitions from
+    datasets is fast, and changing the new definition (even changing a nested
+    property, like its dimensions) never changes the immutable definition."""
+    if any(len(choice_list or []) == 1 for choice_list in [
+        immutable_definition.chooseMaterialList,
+        immutable_definition.chooseSizeList,
+        immutable_definition.chooseTypeList
+    ]):
+        # The constructor automatically assigns each single choice.
+        return ObjectDefinition(**copy.deepcopy(
+            immutable_definition._asdict()
+        ))
+    definition = ObjectDefinition.__new__(ObjectDefinition)
+    definition.__dict__['_immutable'] = immutable_definition
+    return definition
+
+
+def create_immutable_definition(
+    definition: ObjectDefinition
+) -> ImmutableObjectDefinition:
+    """Return a new ImmutableObjectDefinition with the same properties as the
+    given object definition."""
+    return ImmutableObjectDefinition(*[
+        getattr(definition, prop) for prop in ImmutableObjectDefinition._fields
+    ])
+
+
+# The random seed used to shuffle each new dataset, or None to use the global
+# random state. Processes that generate scenes in parallel (like the scene
+# generator's worker processes) set it, so that every process shuffles its
+# datasets the same way, no matter which scene first needs each dataset.
+DATASET_SHUFFLE_SEED: Optional[int] = None
+
+
+def _shuffle_definition_groups(
+    definition_groups: Tuple[Tuple[Tuple[ImmutableObjectDefinition]]]
+) -> Tuple[Tuple[Tuple[ImmutableObjectDefinition]]]:
+    """Return a copy of the given definition groups with the groups, the
+    selections in each group, and the variations in each selection shuffled
+    into a random order."""
+    generator = (
+        random if DATASET_SHUFFLE_SEED is None else
+        random.Random(DATASET_SHUFFLE_SEED)
+    )
+    shuffled_groups = []
+    for definition_selections in definition_groups:
+        shuffled_selections = [
+            tuple(generator.sample(definition_variations, k=len(
+                definition_variations
+            ))) for definition_variations in definition_selections
+        ]
+        generator.shuffle(shuffled_selections)
+        shuffled_groups.append(tuple(shuffled_selections))
+    generator.shuffle(shuffled_groups)
+    return tuple(shuffled_groups)
+
 
 def create_dataset(
     definition_list: List[List[ObjectDefinition]],
     # We should only ever set unshuffled to True in a unit test.
-    unshuffled: bool = False
+    unshuffled: bool = False,
+    cache_name: str = None
 ) -> DefinitionDataset:
     """Create and return a new DefinitionDataset for the given definition
     list by retrieving all choice and material combinations for all definitions
-    in the list and making them immutable."""
-
-    complete_definition_list = retrieve_complete_definition_list(
-        definition_list,
-        unshuffled=unshuffled
+    in the list and making them immutable. If a cache name is given, load the
+    immutable definitions from the on-disk dataset cache if they're there, or
+    otherwise save them to the cache, so each new process doesn't need to
+    retrieve them again."""
+
+    cache_path = (
+        dataset_cache.find_dataset_cache_path(cache_name, definition_list)
+        if cache_name else None
     )
+    immutable_groups = dataset_cache.load_cached_dataset(cache_path)
+
+    if immutable_groups is None:
+        # Always retrieve the definitions in the same order so they can be
+        # cached, and shuffle them afterward.
+        complete_definition_list = retrieve_complete_definition_list(
+            definition_list,
+            unshuffled=True
+        )
 
-    immutable_groups = []
-    for definition_selections in complete_definition_list:
-        immutable_selections = []
-        for definition_variations in definition_selections:
-            immutable_variations = [
-                # Convert the object definition to an immutable namedtuple.
-                ImmutableObjectDefinition(**vars(definition))
-                for definition in definition_variations
-            ]
+        immutable_groups = []
+        for definition_selections in complete_definition_list:
+            immutable_selections = []
+            for definition_variations in definition_selections:
+                immutable_variations = [
+                    # Convert the object definition to an immutable namedtuple.
+                    create_immutable_definition(definition)
+                    for definition in definition_variations
+                ]
+                # Convert the list to a tuple so it will be immutable.
+                immutable_selections.append(tuple(immutable_variations))
             # Convert the list to a tuple so it will be immutable.
-            immutable_selections.append(tuple(immutable_variations))
+            immutable_groups.append(tuple(immutable_selections))
+
         # Convert the list to a tuple so it will be immutable.
-        immutable_groups.append(tuple(immutable_selections))
+        immutable_groups = tuple(immutable_groups)
+        dataset_cache.save_cached_dataset(cache_path, immutable_groups)
+
+    if not unshuffled:
+        immutable_groups = _shuffle_definition_groups(immutable_groups)
+    return DefinitionDataset(immutable_groups)
 
-    # Convert the list to a tuple so it will be immutable.
-    return DefinitionDataset(tuple(immutable_groups))
+
+# The most filtered datasets that each dataset will memoize at once.
+FILTER_CACHE_SIZE = 256
+
+UNTRAINED_TAGS = [
+    tags.SCENE.UNTRAINED_CATEGORY,
+    tags.SCENE.UNTRAINED_COLOR,
+    tags.SCENE.UNTRAINED_COMBINATION,
+    tags.SCENE.UNTRAINED_SHAPE,
+    tags.SCENE.UNTRAINED_SIZE
+]
+
+
+def _similar_type(type_name: str) -> str:
+    """Return the given object type as compared by the is_similar_except_in
+    functions, which treat all apple types and all crayon types as the
+    same."""
+    for type_prefix in ['apple', 'crayon']:
+        if type_name and type_name.startswith(type_prefix):
+            return type_prefix
+    return type_name
+
+
+def _similarity_properties(
+    definition_or_instance: Union[ObjectDefinition, SceneObject]
+) -> Tuple[str, List[str], List[str], Dict[str, float]]:
+    """Return the type, materials, colors, and dimensions of the given object
+    as compared by the is_similar_except_in functions."""
+    # TODO MCS-697 Use dot notation for SceneObject
+    if isinstance(definition_or_instance, (SceneObject, dict)):
+        return (
+            definition_or_instance['type'],
+            definition_or_instance['materials'] or [],
+            definition_or_instance['debug']['color'] or [],
+            definition_or_instance['debug']['dimensions']
+        )
+    return (
+        definition_or_instance.type,
+        definition_or_instance.materials or [],
+        definition_or_instance.color or [],
+        vars(definition_or_instance.dimensions)
+    )
+
+
+def _size_bucket(x: float, z: float, only_diagonal_size: bool) -> int:
+    """Return the size bucket for the given X/Z dimensions. Objects similar
+    in size are always in the same or neighboring buckets."""
+    size = math.sqrt(x**2 + z**2) if only_diagonal_size else x
+    return math.floor(size / MAX_SIZE_DIFF)
 
 
 class DefinitionDataset():
     """Manages a collection of object definitions in a given triple-nested
     list. Can filter definitions on specific properties and choose a random
-    definition from the lists."""
+    definition from the lists. The common filters use indexes of the
+    definitions that are made the first time this dataset is filtered, and
+    their results are memoized, since the same filters are often used many
+    times on the same dataset."""
 
     def __init__(
         self,
@@ -876,18 +1076,165 @@ class DefinitionDataset():
         """Please call the create_dataset function to create a new
         DatasetDefinition."""
         self._definition_groups = definition_groups
+        self._entries: List[Tuple[int, int, ImmutableObjectDefinition]] = None
+        self._filter_cache: Dict[Tuple, DefinitionDataset] = {}
+        self._size: int = None
+
+    def _build_indexes(self) -> None:
+        """Index each definition in this dataset by its type, untrained tags,
+        materials, and size bucket, using its position in a flat list of
+        (group index, selection index, definition) entries."""
+        self._entries = []
+        self._type_index: Dict[str, Set[int]] = defaultdict(set)
+        self._similar_type_index: Dict[str, Set[int]] = defaultdict(set)
+        self._untrained_index: Dict[str, Set[int]] = {
+            tag: set() for tag in UNTRAINED_TAGS
+        }
+        self._materials_index: Dict[Tuple[str], Set[int]] = defaultdict(set)
+        # Size buckets for all three dimensions or only the diagonal size.
+        self._size_index: Dict[bool, Dict[Optional[int], Set[int]]] = {
+            False: defaultdict(set),
+            True: defaultdict(set)
+        }
+        for group_index, definition_selections in enumerate(
+            self._definition_groups
+        ):
+            for selection_index, definition_variations in enumerate(
+                definition_selections
+            ):
+                for definition in definition_variations:
+                    index = len(self._entries)
+                    self._entries.append(
+                        (group_index, selection_index, definition)
+                    )
+                    self._type_index[definition.type].add(index)
+                    self._similar_type_index[
+                        _similar_type(definition.type)
+                    ].add(index)
+                    for tag in UNTRAINED_TAGS:
+                        if getattr(definition, tag, False):
+                            self._untrained_index[tag].add(index)
+                    self._materials_index[
+                        tuple(definition.materials or [])
+                    ].add(index)
+                    dimensions = definition.dimensions
+                    for diagonal, size_index in self._size_index.items():
+                        # Definitions without dimensions are always compared.
+                        bucket = _size_bucket(
+                            dimensions.x,
+                            dimensions.z,
+                            diagonal
+                        ) if dimensions else None
+                        size_index[bucket].add(index)
+        self._size = len(self._entries)
+
+    def _filter_on_indexes(
+        self,
+        key: Optional[Tuple],
+        find_indexes: Callable[[], Set[int]]
+    ) -> DefinitionDataset:
+        """Return a copy of this dataset containing only the definitions at
+        the indexes returned by the given function. Memoize the copy using
+        the given key, unless the key is None."""
+        if key is not None and key in self._filter_cache:
+            return self._filter_cache[key]
+        if self._entries is None:
+            self._build_indexes()
+        output_list = []
+        last_position = (None, None)
+        for index in sorted(find_indexes()):
+            group_index, selection_index, definition = self._entries[index]
+            if group_index != last_position[0]:
+                output_list.append([])
+            if (group_index, selection_index) != last_position:
+                output_list[-1].append([])
+            output_list[-1][-1].append(definition)
+            last_position = (group_index, selection_index)
+        dataset = DefinitionDataset(tuple(
+            tuple(tuple(variations) for variations in selections)
+            for selections in output_list
+        ))
+        if key is not None:
+            if len(self._filter_cache) >= FILTER_CACHE_SIZE:
+                del self._filter_cache[next(iter(self._filter_cache))]
+            self._filter_cache[key] = dataset
+        return dataset
+
+    def _filter_on_similar(
+        self,
+        similarity_function: Callable[..., bool],
+        target_definition: Union[ObjectDefinition, SceneObject],
+        only_diagonal_size: bool
+    ) -> DefinitionDataset:
+        """Return a copy of this dataset containing only definitions that are
+        similar to the given definition using the given is_similar_except_in
+        function. Use the indexes to find each candidate definition, then
+        check each candidate using the function itself."""
+        if self.size() == 0:
+            return DefinitionDataset(())
+        type_name, material_list, color_list, dimensions = (
+            _similarity_properties(target_definition)
+        )
+        # A target definition from a dataset may be excluded as a duplicate
+        # of itself, so don't memoize it.
+        key = None if isinstance(target_definition, tuple) else (
+            similarity_function.__name__,
+            type_name,
+            tuple(material_list),
+            tuple(color_list),
+            (dimensions['x'], dimensions['y'], dimensions['z']),
+            only_diagonal_size
+        )
+
+        def _find_indexes() -> Set[int]:
+            same_type = self._similar_type_index.get(
+                _similar_type(type_name),
+                set()
+            )
+            if similarity_function is is_similar_except_in_size:
+                candidates = same_type
+            else:
+                bucket = _size_bucket(
+                    dimensions['x'],
+                    dimensions['z'],
+                    only_diagonal_size
+                )
+                size_index = self._size_index[only_diagonal_size]
+                candidates = set(size_index.get(None, set())).union(*[
+                    size_index.get(nearby, set())
+                    for nearby in range(bucket - 2, bucket + 3)
+                ])
+                if similarity_function is is_similar_except_in_color:
+                    candidates &= same_type
+                else:
+                    candidates -= same_type
+                    # Materials must match, unless either has no materials.
+                    if material_list:
+                        candidates &= (
+                            self._materials_index.get(
+                                tuple(material_list),
+                                set()
+                            ) | self._materials_index.get((), set())
+                        )
+            return {index for index in candidates if similarity_function(
+                target_definition,
+                self._entries[index][2],
+                only_diagonal_size=only_diagonal_size
+            )}
+
+        return self._filter_on_indexes(key, _find_indexes)
 
     def choose_random_definition(self) -> ObjectDefinition:
         """Choose and return a random object definition from this dataset."""
         immutable_definition = random.choice(random.choice(random.choice(
             self._definition_groups
         )))
-        return ObjectDefinition(**immutable_definition._asdict())
+        return create_definition_from_immutable(immutable_definition)
 
     def definitions(self, unshuffled: bool = False) -> List[ObjectDefinition]:
         """Return a list of all of the object definitions in this dataset."""
         definitions = [
-            ObjectDefinition(**immutable_definition._asdict())
+            create_definition_from_immutable(immutable_definition)
             for definition_selections in self._definition_groups
             for definition_variations in definition_selections
             for immutable_definition in definition_variations
@@ -902,11 +1249,13 @@ class DefinitionDataset():
 
     def size(self) -> int:
         """Return the number of definitions in this dataset."""
-        return len([
-            definition for definition_selections in self._definition_groups
-            for definition_variations in definition_selections
-            for definition in definition_variations
-        ])
+        if self._size is None:
+            self._size = sum(
+                len(definition_variations)
+                for definition_selections in self._definition_groups
+                for definition_variations in definition_selections
+            )
+        return self._size
 
     def filter_on_custom(
         self,
@@ -935,15 +1284,11 @@ class DefinitionDataset():
     ) -> DefinitionDataset:
         """Return a copy of this dataset containing only definitions that are
         similar to the given definition except in materials/colors."""
-
-        def _callback(definition: ImmutableObjectDefinition) -> bool:
-            return is_similar_except_in_color(
-                target_definition,
-                definition,
-                only_diagonal_size=only_diagonal_size
-            )
-
-        return self.filter_on_custom(_callback)
+        return self._filter_on_similar(
+            is_similar_except_in_color,
+            target_definition,
+            only_diagonal_size
+        )
 
     def filter_on_similar_except_shape(
         self,
@@ -952,15 +1297,11 @@ class DefinitionDataset():
     ) -> DefinitionDataset:
         """Return a copy of this dataset containing only definitions that are
         similar to the given definition except in type."""
-
-        def _callback(definition: ImmutableObjectDefinition) -> bool:
-            return is_similar_except_in_shape(
-                target_definition,
-                definition,
-                only_diagonal_size=only_diagonal_size
-            )
-
-        return self.filter_on_custom(_callback)
+        return self._filter_on_similar(
+            is_similar_except_in_shape,
+            target_definition,
+            only_diagonal_size
+        )
 
     def filter_on_similar_except_size(
         self,
@@ -969,31 +1310,22 @@ class DefinitionDataset():
     ) -> DefinitionDataset:
         """Return a copy of this dataset containing only definitions that are
         similar to the given definition except in size/dimensions."""
-
-        def _callback(definition: ImmutableObjectDefinition) -> bool:
-            return is_similar_except_in_size(
-                target_definition,
-                definition,
-                only_diagonal_size=only_diagonal_size
-            )
-
-        return self.filter_on_custom(_callback)
+        return self._filter_on_similar(
+            is_similar_except_in_size,
+            target_definition,
+            only_diagonal_size
+        )
 
     def filter_on_trained(self) -> DefinitionDataset:
         """Return a copy of this dataset containing only definitions that are
         trained."""
 
-        def _callback(definition: ImmutableObjectDefinition) -> bool:
-            props = definition._asdict()
-            return not (
-                (props.get(tags.SCENE.UNTRAINED_CATEGORY, False)) or
-                (props.get(tags.SCENE.UNTRAINED_COLOR, False)) or
-                (props.get(tags.SCENE.UNTRAINED_COMBINATION, False)) or
-                (props.get(tags.SCENE.UNTRAINED_SHAPE, False)) or
-                (props.get(tags.SCENE.UNTRAINED_SIZE, False))
-            )
+        def _find_indexes() -> Set[int]:
+            return set(range(len(self._entries))).difference(*[
+                self._untrained_index[tag] for tag in UNTRAINED_TAGS
+            ])
 
-        return self.filter_on_custom(_callback)
+        return self._filter_on_indexes(('trained',), _find_indexes)
 
     def filter_on_type(
         self,
@@ -1003,14 +1335,25 @@ class DefinitionDataset():
         """Return a copy of this dataset containing only definitions that
         either are or are not the given type(s)."""
 
-        def _callback(definition: ImmutableObjectDefinition) -> bool:
+        def _find_indexes() -> Set[int]:
             if cannot_be:
-                return definition.type not in cannot_be
+                return set(range(len(self._entries))).difference(*[
+                    self._type_index.get(type_name, set())
+                    for type_name in cannot_be
+                ])
             if must_be:
-                return definition.type in must_be
-            return True
-
-        return self.filter_on_custom(_callback)
+                return set().union(*[
+                    self._type_index.get(type_name, set())
+                    for type_name in must_be
+                ])
+            return set(range(len(self._entries)))
+
+        key = (
+            'type',
+            tuple(must_be) if must_be else None,
+            tuple(cannot_be) if cannot_be else None
+        )
+        return self._filter_on_indexes(key, _find_indexes)
 
     def filter_on_untrained(
         self,
@@ -1019,24 +1362,18 @@ class DefinitionDataset():
         """Return a copy of this dataset containing only definitions that are
         untrained using the given tag."""
 
-        trained_tag_list = [tag for tag in [
-            tags.SCENE.UNTRAINED_CATEGORY,
-            tags.SCENE.UNTRAINED_COLOR,
-            tags.SCENE.UNTRAINED_COMBINATION,
-            tags.SCENE.UNTRAINED_SHAPE,
-            tags.SCENE.UNTRAINED_SIZE
-        ] if tag != untrained_tag]
-
-        def _callback(definition: ImmutableObjectDefinition) -> bool:
-            props = definition._asdict()
-            if props.get(untrained_tag, False):
-                # Return False if any other tag is marked untrained (True)
-                return not any(
-                    [props.get(tag, False) for tag in trained_tag_list]
-                )
-            return False
-
-        return self.filter_on_custom(_callback)
+        def _find_indexes() -> Set[int]:
+            untrained = self._untrained_index.get(untrained_tag, set())
+            # Exclude definitions with any other tag marked untrained.
+            return untrained.difference(*[
+                self._untrained_index[tag] for tag in UNTRAINED_TAGS
+                if tag != untrained_tag
+            ])
+
+        return self._filter_on_indexes(
+            ('untrained', untrained_tag),
+            _find_indexes
+        )
 
     def dataset_unique_shape_scale(self, keep: int = 1) -> DefinitionDataset:
         """Function for unit tests: Return a new dataset containing all of the
@@ -1079,7 +1416,9 @@ class DefinitionDataset():
                         unique[definition.type][scale_str] = 0
                     if unique[definition.type][scale_str] < 1:
                         unique[definition.type][scale_str] += 1
-                        output.append(ObjectDefinition(**definition._asdict()))
+                        output.append(
+                            create_definition_from_immutable(definition)
+                        )
         return output
 
 
@@ -1096,5 +1435,9 @@ def get_dataset(
     existing dataset for the given property if it's already made."""
     datasets = DATASETS_UNSHUFFLED if unshuffled else DATASETS
     if not datasets.get(prop):
-        datasets[prop] = create_dataset(definition_list, unshuffled=unshuffled)
+        datasets[prop] = create_dataset(
+            definition_list,
+            unshuffled=unshuffled,
+            cache_name=prop
+        )
     return datasets[prop]
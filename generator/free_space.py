@@ -0,0 +1,192 @@
+import bisect
+import random
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+from shapely import geometry, ops
+
+# Ignore pieces of free space smaller than this (in square meters), which are
+# just slivers left over from floating point error.
+MIN_PIECE_AREA = 1e-9
+
+
+def _convex_hull(points: List[Tuple[float, float]]) -> List[Tuple]:
+    """Return the convex hull of the given X/Z points, counterclockwise,
+    using the monotone chain algorithm (much faster than making a shapely
+    MultiPoint for the few points of each obstacle)."""
+    points = sorted(set(points))
+    if len(points) < 3:
+        return points
+
+    def _cross(origin, point_a, point_b):
+        return (
+            (point_a[0] - origin[0]) * (point_b[1] - origin[1]) -
+            (point_a[1] - origin[1]) * (point_b[0] - origin[0])
+        )
+
+    lower = []
+    for point in points:
+        while len(lower) >= 2 and _cross(lower[-2], lower[-1], point) <= 0:
+            lower.pop()
+        lower.append(point)
+    upper = []
+    for point in reversed(points):
+        while len(upper) >= 2 and _cross(upper[-2], upper[-1], point) <= 0:
+            upper.pop()
+        upper.append(point)
+    return lower[:-1] + upper[:-1]
+
+
+def _minkowski_difference(
+    obstacle_xz: np.ndarray,
+    footprint_xz: np.ndarray
+) -> Optional[geometry.Polygon]:
+    """Return the area in which the center of an object with the given
+    footprint (X/Z points relative to its center) would overlap the given
+    obstacle (X/Z points), or None if it has no area. Both are convex, so
+    it's the convex hull of each obstacle point minus each footprint point.
+    """
+    hull = _convex_hull([
+        tuple(point) for point in
+        (obstacle_xz[:, None, :] - footprint_xz[None, :, :])
+        .reshape(-1, 2).tolist()
+    ])
+    return geometry.Polygon(hull) if len(hull) >= 3 else None
+
+
+def _polygons(shape: geometry.base.BaseGeometry) -> List[geometry.Polygon]:
+    if isinstance(shape, geometry.Polygon):
+        return [shape]
+    return [
+        polygon for polygon in getattr(shape, 'geoms', [])
+        if isinstance(polygon, geometry.Polygon)
+    ]
+
+
+def _triangulate(region: geometry.base.BaseGeometry) -> List[Tuple]:
+    """Split the given region (which may have holes) into triangles. Cut the
+    region into vertical strips at the X of each of its vertices: no vertex
+    is inside a strip, so each piece of a strip is a convex trapezoid (or a
+    triangle) that's easy to fan into triangles."""
+    if region.is_empty:
+        return []
+    polygons = _polygons(region)
+    xs = sorted({
+        x
+        for polygon in polygons
+        for ring in [polygon.exterior] + list(polygon.interiors)
+        for x, _ in ring.coords
+    })
+    min_x, min_z, max_x, max_z = region.bounds
+    triangles = []
+    for strip_min_x, strip_max_x in zip(xs, xs[1:]):
+        strip = geometry.box(strip_min_x, min_z, strip_max_x, max_z)
+        for piece in _polygons(region.intersection(strip)):
+            if piece.area < MIN_PIECE_AREA:
+                continue
+            points = list(piece.exterior.coords)[:-1]
+            for index in range(1, len(points) - 1):
+                triangle = (points[0], points[index], points[index + 1])
+                area = abs(
+                    (triangle[1][0] - triangle[0][0]) *
+                    (triangle[2][1] - triangle[0][1]) -
+                    (triangle[2][0] - triangle[0][0]) *
+                    (triangle[1][1] - triangle[0][1])
+                ) / 2.0
+                if area >= MIN_PIECE_AREA:
+                    triangles.append((triangle, area))
+    return triangles
+
+
+class FreeSpace():
+    """The free floor space of a room for the center of an object with the
+    given footprint: every position at which the object would be completely
+    inside the room without overlapping any of the given obstacles. It's the
+    room (shrunk by the footprint) minus each obstacle dilated by the
+    footprint, so positions can be sampled uniformly from it directly rather
+    than drawn from the whole room and rejected on collision.
+
+    The footprint and each obstacle are lists of convex X/Z points; the
+    footprint's points are relative to the object's center. A non-convex
+    obstacle is treated as its convex hull, so the free space is never too
+    big."""
+
+    def __init__(
+        self,
+        footprint_xz: Sequence[Tuple[float, float]],
+        obstacles_xz: Sequence[Sequence[Tuple[float, float]]],
+        room_dimensions: dict
+    ):
+        footprint_xz = np.array(footprint_xz, dtype=float)
+        footprint_min_x, footprint_min_z = footprint_xz.min(axis=0)
+        footprint_max_x, footprint_max_z = footprint_xz.max(axis=0)
+        min_x = -room_dimensions['x'] / 2.0 - footprint_min_x
+        max_x = room_dimensions['x'] / 2.0 - footprint_max_x
+        min_z = -room_dimensions['z'] / 2.0 - footprint_min_z
+        max_z = room_dimensions['z'] / 2.0 - footprint_max_z
+        if min_x >= max_x or min_z >= max_z:
+            self.region = geometry.Polygon()
+        else:
+            room = geometry.box(min_x, min_z, max_x, max_z)
+            blocked = []
+            for obstacle_xz in obstacles_xz:
+                obstacle_xz = np.array(obstacle_xz, dtype=float)
+                obstacle_min_x, obstacle_min_z = obstacle_xz.min(axis=0)
+                obstacle_max_x, obstacle_max_z = obstacle_xz.max(axis=0)
+                # Skip the obstacles that are too far away to matter.
+                if (
+                    obstacle_min_x - footprint_max_x >= max_x or
+                    obstacle_max_x - footprint_min_x <= min_x or
+                    obstacle_min_z - footprint_max_z >= max_z or
+                    obstacle_max_z - footprint_min_z <= min_z
+                ):
+                    continue
+                shape = _minkowski_difference(obstacle_xz, footprint_xz)
+                if shape is not None:
+                    blocked.append(shape)
+            self.region = (
+                room.difference(ops.unary_union(blocked)) if blocked else room
+            )
+        self._triangles = None
+        self._cumulative_areas = None
+
+    @property
+    def area(self) -> float:
+        """The area of the free space."""
+        return self.region.area
+
+    def _decompose(self) -> None:
+        if self._triangles is not None:
+            return
+        self._triangles = []
+        self._cumulative_areas = []
+        total = 0
+        for triangle, area in _triangulate(self.region):
+            total += area
+            self._triangles.append(triangle)
+            self._cumulative_areas.append(total)
+
+    def sample(self) -> Optional[Tuple[float, float]]:
+        """Return a random X/Z position drawn uniformly from the free space,
+        or None if there's no free space."""
+        self._decompose()
+        if not self._triangles:
+            return None
+        # Choose a triangle weighted by its area, then a point in it.
+        chosen = random.uniform(0, self._cumulative_areas[-1])
+        index = min(
+            bisect.bisect_left(self._cumulative_areas, chosen),
+            len(self._triangles) - 1
+        )
+        point_a, point_b, point_c = self._triangles[index]
+        weight_b = random.random()
+        weight_c = random.random()
+        if weight_b + weight_c > 1:
+            weight_b = 1 - weight_b
+            weight_c = 1 - weight_c
+        return (
+            point_a[0] + weight_b * (point_b[0] - point_a[0]) +
+            weight_c * (point_c[0] - point_a[0]),
+            point_a[1] + weight_b * (point_b[1] - point_a[1]) +
+            weight_c * (point_c[1] - point_a[1])
+        )
@@ -2,20 +2,34 @@ import copy
 import logging
 import math
 import random
-from dataclasses import dataclass
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union
+)
 
 import numpy as np
 from machine_common_sense.config_manager import Vector3d
 from shapely import affinity, geometry, ops
 
+from .bounds_index import IndexedBoundsList
 from .definitions import (
     DefinitionDataset,
     ImmutableObjectDefinition,
     ObjectDefinition
 )
+from .free_space import FreeSpace
 from .objects import SceneObject
-from .separating_axis_theorem import sat_entry
+from .separating_axis_theorem import (
+    sat_entry,
+    sat_entry_batch,
+    sat_entry_pairwise
+)
 
 MAX_TRIES = 50
 
@@ -71,42 +85,126 @@ ORIGIN_LOCATION = {
 }
 
 
-@dataclass
 class ObjectBounds():
     """The bounds of a specific object, including its 2D bounding box, 2D
-    polygon, and Y range."""
-    box_xz: List[Vector3d]
-    max_y: float
-    min_y: float
-    polygon_xz: geometry.Polygon = None
-
-    def __post_init__(self):
-        self._update_poly()
+    polygon, and Y range. The box points are stored in a compact array, and
+    the Vector3d list (box_xz) and shapely polygon (polygon_xz) are only made
+    on first access, because most callers (like collision checks) just need
+    the points."""
+    __slots__ = ('_points', '_box_xz', '_polygon_xz', 'max_y', 'min_y')
+    __hash__ = None
+
+    def __init__(
+        self,
+        box_xz: List[Vector3d],
+        max_y: float,
+        min_y: float,
+        polygon_xz: geometry.Polygon = None
+    ):
+        # The polygon is always derived from the box, like it was before
+        # the polygon was made lazily.
+        self.box_xz = box_xz
+        self.max_y = max_y
+        self.min_y = min_y
 
     def __eq__(self, other) -> bool:
+        if not isinstance(other, ObjectBounds):
+            return NotImplemented
         return (
-            self.box_xz == other.box_xz and self.max_y == other.max_y and
-            self.min_y == other.min_y
+            np.array_equal(self._points, other._points) and
+            self.max_y == other.max_y and self.min_y == other.min_y
         )
 
-    def _update_poly(self) -> None:
-        for point in self.box_xz:
-            for attr in ['x', 'y', 'z']:
-                setattr(point, attr, round(getattr(point, attr), 6))
-        points = [(point.x, point.z) for point in self.box_xz]
-        self.polygon_xz = geometry.Polygon(points)
+    def __repr__(self) -> str:
+        return (
+            f'{type(self).__name__}(box_xz={self.box_xz}, '
+            f'max_y={self.max_y}, min_y={self.min_y})'
+        )
+
+    def __copy__(self) -> 'ObjectBounds':
+        clone = type(self).__new__(type(self))
+        for slot in ObjectBounds.__slots__:
+            setattr(clone, slot, getattr(self, slot))
+        # Don't share the mutable Vector3d list; it's rebuilt if needed.
+        clone._box_xz = None
+        if hasattr(self, '__dict__'):
+            clone.__dict__.update(self.__dict__)
+        return clone
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> 'ObjectBounds':
+        # The points array is read-only and shapely polygons are immutable,
+        # so a copy can safely share them instead of copying them.
+        clone = self.__copy__()
+        if hasattr(self, '__dict__'):
+            clone.__dict__ = copy.deepcopy(self.__dict__, memo)
+        return clone
+
+    def __getstate__(self) -> Tuple[Any, ...]:
+        return (
+            self._points,
+            self.max_y,
+            self.min_y,
+            getattr(self, '__dict__', None)
+        )
+
+    def __setstate__(self, state: Tuple[Any, ...]) -> None:
+        self._points, self.max_y, self.min_y, data = state
+        self._box_xz = None
+        self._polygon_xz = None
+        if data:
+            self.__dict__.update(data)
+
+    @property
+    def box_xz(self) -> List[Vector3d]:
+        if self._box_xz is None:
+            self._box_xz = [
+                Vector3d(x=x, y=y, z=z) for x, y, z in self._points.tolist()
+            ]
+        return self._box_xz
+
+    @box_xz.setter
+    def box_xz(self, box_xz: List[Vector3d]) -> None:
+        self._set_points([
+            (round(point.x, 6), round(point.y, 6), round(point.z, 6))
+            for point in box_xz
+        ])
+
+    @property
+    def points_xz(self) -> np.ndarray:
+        """The X/Z coordinates of the box's points, as a read-only array with
+        shape (number_of_points, 2)."""
+        return self._points[:, ::2]
+
+    @property
+    def polygon_xz(self) -> geometry.Polygon:
+        if self._polygon_xz is None:
+            self._polygon_xz = geometry.Polygon(self.points_xz)
+        return self._polygon_xz
+
+    @polygon_xz.setter
+    def polygon_xz(self, polygon_xz: geometry.Polygon) -> None:
+        self._polygon_xz = polygon_xz
+
+    def _set_points(
+        self,
+        points: List[Tuple[float, float, float]],
+        polygon_xz: geometry.Polygon = None
+    ) -> None:
+        self._points = np.array(points, dtype=float).reshape(-1, 3)
+        self._points.flags.writeable = False
+        self._box_xz = None
+        self._polygon_xz = polygon_xz
 
     def expand_by(self, amount: float) -> None:
         """Expand this bounds by the given amount on both the X and Z axes."""
-        self.polygon_xz = self.polygon_xz.buffer(
+        polygon_xz = self.polygon_xz.buffer(
             amount,
             # Ensure the output polygon is also a rectangle.
             join_style=geometry.JOIN_STYLE.mitre
         )
-        self.box_xz = [
-            Vector3d(x=point[0], y=0, z=point[1]) for point in
-            self.polygon_xz.exterior.coords
-        ][:-1]
+        self._set_points([
+            (point[0], 0, point[1]) for point in polygon_xz.exterior.coords
+        ][:-1], polygon_xz)
 
     def extend_bottom_to_ground(self) -> None:
         """Extend the bottom of this bounds to the ground."""
@@ -118,10 +216,12 @@ class ObjectBounds():
         """Return whether this bounds in within the given room dimensions."""
         room_max_x = room_dimensions['x'] / 2.0
         room_max_z = room_dimensions['z'] / 2.0
-        return all((
-            -room_max_x <= point.x <= room_max_x and
-            -room_max_z <= point.z <= room_max_z
-        ) for point in self.box_xz)
+        points_x = self._points[:, 0]
+        points_z = self._points[:, 2]
+        return bool(np.all(
+            (-room_max_x <= points_x) & (points_x <= room_max_x) &
+            (-room_max_z <= points_z) & (points_z <= room_max_z)
+        ))
 
 
 def __dict_to_vector(data: Dict[str, float]) -> Vector3d:
@@ -178,6 +278,98 @@ def create_bounds(
     return ObjectBounds(box_xz=[a, b, c, d], max_y=y_max, min_y=y_min)
 
 
+def find_pose_vertices(
+    dimensions: Dict[str, float],
+    offset: Optional[Dict[str, float]],
+    positions_x: Sequence[float],
+    positions_z: Sequence[float],
+    rotations_y: Sequence[float]
+) -> np.ndarray:
+    """Return the X/Z corners, as an array with shape (K, 4, 2), of the object
+    with the given dimensions and offset at each of the K given poses. The
+    corners are computed with the same arithmetic as create_bounds and
+    rounded like ObjectBounds does to its points, so validating them gives the
+    same results as validating each pose's ObjectBounds."""
+    offset = offset or {'x': 0, 'z': 0}
+    x_plus = (dimensions['x'] / 2.0) + offset['x']
+    x_minus = -(dimensions['x'] / 2.0) + offset['x']
+    z_plus = (dimensions['z'] / 2.0) + offset['z']
+    z_minus = -(dimensions['z'] / 2.0) + offset['z']
+    corners_x = np.array([x_plus, x_plus, x_minus, x_minus])
+    corners_z = np.array([z_plus, z_minus, z_minus, z_plus])
+    # Poses usually share only a few rotations, so compute each one once.
+    rotations = {}
+    for rotation_y in rotations_y:
+        if rotation_y not in rotations:
+            radian_amount = math.pi * (2 - (rotation_y % 360) / 180.0)
+            rotations[rotation_y] = (
+                math.sin(radian_amount),
+                math.cos(radian_amount)
+            )
+    sins = np.array([rotations[rotation][0] for rotation in rotations_y])
+    coss = np.array([rotations[rotation][1] for rotation in rotations_y])
+    sins = sins[:, None]
+    coss = coss[:, None]
+    positions_x = np.asarray(positions_x, dtype=float)[:, None]
+    positions_z = np.asarray(positions_z, dtype=float)[:, None]
+    points_x = positions_x + corners_x * coss - corners_z * sins
+    points_z = positions_z + corners_x * sins + corners_z * coss
+    return np.array([[
+        [round(x, 6), round(z, 6)] for x, z in zip(row_x, row_z)
+    ] for row_x, row_z in zip(points_x.tolist(), points_z.tolist())]).reshape(
+        -1, 4, 2
+    )
+
+
+def validate_pose_vertices(
+    vertices: np.ndarray,
+    min_y: Union[float, np.ndarray],
+    max_y: Union[float, np.ndarray],
+    performer_start_position: Dict[str, float],
+    bounds_list: List[ObjectBounds],
+    room_dimensions: Dict[str, float]
+) -> np.ndarray:
+    """Batched version of validate_location_rect for the X/Z corners of K
+    poses, with shape (K, 4, 2) (like from find_pose_vertices), and their Y
+    ranges (either one for all the poses or an array of one for each pose).
+    Returns a boolean array of shape (K,) that is True for each valid pose."""
+    # Reject each pose that's outside the room.
+    room_max_x = room_dimensions['x'] / 2.0
+    room_max_z = room_dimensions['z'] / 2.0
+    valid = np.all(
+        (vertices[:, :, 0] >= -room_max_x) &
+        (vertices[:, :, 0] <= room_max_x) &
+        (vertices[:, :, 1] >= -room_max_z) &
+        (vertices[:, :, 1] <= room_max_z),
+        axis=1
+    )
+    if not valid.any():
+        return valid
+
+    # Reject each pose that collides with the performer or other bounds, if
+    # one isn't completely above/below the other.
+    all_bounds = [find_performer_bounds(performer_start_position)] + list(
+        bounds_list
+    )
+    bounds_min_y = np.array([bounds.min_y for bounds in all_bounds])
+    bounds_max_y = np.array([bounds.max_y for bounds in all_bounds])
+    min_y = np.broadcast_to(np.asarray(min_y, dtype=float), valid.shape)
+    max_y = np.broadcast_to(np.asarray(max_y, dtype=float), valid.shape)
+    overlap_y = ~(
+        (min_y[valid, None] >= bounds_max_y[None, :]) |
+        (max_y[valid, None] <= bounds_min_y[None, :])
+    )
+    # Only test the bounds that overlap the Y range of any pose.
+    columns = np.flatnonzero(overlap_y.any(axis=0))
+    if len(columns):
+        collisions = sat_entry_pairwise(
+            vertices[valid],
+            [all_bounds[column].points_xz for column in columns]
+        )
+        valid[valid] = ~(collisions & overlap_y[:, columns]).any(axis=1)
+    return valid
+
+
 def random_real(a: float, b: float,
                 step: float = MIN_RANDOM_INTERVAL) -> float:
     """Return a random real number N where a <= N <= b and N - a is
@@ -212,10 +404,15 @@ def calc_obj_pos(
     z_func: Callable[[Dict[str, float]], float] = random_position_z,
     rotation_func: Callable[[], float] = None,
     xz_func: Callable[[], Tuple[float, float]] = None,
-    room_dimensions: Dict[str, float] = None
+    room_dimensions: Dict[str, float] = None,
+    batch: bool = True
 ) -> Optional[Dict[str, Any]]:
     """Returns new object with rotation & position if we can place the
-    object in the frame, None otherwise."""
+    object in the frame, None otherwise. If batch is True and the default
+    random X/Z functions are used, all MAX_TRIES random poses are sampled and
+    validated together with array math (see _calc_obj_pos_batch), and if none
+    are valid, the pose is sampled from the free space of the room instead
+    (see _calc_obj_pos_free_space)."""
 
     # TODO MCS-697 Use dot notation for SceneObject
     if isinstance(definition_or_instance, (SceneObject, dict)):
@@ -230,6 +427,23 @@ def calc_obj_pos(
         position_y = definition_or_instance.positionY
         rotation = vars(definition_or_instance.rotation)
 
+    # With the default random X/Z functions, sample every try at once.
+    if (
+        batch and xz_func is None and x_func is random_position_x and
+        z_func is random_position_z
+    ):
+        return _calc_obj_pos_batch(
+            performer_position,
+            bounds_list,
+            dimensions,
+            offset,
+            position_y,
+            rotation,
+            rotation_func or random_rotation,
+            room_dimensions or DEFAULT_ROOM_DIMENSIONS,
+            definition_or_instance
+        )
+
     tries = 0
     while tries < MAX_TRIES:
         rotation_x = rotation['x']
@@ -277,6 +491,181 @@ def calc_obj_pos(
     return None
 
 
+def _calc_obj_pos_batch(
+    performer_position: Dict[str, float],
+    bounds_list: List[ObjectBounds],
+    dimensions: Dict[str, float],
+    offset: Dict[str, float],
+    position_y: float,
+    rotation: Dict[str, float],
+    rotation_func: Callable[[], float],
+    room_dimensions: Dict[str, float],
+    definition_or_instance: Union[ObjectDefinition, SceneObject]
+) -> Optional[Dict[str, Any]]:
+    """Batched version of calc_obj_pos for random positions. Draws all
+    MAX_TRIES random poses up front, computes every pose's corners with array
+    math, rejects the invalid poses together, and chooses uniformly among the
+    valid ones. Drawing poses until the first valid one would produce the
+    same distribution with the same chance of failure, but this way only the
+    chosen pose needs an ObjectBounds (and its shapely Polygon)."""
+    poses = []
+    for _ in range(MAX_TRIES):
+        rotation_y = rotation['y'] + rotation_func()
+        poses.append((
+            random_position_x(room_dimensions),
+            random_position_z(room_dimensions),
+            rotation_y
+        ))
+
+    vertices = find_pose_vertices(
+        dimensions,
+        offset,
+        [pose[0] for pose in poses],
+        [pose[1] for pose in poses],
+        [pose[2] for pose in poses]
+    )
+    # Every pose has the same Y range (its bottom is always at the standing
+    # Y in create_bounds).
+    valid = validate_pose_vertices(
+        vertices,
+        0,
+        dimensions['y'],
+        performer_position,
+        bounds_list,
+        room_dimensions
+    )
+
+    valid_indexes = np.flatnonzero(valid).tolist()
+    if not valid_indexes:
+        # The room is probably crowded, so sample from its free space.
+        return _calc_obj_pos_free_space(
+            performer_position,
+            bounds_list,
+            dimensions,
+            offset,
+            position_y,
+            rotation,
+            rotation_func,
+            room_dimensions,
+            definition_or_instance
+        )
+
+    new_x, new_z, rotation_y = poses[random.choice(valid_indexes)]
+    rotation_x = rotation['x']
+    rotation_z = rotation['z']
+    bounds = create_bounds(
+        dimensions=dimensions,
+        offset=offset,
+        position={'x': new_x, 'y': position_y, 'z': new_z},
+        rotation={'x': rotation_x, 'y': rotation_y, 'z': rotation_z},
+        standing_y=position_y
+    )
+    object_location = {
+        'rotation': {'x': rotation_x, 'y': rotation_y, 'z': rotation_z},
+        'position': {
+            'x': new_x,
+            'y': position_y,
+            'z': new_z
+        },
+        'boundingBox': bounds
+    }
+    bounds_list.append(bounds)
+    return object_location
+
+
+def _calc_obj_pos_free_space(
+    performer_position: Dict[str, float],
+    bounds_list: List[ObjectBounds],
+    dimensions: Dict[str, float],
+    offset: Dict[str, float],
+    position_y: float,
+    rotation: Dict[str, float],
+    rotation_func: Callable[[], float],
+    room_dimensions: Dict[str, float],
+    definition_or_instance: Union[ObjectDefinition, SceneObject]
+) -> Optional[Dict[str, Any]]:
+    """Version of calc_obj_pos for random positions in crowded rooms, used
+    when none of the random poses in _calc_obj_pos_batch are valid. Finds the
+    free space of the room for the object at each possible rotation (see
+    FreeSpace), chooses a rotation weighted by the area of its free space,
+    and samples the position from that free space, so the pose has the same
+    distribution as the random poses, but it fails only if the object won't
+    fit anywhere. Each sampled position is still validated (rounding it may
+    move it slightly into another object)."""
+    rotation_x = rotation['x']
+    rotation_z = rotation['z']
+    rotation_list = (
+        VALID_ROTATIONS if rotation_func is random_rotation
+        else [rotation_func()]
+    )
+    obstacles = [find_performer_bounds(performer_position)] + list(
+        bounds_list
+    )
+    choices = []
+    # Different rotations often have the same footprint (like a symmetric
+    # object turned 180 degrees), so only find each free space once.
+    free_spaces = {}
+    for rotation_amount in rotation_list:
+        rotation_y = rotation['y'] + rotation_amount
+        # The object's footprint relative to its position.
+        footprint = create_bounds(
+            dimensions=dimensions,
+            offset=offset,
+            position={'x': 0, 'y': position_y, 'z': 0},
+            rotation={'x': rotation_x, 'y': rotation_y, 'z': rotation_z},
+            standing_y=position_y
+        )
+        key = tuple(sorted(map(tuple, footprint.points_xz.tolist())))
+        if key not in free_spaces:
+            free_spaces[key] = FreeSpace(footprint.points_xz.tolist(), [
+                bounds.points_xz.tolist() for bounds in obstacles
+                if not (
+                    footprint.min_y >= bounds.max_y or
+                    footprint.max_y <= bounds.min_y
+                )
+            ], room_dimensions)
+        free_space = free_spaces[key]
+        if free_space.area > 0:
+            choices.append((free_space, rotation_y))
+
+    for _ in range(MAX_TRIES if choices else 0):
+        free_space, rotation_y = random.choices(
+            choices,
+            weights=[free_space.area for free_space, _ in choices]
+        )[0]
+        point = free_space.sample()
+        if not point:
+            continue
+        new_x = round(point[0], POSITION_DIGITS)
+        new_z = round(point[1], POSITION_DIGITS)
+        bounds = create_bounds(
+            dimensions=dimensions,
+            offset=offset,
+            position={'x': new_x, 'y': position_y, 'z': new_z},
+            rotation={'x': rotation_x, 'y': rotation_y, 'z': rotation_z},
+            standing_y=position_y
+        )
+        if validate_location_rect(
+            bounds,
+            performer_position,
+            bounds_list,
+            room_dimensions
+        ):
+            bounds_list.append(bounds)
+            return {
+                'rotation': {
+                    'x': rotation_x,
+                    'y': rotation_y,
+                    'z': rotation_z
+                },
+                'position': {'x': new_x, 'y': position_y, 'z': new_z},
+                'boundingBox': bounds
+            }
+
+    logging.debug(f'could not place object: {definition_or_instance}')
+    return None
+
+
 def position_distance(a: Dict[str, float], b: Dict[str, float]) -> float:
     """Compute the distance between two positions."""
     return math.sqrt((a['x'] - b['x'])**2 + (a['y'] -
@@ -1239,17 +1628,23 @@ def validate_location_rect(
     if not location_bounds.is_within_room(room_dimensions):
         return False
     performer_agent_bounds = find_performer_bounds(performer_start_position)
-    for bounds in [performer_agent_bounds] + bounds_list:
-        # If one bounds is completely above/below another: no collision.
-        if (
+    # If the bounds list is indexed, only test the bounds near the location.
+    if isinstance(bounds_list, IndexedBoundsList):
+        bounds_list = bounds_list.find_nearby(location_bounds.points_xz)
+    # If one bounds is completely above/below another: no collision.
+    nearby_bounds = [
+        bounds for bounds in [performer_agent_bounds] + bounds_list
+        if not (
             location_bounds.min_y >= bounds.max_y or
             location_bounds.max_y <= bounds.min_y
-        ):
-            continue
-        # If one bounds intersects with another: collision! Invalid.
-        if sat_entry(location_bounds.box_xz, bounds.box_xz):
-            return False
-    return True
+        )
+    ]
+    # If one bounds intersects with another: collision! Invalid. Test all the
+    # remaining bounds together in a single vectorized pass.
+    return not sat_entry_batch(
+        location_bounds.points_xz,
+        [bounds.points_xz for bounds in nearby_bounds]
+    ).any()
 
 
 def move_to_location(
@@ -0,0 +1,293 @@
+import heapq
+import math
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+from shapely.geometry import Polygon
+
+# Tolerance used so floating point error never makes the conservative grid
+# less conservative or the optimistic grid less optimistic.
+EPSILON = 1e-9
+
+# The eight neighbors of a grid cell, with the orthogonal neighbors first.
+NEIGHBOR_OFFSETS = [
+    (1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (1, -1), (-1, 1), (-1, -1)
+]
+
+Coords = Sequence[Tuple[float, float]]
+
+
+def _signed_area(points: np.ndarray) -> float:
+    """Return the signed area of the given polygon points (positive if they
+    are counter-clockwise)."""
+    rolled = np.roll(points, -1, axis=0)
+    return 0.5 * float(np.sum(
+        points[:, 0] * rolled[:, 1] - rolled[:, 0] * points[:, 1]
+    ))
+
+
+def _points_in_convex_polygon(
+    points: np.ndarray,
+    xs: np.ndarray,
+    zs: np.ndarray,
+    strict: bool
+) -> np.ndarray:
+    """Return whether each of the given X/Z coordinates is inside the given
+    convex polygon points. If strict, points on (or very near) an edge are
+    outside; otherwise they're inside."""
+    if _signed_area(points) < 0:
+        points = points[::-1]
+    inside = np.ones(xs.shape, dtype=bool)
+    for start, end in zip(points, np.roll(points, -1, axis=0)):
+        cross = (
+            (end[0] - start[0]) * (zs - start[1]) -
+            (end[1] - start[1]) * (xs - start[0])
+        )
+        inside &= (cross > EPSILON) if strict else (cross >= -EPSILON)
+    return inside
+
+
+def _convex_hull_points(coords: Coords) -> Tuple[np.ndarray, bool]:
+    """Return the points of the convex hull of the given polygon coordinates,
+    and whether the polygon itself is convex (so equal to its hull)."""
+    polygon = Polygon(coords)
+    hull = polygon.convex_hull
+    if not hasattr(hull, 'exterior'):
+        # Degenerate polygons (points or lines) cover no cells.
+        return np.array(hull.coords, dtype=float), False
+    is_convex = polygon.is_valid and math.isclose(
+        polygon.area,
+        hull.area,
+        rel_tol=EPSILON,
+        abs_tol=EPSILON
+    )
+    return np.array(hull.exterior.coords[:-1], dtype=float), is_convex
+
+
+class OccupancyGrid():
+    """Two occupancy grids over the X/Z area of a pathfinding boundary:
+    a conservative grid, in which each cell touching a hole or crossing the
+    boundary is blocked, and an optimistic grid, in which only each cell
+    entirely inside a single hole is blocked. A path through the conservative
+    grid proves that a real path exists, while no path through the optimistic
+    grid proves that no real path exists."""
+
+    def __init__(
+        self,
+        boundary: Coords,
+        holes: List[Coords],
+        cell_size: float
+    ):
+        boundary_points = np.array(boundary, dtype=float)
+        self.cell_size = cell_size
+        self.min_x, self.min_z = boundary_points.min(axis=0)
+        max_x, max_z = boundary_points.max(axis=0)
+        self.size_x = max(1, math.ceil((max_x - self.min_x) / cell_size))
+        self.size_z = max(1, math.ceil((max_z - self.min_z) / cell_size))
+
+        # The X/Z coordinates of the corners of each cell.
+        self._corner_xs, self._corner_zs = np.meshgrid(
+            self.min_x + np.arange(self.size_x + 1) * cell_size,
+            self.min_z + np.arange(self.size_z + 1) * cell_size,
+            indexing='ij'
+        )
+
+        inside = _points_in_convex_polygon(
+            boundary_points,
+            self._corner_xs,
+            self._corner_zs,
+            strict=False
+        )
+        self.conservative = ~self._all_corners(inside)
+        self.optimistic = np.zeros((self.size_x, self.size_z), dtype=bool)
+        for hole in holes:
+            self._block_hole(hole)
+
+    def _all_corners(self, corners: np.ndarray) -> np.ndarray:
+        """Return whether all four corners of each cell are true."""
+        return (
+            corners[:-1, :-1] & corners[1:, :-1] &
+            corners[:-1, 1:] & corners[1:, 1:]
+        )
+
+    def _block_hole(self, hole: Coords) -> None:
+        points, is_convex = _convex_hull_points(hole)
+        if not len(points):
+            return
+        hole_min_x, hole_min_z = points.min(axis=0)
+        hole_max_x, hole_max_z = points.max(axis=0)
+
+        # Only look at the cells around the hole's axis-aligned extent.
+        start_x, end_x = self._cell_range(hole_min_x, hole_max_x, self.size_x,
+                                          self.min_x)
+        start_z, end_z = self._cell_range(hole_min_z, hole_max_z, self.size_z,
+                                          self.min_z)
+        if start_x >= end_x or start_z >= end_z:
+            return
+        corner_xs = self._corner_xs[start_x:end_x + 1, start_z:end_z + 1]
+        corner_zs = self._corner_zs[start_x:end_x + 1, start_z:end_z + 1]
+        center_xs = (corner_xs[:-1, :-1] + corner_xs[1:, 1:]) / 2.0
+        center_zs = (corner_zs[:-1, :-1] + corner_zs[1:, 1:]) / 2.0
+        half = self.cell_size / 2.0
+
+        # Use the separating axis theorem to find each cell touching the
+        # hole's convex hull (a superset of the hole itself).
+        touching = (
+            (center_xs + half >= hole_min_x - EPSILON) &
+            (center_xs - half <= hole_max_x + EPSILON) &
+            (center_zs + half >= hole_min_z - EPSILON) &
+            (center_zs - half <= hole_max_z + EPSILON)
+        )
+        for start, end in zip(points, np.roll(points, -1, axis=0)):
+            normal_x, normal_z = start[1] - end[1], end[0] - start[0]
+            projected = points[:, 0] * normal_x + points[:, 1] * normal_z
+            center = center_xs * normal_x + center_zs * normal_z
+            extent = half * (abs(normal_x) + abs(normal_z))
+            touching &= ~(
+                (center + extent < projected.min() - EPSILON) |
+                (center - extent > projected.max() + EPSILON)
+            )
+        self.conservative[start_x:end_x, start_z:end_z] |= touching
+
+        # Only convex holes can prove that a cell is entirely inside them.
+        if is_convex:
+            self.optimistic[start_x:end_x, start_z:end_z] |= (
+                self._all_corners(_points_in_convex_polygon(
+                    points,
+                    corner_xs,
+                    corner_zs,
+                    strict=True
+                ))
+            )
+
+    def _cell_range(
+        self,
+        low: float,
+        high: float,
+        size: int,
+        origin: float
+    ) -> Tuple[int, int]:
+        """Return the start (inclusive) and end (exclusive) indexes of the
+        cells around the given range, with a one cell margin."""
+        start = math.floor((low - origin) / self.cell_size) - 1
+        end = math.floor((high - origin) / self.cell_size) + 2
+        return max(0, start), min(size, end)
+
+    def find_cell(self, position: Tuple[float, float]) -> Optional[
+        Tuple[int, int]
+    ]:
+        """Return the cell containing the given X/Z position, or None if it's
+        outside the grid."""
+        cell_x = math.floor((position[0] - self.min_x) / self.cell_size)
+        cell_z = math.floor((position[1] - self.min_z) / self.cell_size)
+        if 0 <= cell_x < self.size_x and 0 <= cell_z < self.size_z:
+            return cell_x, cell_z
+        return None
+
+    def find_cell_center(self, cell: Tuple[int, int]) -> Tuple[float, float]:
+        """Return the X/Z position of the center of the given cell."""
+        return (
+            float(self.min_x + (cell[0] + 0.5) * self.cell_size),
+            float(self.min_z + (cell[1] + 0.5) * self.cell_size)
+        )
+
+
+def _find_cell_path(
+    blocked: np.ndarray,
+    start: Tuple[int, int],
+    goal: Tuple[int, int],
+    cut_corners: bool
+) -> Optional[List[Tuple[int, int]]]:
+    """Return the list of cells in the shortest 8-connected path from the
+    given start cell to the given goal cell using A*, or None if no path
+    exists. If not cut_corners, a diagonal step is only allowed if both of its
+    orthogonal neighbors are open."""
+    if blocked[start] or blocked[goal]:
+        return None
+    size_x, size_z = blocked.shape
+    costs = np.full(blocked.shape, np.inf)
+    parents = np.full(blocked.shape + (2,), -1, dtype=int)
+    closed = np.zeros(blocked.shape, dtype=bool)
+    costs[start] = 0
+
+    def heuristic(cell: Tuple[int, int]) -> float:
+        # Octile distance to the goal.
+        dx = abs(cell[0] - goal[0])
+        dz = abs(cell[1] - goal[1])
+        return max(dx, dz) + (math.sqrt(2) - 1) * min(dx, dz)
+
+    queue = [(heuristic(start), 0.0, start)]
+    while queue:
+        _, cost, cell = heapq.heappop(queue)
+        if closed[cell]:
+            continue
+        if cell == goal:
+            path = [cell]
+            while path[-1] != start:
+                path.append(tuple(int(i) for i in parents[path[-1]]))
+            return path[::-1]
+        closed[cell] = True
+        for dx, dz in NEIGHBOR_OFFSETS:
+            neighbor = (cell[0] + dx, cell[1] + dz)
+            if not (0 <= neighbor[0] < size_x and 0 <= neighbor[1] < size_z):
+                continue
+            if blocked[neighbor] or closed[neighbor]:
+                continue
+            if dx and dz and not cut_corners and (
+                blocked[cell[0] + dx, cell[1]] or
+                blocked[cell[0], cell[1] + dz]
+            ):
+                continue
+            neighbor_cost = cost + (math.sqrt(2) if dx and dz else 1.0)
+            if neighbor_cost < costs[neighbor]:
+                costs[neighbor] = neighbor_cost
+                parents[neighbor] = cell
+                heapq.heappush(queue, (
+                    neighbor_cost + heuristic(neighbor),
+                    neighbor_cost,
+                    neighbor
+                ))
+    return None
+
+
+def find_grid_path(
+    boundary: Coords,
+    holes: List[Coords],
+    start: Tuple[float, float],
+    end: Tuple[float, float],
+    cell_size: float
+) -> Tuple[Optional[bool], List[Tuple[float, float]]]:
+    """Check whether a path exists from the given start to the given end
+    position within the given convex boundary and around the given holes,
+    using occupancy grids with the given cell size, in meters. Return True
+    and the path's positions if the grid proves a path exists; False and an
+    empty list if the grid proves no path exists; or None and an empty list
+    if the result is borderline, and an exact check is needed."""
+    grid = OccupancyGrid(boundary, holes, cell_size)
+    start_cell = grid.find_cell(start)
+    end_cell = grid.find_cell(end)
+    if start_cell is None or end_cell is None:
+        return None, []
+
+    cell_path = _find_cell_path(
+        grid.conservative,
+        start_cell,
+        end_cell,
+        cut_corners=False
+    )
+    if cell_path:
+        return True, (
+            [tuple(start)] +
+            [grid.find_cell_center(cell) for cell in cell_path] +
+            [tuple(end)]
+        )
+
+    cell_path = _find_cell_path(
+        grid.optimistic,
+        start_cell,
+        end_cell,
+        cut_corners=True
+    )
+    if not cell_path:
+        return False, []
+    return None, []
@@ -1,6 +1,8 @@
 import math
 import random
-from typing import Tuple
+from typing import Optional, Tuple
+
+import numpy as np
 
 from .geometry import occluder_x_to_object_x
 
@@ -25,6 +27,11 @@ NON_COLLISION_ANGLED_SPEEDS = list(range(600, 850, 25))
 COLLISION_SPEEDS = list(range(800, 910, 10))
 TOSS_SPEEDS = [300, 350, 400, 450]
 
+# Tolerance used when searching for candidate positions with NumPy, so that
+# the (unrounded) vectorized calculations never skip a candidate that would
+# pass the exact (rounded) check.
+_CANDIDATE_TOLERANCE = 0.05
+
 
 def choose_position_z(
     min_z: float = MIN_TARGET_Z,
@@ -72,30 +79,64 @@ def _find_off_screen_position_diagonal(
         min_x = 2 * abs(start_x)
         max_x = retrieve_off_screen_position_x(MAX_Z) + abs(start_x)
 
-    # Loop over each possible X distance in increments of 0.01
-    for distance_x in [
-        round(i / 100, 2) for i in
-        range(int(min_x * 100), int(max_x * 100))
-    ]:
-        # Calculate the X position.
-        possible_x = round(distance_x - abs(start_x), 4)
-        # Calculate the Z distance corresponding to the current X distance.
-        distance_z = (-1 if toward else 1) * round(
-            distance_x * math.sin(math.radians(angle)) /
-            math.sin(math.radians(90 - angle)),
-            4
+    direction_z = -1 if toward else 1
+    sin_angle = math.sin(math.radians(angle))
+    sin_other_angle = math.sin(math.radians(90 - angle))
+
+    # Check each possible X distance in increments of 0.01, but only those
+    # that could possibly be far enough (the margin is linear in the distance,
+    # so this is computed for all the distances at once), in order.
+    min_i = int(min_x * 100)
+    distances_x = np.arange(min_i, int(max_x * 100)) / 100
+    margins = (distances_x - abs(start_x)) - (
+        MIN_OFFSCREEN_X + STEP_OFFSCREEN_X * (
+            start_z + direction_z * distances_x * sin_angle /
+            sin_other_angle - MIN_Z
+        )
+    )
+    for i in np.flatnonzero(margins >= -_CANDIDATE_TOLERANCE):
+        distance_x = round((min_i + int(i)) / 100, 2)
+        position = _off_screen_position_diagonal(
+            distance_x,
+            start_x,
+            start_z,
+            sin_angle,
+            sin_other_angle,
+            direction_z
         )
-        # Calculate the Z position.
-        possible_z = round(start_z + distance_z, 2)
-        # Identify the offscreen X position at the new Z position.
-        required_x = retrieve_off_screen_position_x(possible_z)
-        # See if the current X position meets the minimum necessary X position.
-        if required_x <= possible_x:
-            return possible_x * (-1 if start_x > 0 else 1), possible_z
+        if position:
+            return position
 
     return None, None
 
 
+def _off_screen_position_diagonal(
+    distance_x: float,
+    start_x: float,
+    start_z: float,
+    sin_angle: float,
+    sin_other_angle: float,
+    direction_z: int
+) -> Optional[Tuple[float, float]]:
+    """Return the offscreen X/Z position after the given X distance, or None
+    if the object isn't offscreen yet."""
+    # Calculate the X position.
+    possible_x = round(distance_x - abs(start_x), 4)
+    # Calculate the Z distance corresponding to the current X distance.
+    distance_z = direction_z * round(
+        distance_x * sin_angle / sin_other_angle,
+        4
+    )
+    # Calculate the Z position.
+    possible_z = round(start_z + distance_z, 2)
+    # Identify the offscreen X position at the new Z position.
+    required_x = retrieve_off_screen_position_x(possible_z)
+    # See if the current X position meets the minimum necessary X position.
+    if required_x <= possible_x:
+        return possible_x * (-1 if start_x > 0 else 1), possible_z
+    return None
+
+
 def find_off_screen_position_diagonal_away(
     start_x: float,
     start_z: float,
@@ -148,31 +189,80 @@ def _find_position_behind_occluder_diagonal(
         # the object's Z position is adjacent to the back room wall.
         max_z = int(MAX_Z - start_z)
 
-    # Loop over each possible Z distance in increments of 0.01
-    for distance_z in [round(i / 100, 2) for i in range(0, max_z * 100)]:
-        # Calculate the X position corresponding to the current Z distance.
-        possible_x = round(start_x + (1 if start_x < 0 else -1) * (
-            distance_z * math.sin(math.radians(90 - angle)) /
-            math.sin(math.radians(angle))
-        ), 4)
-        # Calculate the Z position.
-        possible_z = round(start_z + (distance_z * (-1 if toward else 1)), 2)
-        # Identify the required X position at the current Z position for the
-        # object to be successfully hidden behind the occluder.
-        required_x = occluder_x_to_object_x(
+    direction_x = 1 if start_x < 0 else -1
+    direction_z = -1 if toward else 1
+    sin_angle = math.sin(math.radians(angle))
+    sin_other_angle = math.sin(math.radians(90 - angle))
+
+    # Check each possible Z distance in increments of 0.01, but only those
+    # at which the X position could possibly be close enough to the required
+    # X position (computed for all the distances at once), in order.
+    distances_z = np.arange(0, max_z * 100) / 100
+    if not len(distances_z):
+        return None, None
+    possible_x = start_x + direction_x * (
+        distances_z * sin_other_angle / sin_angle
+    )
+    required_x = occluder_x * (
+        (start_z + distances_z * direction_z - MIN_Z) / (occluder_z - MIN_Z)
+    )
+    # Loosened version of math.isclose(rel_tol=0.1, abs_tol=0.1)
+    candidates = np.abs(required_x - possible_x) <= np.maximum(
+        0.1 * np.maximum(np.abs(required_x), np.abs(possible_x)),
+        0.1
+    ) + _CANDIDATE_TOLERANCE
+    for i in np.flatnonzero(candidates):
+        position = _position_behind_occluder_diagonal(
+            round(int(i) / 100, 2),
             occluder_x,
             occluder_z,
-            possible_z,
-            0,
-            -4.5
+            start_x,
+            start_z,
+            sin_angle,
+            sin_other_angle,
+            direction_x,
+            direction_z
         )
-        # See if the current X position is approx. the necessary X position.
-        if math.isclose(required_x, possible_x, rel_tol=0.1, abs_tol=0.1):
-            return possible_x, round(possible_z, 2)
+        if position:
+            return position
 
     return None, None
 
 
+def _position_behind_occluder_diagonal(
+    distance_z: float,
+    occluder_x: float,
+    occluder_z: float,
+    start_x: float,
+    start_z: float,
+    sin_angle: float,
+    sin_other_angle: float,
+    direction_x: int,
+    direction_z: int
+) -> Optional[Tuple[float, float]]:
+    """Return the X/Z position after the given Z distance, or None if the
+    object isn't hidden behind the occluder there."""
+    # Calculate the X position corresponding to the current Z distance.
+    possible_x = round(start_x + direction_x * (
+        distance_z * sin_other_angle / sin_angle
+    ), 4)
+    # Calculate the Z position.
+    possible_z = round(start_z + (distance_z * direction_z), 2)
+    # Identify the required X position at the current Z position for the
+    # object to be successfully hidden behind the occluder.
+    required_x = occluder_x_to_object_x(
+        occluder_x,
+        occluder_z,
+        possible_z,
+        0,
+        -4.5
+    )
+    # See if the current X position is approx. the necessary X position.
+    if math.isclose(required_x, possible_x, rel_tol=0.1, abs_tol=0.1):
+        return possible_x, round(possible_z, 2)
+    return None
+
+
 def find_position_behind_occluder_diagonal_away(
     occluder_x: float,
     occluder_z: float,
@@ -2,7 +2,6 @@ import logging
 import math
 from typing import Any, Dict, List, Optional, Tuple
 
-from extremitypathfinder import plotting
 from extremitypathfinder.extremitypathfinder import (
     PolygonEnvironment as Environment
 )
@@ -18,8 +17,7 @@ from .geometry import (
     PERFORMER_HALF_WIDTH
 )
 from .objects import SceneObject
-
-plotting.EXPORT_SIZE_X = plotting.EXPORT_SIZE_Y
+from .pathfinding_cache import find_prepared_environment
 
 
 VARIANCE = 0.01
@@ -199,10 +197,6 @@ def _generate_pathfinding_environment(
     )
     logging.debug(f'poly coords list {poly_coords_list}')
 
-    pathfinding_environment = (
-        plotting.PlottingEnvironment(plotting_dir=save_path_plot_with_name)
-        if save_path_plot_with_name else Environment()
-    )
     room_max_x = (room_dimensions['x'] / 2.0) - PERFORMER_HALF_WIDTH
     room_max_z = (room_dimensions['z'] / 2.0) - PERFORMER_HALF_WIDTH
     room_bounds = [
@@ -213,6 +207,17 @@ def _generate_pathfinding_environment(
     ]
     logging.debug(f'room bounds {room_bounds}')
     try:
+        # Only cache environments without plotting, since plotting saves
+        # images to the local drive on each call.
+        if not save_path_plot_with_name:
+            return find_prepared_environment(room_bounds, poly_coords_list)
+        # Only import the plotting module (which imports matplotlib, which is
+        # slow to import) if needed.
+        from extremitypathfinder import plotting
+        plotting.EXPORT_SIZE_X = plotting.EXPORT_SIZE_Y
+        pathfinding_environment = plotting.PlottingEnvironment(
+            plotting_dir=save_path_plot_with_name
+        )
         pathfinding_environment.store(
             room_bounds,
             poly_coords_list,
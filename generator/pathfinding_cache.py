@@ -0,0 +1,52 @@
+from collections import OrderedDict
+from typing import Iterable, List, Sequence, Tuple
+
+from extremitypathfinder.extremitypathfinder import PolygonEnvironment
+
+# The most prepared pathfinding environments to keep in memory at once.
+PATHFINDING_CACHE_SIZE = 32
+
+_environment_cache: 'OrderedDict[Tuple, PolygonEnvironment]' = OrderedDict()
+
+Coords = Sequence[Tuple[float, float]]
+
+
+def _coords_key(coords: Coords) -> Tuple[Tuple[float, float], ...]:
+    """Return a hashable copy of the given coordinates."""
+    return tuple((float(x), float(z)) for x, z in coords)
+
+
+def _environment_key(boundary: Coords, holes: Iterable[Coords]) -> Tuple:
+    """Return a canonical key for an environment with the given boundary and
+    holes. The order of the holes is kept because it may affect which of two
+    equally short paths is found."""
+    return (_coords_key(boundary), tuple(_coords_key(hole) for hole in holes))
+
+
+def clear_pathfinding_cache() -> None:
+    """Remove all the prepared pathfinding environments from the cache."""
+    _environment_cache.clear()
+
+
+def find_prepared_environment(
+    boundary: Coords,
+    holes: List[Coords]
+) -> PolygonEnvironment:
+    """Return a prepared extremitypathfinder environment with the given
+    boundary and holes, reusing one from a previous call if possible, since
+    preparing an environment is by far the slowest part of pathfinding. Any
+    exception from storing or preparing the environment is raised and the
+    environment is not cached. The returned environment must not be modified
+    by the caller, only used to find paths."""
+    key = _environment_key(boundary, holes)
+    environment = _environment_cache.get(key)
+    if environment is not None:
+        _environment_cache.move_to_end(key)
+        return environment
+    environment = PolygonEnvironment()
+    environment.store(boundary, holes, validate=True)
+    environment.prepare()
+    _environment_cache[key] = environment
+    while len(_environment_cache) > PATHFINDING_CACHE_SIZE:
+        _environment_cache.popitem(last=False)
+    return environment
@@ -1,5 +1,7 @@
-from dataclasses import asdict, dataclass, field
-from typing import List, Optional
+import itertools
+from collections.abc import Mapping
+from dataclasses import asdict, dataclass, field, fields
+from typing import Any, Iterable, List, Optional, Tuple
 
 from machine_common_sense.config_manager import (
     FloorTexturesConfig,
@@ -12,6 +14,7 @@ from machine_common_sense.config_manager import (
 )
 
 from . import ObjectBounds, SceneObject, geometry
+from .bounds_index import IndexedBoundsList
 
 # TODO MCS-1234
 # Wanted to use Pydantic, but need MCS to use it and release it first.
@@ -33,6 +36,174 @@ scene_aliases = {
 }
 
 
+# The ground bounds used when ignoring the ground, shared by every call so
+# the bounds index cache can tell that they haven't changed. Never modify it.
+_NO_GROUND_BOUNDS: List[ObjectBounds] = []
+
+
+# The object properties indexed by a SceneObjectList, and how to get each one.
+_INDEXED_PROPERTIES = {
+    'id': lambda instance: instance.get('id'),
+    'type': lambda instance: instance.get('type'),
+    'role': lambda instance: (instance.get('debug') or {}).get('role')
+}
+
+
+def _find_indexed_values(instance: SceneObject) -> List[Tuple[str, Any]]:
+    # Objects without a hashable value for a property aren't indexed by it.
+    if not isinstance(instance, Mapping):
+        return []
+    values = [
+        (key, get_value(instance))
+        for key, get_value in _INDEXED_PROPERTIES.items()
+    ]
+    return [(key, value) for key, value in values if _is_hashable(value)]
+
+
+def _is_hashable(value: Any) -> bool:
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
+
+
+class SceneObjectList(list):
+    """The list of a scene's objects. Keeps indexes of its objects by ID,
+    type, and debug role, updated as objects are added to and removed from
+    the list, so finding objects doesn't need to search the whole list.
+
+    Lookups only return objects that still match. If an object's ID is
+    changed after it's added, find_by_id still finds it (by searching the
+    list); if its type or role is changed after it's added, call reindex to
+    find it by its new type or role."""
+
+    def __init__(self, objects: Iterable[SceneObject] = ()):
+        super().__init__(objects)
+        self.reindex()
+
+    def __reduce__(self):
+        # Copy (or pickle) just the objects, and remake the indexes.
+        return (type(self), (list(self),))
+
+    def reindex(self) -> None:
+        """Remake the indexes of all the objects in this list."""
+        self._indexes = {key: {} for key in _INDEXED_PROPERTIES}
+        for instance in self:
+            self._add_to_indexes(instance)
+
+    def find_by_id(self, object_id: str) -> Optional[SceneObject]:
+        """Return the first object with the given ID, or None."""
+        for instance in self._indexes['id'].get(object_id, []):
+            if instance.get('id') == object_id:
+                return instance
+        # The ID may have been changed after the object was added.
+        for instance in self:
+            if isinstance(instance, Mapping) and (
+                instance.get('id') == object_id
+            ):
+                self.reindex()
+                return instance
+        return None
+
+    def find_by_type(self, object_type: str) -> List[SceneObject]:
+        """Return the objects with the given type, in order."""
+        return self._find('type', object_type)
+
+    def find_by_role(self, role: str) -> List[SceneObject]:
+        """Return the objects with the given debug role, in order."""
+        return self._find('role', role)
+
+    def _find(self, key: str, value: Any) -> List[SceneObject]:
+        get_value = _INDEXED_PROPERTIES[key]
+        return [
+            instance for instance in self._indexes[key].get(value, [])
+            if get_value(instance) == value
+        ]
+
+    def _add_to_indexes(self, instance: SceneObject) -> None:
+        for key, value in _find_indexed_values(instance):
+            self._indexes[key].setdefault(value, []).append(instance)
+
+    def _remove_from_indexes(self, instance: SceneObject) -> None:
+        for key, value in _find_indexed_values(instance):
+            index = self._indexes[key]
+            # The value may have been changed after the object was added.
+            for indexed_value in itertools.chain([value], list(index)):
+                instances = index.get(indexed_value, [])
+                position = next((
+                    position for position, other in enumerate(instances)
+                    if other is instance
+                ), None)
+                if position is not None:
+                    del instances[position]
+                    if not instances:
+                        del index[indexed_value]
+                    break
+
+    # Override each list method that adds or removes objects.
+
+    def append(self, instance: SceneObject) -> None:
+        super().append(instance)
+        self._add_to_indexes(instance)
+
+    def extend(self, objects: Iterable[SceneObject]) -> None:
+        objects = list(objects)
+        super().extend(objects)
+        for instance in objects:
+            self._add_to_indexes(instance)
+
+    def __iadd__(self, objects: Iterable[SceneObject]) -> 'SceneObjectList':
+        self.extend(objects)
+        return self
+
+    def insert(self, position: int, instance: SceneObject) -> None:
+        super().insert(position, instance)
+        # Keep each index in the same order as the list.
+        self.reindex()
+
+    def pop(self, position: int = -1) -> SceneObject:
+        instance = super().pop(position)
+        self._remove_from_indexes(instance)
+        return instance
+
+    def remove(self, instance: SceneObject) -> None:
+        del self[self.index(instance)]
+
+    def clear(self) -> None:
+        super().clear()
+        self.reindex()
+
+    def __setitem__(self, position, value) -> None:
+        super().__setitem__(position, value)
+        self.reindex()
+
+    def __delitem__(self, position) -> None:
+        if isinstance(position, slice):
+            super().__delitem__(position)
+            self.reindex()
+            return
+        instance = self[position]
+        super().__delitem__(position)
+        self._remove_from_indexes(instance)
+
+    def __imul__(self, count: int) -> 'SceneObjectList':
+        super().__imul__(count)
+        self.reindex()
+        return self
+
+    def sort(self, *args, **kwargs) -> None:
+        super().sort(*args, **kwargs)
+        self.reindex()
+
+    def reverse(self) -> None:
+        super().reverse()
+        self.reindex()
+
+    def copy(self) -> 'SceneObjectList':
+        return SceneObjectList(self)
+
+
 @dataclass
 class PartitionFloor:
     leftHalf: Optional[float] = 0
@@ -79,6 +250,19 @@ class Scene:
                 rotation=Vector3d())
         if self.room_dimensions is None:
             self.room_dimensions = Vector3d(**geometry.DEFAULT_ROOM_DIMENSIONS)
+        # Cached bounds used by find_bounds (not dataclass fields, so they
+        # are never serialized or compared).
+        self._ground_bounds_cache = None
+        self._bounds_index_cache = {}
+
+    def __setattr__(self, name: str, value: Any):
+        # Keep the objects in a SceneObjectList, so they're indexed.
+        if (
+            name == 'objects' and isinstance(value, list) and
+            not isinstance(value, SceneObjectList)
+        ):
+            value = SceneObjectList(value)
+        super().__setattr__(name, value)
 
     def set_room_dimensions(self, x: int, y: int, z: int):
         """convenience method to set room dimensions via components"""
@@ -107,42 +291,117 @@ class Scene:
         target = metadata.get('target', {})
         targets_info = [target] if target else metadata.get('targets', [])
         for target_info in targets_info:
-            target_id = target_info.get('id', {})
-            for instance in (self.objects or []):
-                if instance.get('id', '') == target_id:
-                    targets.append(instance)
-                    break
+            target = self.get_object_by_id(target_info.get('id', {}))
+            if target:
+                targets.append(target)
         return targets
 
+    def overlay(self) -> 'SceneOverlay':
+        """Return a copy-on-write overlay of this scene, to stage speculative
+        changes (like trying a new object) without a deep copy. See
+        SceneOverlay."""
+        return SceneOverlay(self)
+
     def get_object_by_id(self, object_id: str) -> Optional[SceneObject]:
         """Returns the object in this scene with the given ID, or None if such
         an object does not currently exist."""
-        return next(filter(lambda x: x['id'] == object_id, self.objects), None)
+        if not self.objects or not _is_hashable(object_id):
+            return None
+        return self.objects.find_by_id(object_id)
+
+    def get_objects_by_type(self, object_type: str) -> List[SceneObject]:
+        """Returns the objects in this scene with the given type."""
+        return self.objects.find_by_type(object_type) if self.objects else []
+
+    def get_objects_by_role(self, role: str) -> List[SceneObject]:
+        """Returns the objects in this scene with the given debug role."""
+        return self.objects.find_by_role(role) if self.objects else []
 
     def find_bounds(
         self,
         ignore_ground: bool = False,
         ignore_ids: List[str] = None
     ) -> List[ObjectBounds]:
-        """Calculate and return the bounds for all the given objects."""
+        """Calculate and return the bounds for all the given objects. The
+        returned list is an IndexedBoundsList, so collision checks against it
+        only test nearby bounds. The scene keeps the index between calls and
+        updates it incrementally as objects are added. Each call returns a
+        copy-on-write copy of the index, so it's cheap to make and the caller
+        may change it."""
+        ground_bounds = (
+            _NO_GROUND_BOUNDS if ignore_ground else self._find_ground_bounds()
+        )
+
+        # A single ID string ignores each object with an ID in the string.
+        ignored = (
+            ignore_ids if isinstance(ignore_ids, str) else
+            set(ignore_ids or [])
+        )
+
+        # Add each object's bounding box to the list. Check each object every
+        # time, since an object's bounding box may be replaced in place.
+        object_bounds = []
+        for instance in self.objects:
+            if ignored and instance.get('id') in ignored:
+                continue
+            try:
+                object_bounds.append(instance['shows'][0]['boundingBox'])
+            except (KeyError):
+                ...
+
+        if ignore_ids:
+            return IndexedBoundsList(ground_bounds + object_bounds)
+
+        # Reuse the index from the previous call if the ground bounds are the
+        # same and the object bounds were only appended to since then.
+        cache = self._bounds_index_cache.get(ignore_ground)
+        if cache and cache[0] is ground_bounds:
+            indexed_objects, index = cache[1], cache[2]
+            count = len(indexed_objects)
+            if len(object_bounds) >= count and all(
+                old is new for old, new in zip(indexed_objects, object_bounds)
+            ):
+                index.extend(object_bounds[count:])
+                self._bounds_index_cache[ignore_ground] = (
+                    ground_bounds,
+                    object_bounds,
+                    index
+                )
+                return index.copy()
+
+        index = IndexedBoundsList(ground_bounds + object_bounds)
+        self._bounds_index_cache[ignore_ground] = (
+            ground_bounds,
+            object_bounds,
+            index
+        )
+        return index.copy()
+
+    def _find_ground_bounds(self) -> List[ObjectBounds]:
+        """Return the bounds for each hole, lava, and partition floor area,
+        reusing the previous bounds if none of them have changed."""
+        key = (
+            tuple((area.x, area.z) for area in (self.holes + self.lava)),
+            (
+                self.partition_floor.leftHalf,
+                self.partition_floor.rightHalf
+            ) if self.partition_floor else None,
+            (self.room_dimensions.x, self.room_dimensions.z)
+        )
+        if self._ground_bounds_cache and self._ground_bounds_cache[0] == key:
+            return self._ground_bounds_cache[1]
+
         # Create a bounding box for each hole/lava and add it to the list.
-        bounds = [] if ignore_ground else [
+        bounds = [
             geometry.generate_floor_area_bounds(area.x, area.z)
             for area in (self.holes + self.lava)
         ]
 
-        if self.partition_floor and not ignore_ground:
+        if self.partition_floor:
             bounds += geometry.find_partition_floor_bounds(
                 self.room_dimensions, self.partition_floor)
 
-        # Add each object's bounding box to the list.
-        for instance in self.objects:
-            if instance.get('id') in (ignore_ids or []):
-                continue
-            try:
-                bounds.append(instance['shows'][0]['boundingBox'])
-            except (KeyError):
-                ...
+        self._ground_bounds_cache = (key, bounds)
         return bounds
 
 # TODO MCS-1234
@@ -190,6 +449,84 @@ class Scene:
         return data
 
 
+def _is_changed(original, staged) -> bool:
+    """Return if the given staged copy of the given list or dict has any
+    added, removed, or replaced items."""
+    if len(original) != len(staged):
+        return True
+    if isinstance(original, dict):
+        return any(
+            key not in original or original[key] is not value
+            for key, value in staged.items()
+        )
+    return any(old is not new for old, new in zip(original, staged))
+
+
+class SceneOverlay(Scene):
+    """A copy-on-write overlay of a scene that stages changes on top of it,
+    so they can be committed to the scene or just discarded. Creating one
+    costs about as much as copying the scene's lists, rather than a deep copy
+    of the whole scene.
+
+    An overlay has its own copies of the scene's lists (like its objects,
+    holes, and lava) and dicts (like its debug data), so items can be added
+    to or removed from them, and any property can be replaced (like
+    overlay.room_dimensions = Vector3d(...)), without changing the scene.
+    Everything else, including each object, is shared with the scene, so
+    replace rather than modify it. Bounds queries (like find_bounds) on the
+    overlay see its staged changes, and reuse the scene's bounds index."""
+
+    def __init__(self, scene: Scene):
+        for scene_field in fields(Scene):
+            value = getattr(scene, scene_field.name)
+            if isinstance(value, (dict, list)):
+                value = value.copy()
+            setattr(self, scene_field.name, value)
+        self._scene = scene
+        # The ground bounds are only reused if they're still the same.
+        self._ground_bounds_cache = scene._ground_bounds_cache
+        self._bounds_index_cache = {}
+
+    def find_bounds(
+        self,
+        ignore_ground: bool = False,
+        ignore_ids: List[str] = None
+    ) -> List[ObjectBounds]:
+        # The first time, start from a copy of the scene's bounds index, so
+        # only the staged objects need to be added to it.
+        scene_cache = self._scene._bounds_index_cache.get(ignore_ground)
+        if scene_cache and ignore_ground not in self._bounds_index_cache:
+            self._bounds_index_cache[ignore_ground] = (
+                scene_cache[0],
+                scene_cache[1],
+                scene_cache[2].copy()
+            )
+        return super().find_bounds(ignore_ground, ignore_ids)
+
+    def commit(self) -> Scene:
+        """Apply the changes staged in this overlay to its scene, and return
+        the scene. Lists and dicts are updated in place, so any references to
+        them stay valid."""
+        for scene_field in fields(Scene):
+            original = getattr(self._scene, scene_field.name)
+            staged = getattr(self, scene_field.name)
+            if staged is original:
+                continue
+            if (
+                isinstance(original, (dict, list)) and
+                type(staged) is type(original)
+            ):
+                if _is_changed(original, staged):
+                    if isinstance(original, dict):
+                        original.clear()
+                        original.update(staged)
+                    else:
+                        original[:] = staged
+                continue
+            setattr(self._scene, scene_field.name, staged)
+        return self._scene
+
+
 def get_step_limit_from_dimensions(room_x: int, room_z: int) -> int:
     room_x = room_x or geometry.DEFAULT_ROOM_DIMENSIONS['x']
     room_z = room_z or geometry.DEFAULT_ROOM_DIMENSIONS['z']
@@ -1,43 +1,58 @@
 #!/usr/bin/env python3
 
-import copy
 import json
 import logging
+import multiprocessing
 import os
+import pickle
 import sys
+import threading
+from concurrent.futures import (
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor
+)
+from dataclasses import fields, is_dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Tuple
 
 sys.path.insert(1, '../pretty_json')
+from machine_common_sense.config_manager import Goal
 from pretty_json import PrettyJsonEncoder, PrettyJsonNoIndent
 
+from .exceptions import SceneException
+from .geometry import ObjectBounds
 from .objects import SceneObject
-from .scene import Scene
+from .scene import Scene, scene_aliases
 
 
-def _convert_non_serializable_data(scene: Scene) -> None:
-    """Convert all non-JSON-serializable data from the given scene."""
-    # Convert the boundingBox from an ObjectBounds into a serializable dict.
-    for instance in scene.objects:
-        if 'boundsAtStep' in instance['debug']:
-            del instance['debug']['boundsAtStep']
-        for show in instance['shows']:
-            if not show.get('boundingBox'):
-                continue
-            bb = show['boundingBox']
-            bb = bb if isinstance(bb, dict) else vars(bb)
-            box_xz = bb['box_xz']
-            box_xz = [el if isinstance(el, dict) else vars(el)
-                      for el in box_xz]
-            show['boundingBox'] = [{
-                'x': corner['x'],
-                'y': bb['min_y'],
-                'z': corner['z']
-            } for corner in box_xz] + [{
-                'x': corner['x'],
-                'y': bb['max_y'],
-                'z': corner['z']
-            } for corner in box_xz]
+# The debug movement properties with data that's misleading in debug files.
+MISLEADING_MOVEMENT_PROPS = [
+    'moveExit', 'deepExit', 'tossExit', 'moveStop', 'deepStop', 'tossStop'
+]
+MISLEADING_MOVEMENT_DATA = ['xDistanceByStep', 'yDistanceByStep',
+                            'zDistanceByStep']
+
+
+def _convert_bounding_box(bb: Any) -> List[Dict[str, float]]:
+    """Convert the given boundingBox (an ObjectBounds, or a dict or object
+    with box_xz, max_y, and min_y) into a serializable list of its corners."""
+    if isinstance(bb, ObjectBounds):
+        box_xz = [{'x': x, 'z': z} for x, z in bb.points_xz.tolist()]
+        bb = {'min_y': bb.min_y, 'max_y': bb.max_y}
+    else:
+        bb = bb if isinstance(bb, dict) else vars(bb)
+        box_xz = [el if isinstance(el, dict) else vars(el)
+                  for el in bb['box_xz']]
+    return [{
+        'x': corner['x'],
+        'y': bb['min_y'],
+        'z': corner['z']
+    } for corner in box_xz] + [{
+        'x': corner['x'],
+        'y': bb['max_y'],
+        'z': corner['z']
+    } for corner in box_xz]
 
 
 def _json_no_indent(data: Dict[str, Any], prop_list: List[str]) -> None:
@@ -47,92 +62,178 @@ def _json_no_indent(data: Dict[str, Any], prop_list: List[str]) -> None:
             data[prop] = PrettyJsonNoIndent(data[prop])
 
 
+def _object_debug_for_writing(debug: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a copy of the given object debug data for the debug file,
+    without its non-serializable boundsAtStep or its misleading data."""
+    output = {}
+    for prop, value in debug.items():
+        if prop == 'boundsAtStep':
+            continue
+        if prop == 'movement':
+            value = _strip_debug_misleading_movement(value)
+        output[prop] = _truncate_floats(value)
+    return output
+
+
+def _object_for_writing(instance: SceneObject) -> Dict[str, Any]:
+    """Return a copy of the given object for the debug file."""
+    output = {}
+    for prop, value in instance.items():
+        if prop == 'debug':
+            output[prop] = _object_debug_for_writing(value)
+        elif prop == 'shows':
+            output[prop] = [_show_for_writing(show) for show in value]
+        else:
+            output[prop] = _truncate_floats(value)
+    _json_no_indent(output, ['materials', 'salientMaterials', 'states'])
+    return output
+
+
+def _show_for_writing(show: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a copy of the given show for the debug file, converting its
+    boundingBox into a serializable list."""
+    output = {}
+    for prop, value in show.items():
+        if prop == 'boundingBox' and value:
+            value = _convert_bounding_box(value)
+        output[prop] = _truncate_floats(value)
+    return output
+
+
 def _strip_debug_data(scene_dict: Dict[str, Any]) -> Dict[str, Any]:
-    """Remove internal debug data that should only be in debug files."""
-    del scene_dict['debug']
-    for instance in scene_dict['objects']:
+    """Return a copy of the given scene dict without the internal debug data
+    that should only be in debug files. The given dict isn't modified, and
+    shares all its other data with the copy."""
+    scene_dict = {
+        prop: value for prop, value in scene_dict.items() if prop != 'debug'
+    }
+    scene_dict['objects'] = [
         _strip_debug_object_data(instance)
-    for goal_key in ('answer', 'domainsInfo', 'objectsInfo', 'sceneInfo'):
-        if goal_key in scene_dict['goal']:
-            del scene_dict['goal'][goal_key]
-    if scene_dict['goal']['metadata']:
-        for target_key in ['target', 'target_1', 'target_2']:
-            if scene_dict['goal']['metadata'].get(target_key, None):
-                scene_dict['goal']['metadata'][target_key].pop('info', None)
+        for instance in scene_dict['objects']
+    ]
+    goal = {
+        prop: value for prop, value in scene_dict['goal'].items()
+        if prop not in ('answer', 'domainsInfo', 'objectsInfo', 'sceneInfo')
+    }
+    if goal.get('metadata'):
+        goal['metadata'] = {
+            prop: (
+                {key: data for key, data in value.items() if key != 'info'}
+                if value and prop in ['target', 'target_1', 'target_2']
+                else value
+            ) for prop, value in goal['metadata'].items()
+        }
+    scene_dict['goal'] = goal
     return scene_dict
 
 
-def _strip_debug_misleading_data(scene: Scene) -> None:
-    """Remove misleading internal debug data not needed in debug files."""
-    for instance in scene.objects:
-        if 'movement' in instance['debug']:
-            for movement_property in [
-                'moveExit', 'deepExit', 'tossExit',
-                'moveStop', 'deepStop', 'tossStop'
-            ]:
-                if instance['debug']['movement'].get(movement_property):
-                    for axis in ['x', 'y', 'z']:
-                        distance_property = axis + 'DistanceByStep'
-                        instance['debug']['movement'][movement_property].pop(
-                            distance_property,
-                            None
-                        )
-
-
-def _strip_debug_object_data(instance: SceneObject) -> None:
-    """Remove internal debug data from the given object."""
-    instance.pop('debug', None)
-    if 'shows' in instance:
-        for show in instance['shows']:
-            show.pop('boundingBox', None)
-
-
-def _truncate_floats_in_dict(data: Dict[str, Any]) -> None:
-    """Truncate all the floats in the given dict."""
-    for prop in data:
-        if isinstance(data[prop], float):
-            data[prop] = round(data[prop], 4)
-        if isinstance(data[prop], list):
-            _truncate_floats_in_list(data[prop])
-        if isinstance(data[prop], dict):
-            _truncate_floats_in_dict(data[prop])
-
-
-def _truncate_floats_in_list(data: List[Any]) -> None:
-    """Truncate all the floats in the given list."""
-    for i in range(len(data)):
-        if isinstance(data[i], float):
-            data[i] = round(data[i], 4)
-        if isinstance(data[i], list):
-            _truncate_floats_in_list(data[i])
-        if isinstance(data[i], dict):
-            _truncate_floats_in_dict(data[i])
-
-
-def _ready_scene_for_writing(scene: Scene) -> Dict[str, Any]:
-    _strip_debug_misleading_data(scene)
-    _convert_non_serializable_data(scene)
-    scene_dict = scene.to_dict()
-    _truncate_floats_in_dict(scene_dict)
-
-    # Use PrettyJsonNoIndent on some of the lists and dicts in the
-    # output scene because the indentation from the normal Python JSON
-    # module spaces them out far too much.
-    _json_no_indent(scene_dict['goal'], [
+def _strip_debug_misleading_movement(movement: Dict[str, Any]) -> Dict[
+    str, Any
+]:
+    """Return a copy of the given object debug movement data without the
+    internal data that's misleading in debug files."""
+    return {
+        prop: (
+            {
+                key: data for key, data in value.items()
+                if key not in MISLEADING_MOVEMENT_DATA
+            } if value and prop in MISLEADING_MOVEMENT_PROPS else value
+        ) for prop, value in movement.items()
+    }
+
+
+def _strip_debug_object_data(instance: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a copy of the given object without its internal debug data.
+    The given object isn't modified."""
+    output = {
+        prop: value for prop, value in instance.items() if prop != 'debug'
+    }
+    if 'shows' in output:
+        output['shows'] = [{
+            prop: value for prop, value in show.items()
+            if prop != 'boundingBox'
+        } for show in output['shows']]
+    return output
+
+
+def _truncate_floats(data: Any) -> Any:
+    """Return a copy of the given data with all its floats truncated. Dicts,
+    lists, and dataclasses (converted to dicts) are copied recursively; all
+    other data is shared with the given data."""
+    if isinstance(data, float):
+        return round(data, 4)
+    if isinstance(data, dict):
+        return {prop: _truncate_floats(value) for prop, value in data.items()}
+    if isinstance(data, list):
+        return [_truncate_floats(value) for value in data]
+    if is_dataclass(data) and not isinstance(data, type):
+        return {
+            field.name: _truncate_floats(getattr(data, field.name))
+            for field in fields(data)
+        }
+    return data
+
+
+def _goal_for_writing(goal: Goal) -> Dict[str, Any]:
+    """Return the given goal as a dict for the debug file, like
+    Scene.to_dict does."""
+    data = goal.dict()
+    for key, alias in [
+        ('domains_info', 'domainsInfo'),
+        ('objects_info', 'objectsInfo'),
+        ('scene_info', 'sceneInfo'),
+        ('triggered_by_target_sequence', 'triggeredByTargetSequence')
+    ]:
+        if key in data:
+            data[alias] = data.pop(key)
+    data = _truncate_floats({
+        key: value for key, value in data.items() if value is not None
+    })
+
+    _json_no_indent(data, [
         'action_list', 'domain_list', 'type_list', 'task_list', 'info_list'
     ])
-    if 'metadata' in scene_dict['goal']:
+    if 'metadata' in data:
         for target in ['target', 'target_1', 'target_2']:
-            if target in scene_dict['goal']['metadata']:
-                _json_no_indent(scene_dict['goal']['metadata'][target], [
-                    'info', 'image'
-                ])
-    for instance in scene_dict['objects']:
-        _json_no_indent(instance, ['materials', 'salientMaterials', 'states'])
-        if 'debug' in instance:
-            _json_no_indent(instance['debug'], 'info')
+            if target in data['metadata']:
+                _json_no_indent(data['metadata'][target], ['info', 'image'])
+    return data
 
-    return scene_dict
+
+def _ready_scene_for_writing(
+    scene: Scene,
+    name: str = None
+) -> Dict[str, Any]:
+    """Return the given scene as a dict for the debug file, with the same
+    data as Scene.to_dict, but with each float truncated, each
+    non-serializable or misleading property converted or removed, and each
+    list that shouldn't be indented wrapped for the encoder. Override the
+    scene's name with the given name, if any. The scene isn't modified, and
+    only its dicts and lists are copied, rather than the whole scene."""
+    data = {}
+    for field in fields(scene):
+        value = getattr(scene, field.name)
+        if field.name == 'name' and name is not None:
+            value = name
+        if field.name in ['holes', 'lava', 'floor_textures'] and value:
+            value = [item.dict() for item in value]
+        if value is not None and field.name in [
+            'performer_start', 'room_dimensions', 'room_materials'
+        ]:
+            value = value.dict()
+        if field.name == 'goal':
+            data[field.name] = _goal_for_writing(value)
+        elif field.name == 'objects':
+            data[field.name] = [
+                _object_for_writing(instance) for instance in value
+            ]
+        else:
+            data[field.name] = _truncate_floats(value)
+    # Use the same property names and order as Scene.to_dict.
+    for key, alias in scene_aliases.items():
+        if key in data:
+            data[alias] = data.pop(key)
+    return {key: value for key, value in data.items() if value is not None}
 
 
 def _write_scene_file(filename: str, scene_dict: Dict[str, Any]) -> None:
@@ -170,14 +271,44 @@ def find_next_filename(
     return filename, index
 
 
+def reserve_next_filename(
+    prefix: str,
+    index: int,
+    indent: str,
+    suffix: str = '.json'
+) -> Tuple[str, int]:
+    """Like find_next_filename, but atomically create an empty placeholder
+    file for the chosen filename so that concurrent processes sharing the same
+    output folder never choose the same filename. Return the filename without
+    the suffix (file extension) and the reserved index."""
+    # If the filename contains a directory, ensure that directory exists.
+    Path(f'{prefix}{index:{indent}}').parents[0].mkdir(
+        parents=True,
+        exist_ok=True
+    )
+    while True:
+        filename = f'{prefix}{index:{indent}}'
+        try:
+            # O_EXCL makes the existence check and the creation one step.
+            os.close(os.open(
+                f'{filename}{suffix}',
+                os.O_CREAT | os.O_EXCL | os.O_WRONLY
+            ))
+            break
+        except FileExistsError:
+            index += 1
+    return filename, index
+
+
 def save_scene_files(
     scene: Scene,
     scene_filename: str,
     no_scene_id: bool = False,
     no_debug_file: bool = False,
     only_debug_file: bool = False
-) -> int:
-    """Save the given scene as a normal JSON file and a debug JSON file."""
+) -> None:
+    """Save the given scene as a normal JSON file and a debug JSON file. The
+    scene isn't modified."""
 
     # The debug scene filename has the scene ID for debugging.
     scene_id = (scene.goal.scene_info or {}).get('id', [None])[0]
@@ -187,13 +318,128 @@ def save_scene_files(
     )
 
     # Ensure that the scene's 'name' property doesn't have a directory.
-    scene_copy = copy.deepcopy(scene)
-    scene_copy.name = Path(scene_filename).name
-    scene_dict = _ready_scene_for_writing(scene_copy)
+    scene_dict = _ready_scene_for_writing(scene, Path(scene_filename).name)
 
     # Save the scene as both normal and debug JSON files.
     if not no_debug_file:
         _write_scene_file(debug_filename + '_debug.json', scene_dict)
-    scene_dict = _strip_debug_data(scene_dict)
     if not only_debug_file:
-        _write_scene_file(scene_filename + '.json', scene_dict)
+        _write_scene_file(
+            scene_filename + '.json',
+            _strip_debug_data(scene_dict)
+        )
+
+
+def _save_pickled_scene_files(
+    scene_data: bytes,
+    scene_filename: str,
+    no_scene_id: bool = False,
+    no_debug_file: bool = False,
+    only_debug_file: bool = False
+) -> str:
+    """Save the given pickled scene as a normal JSON file and a debug JSON
+    file, and return the scene filename. Used by the SceneWriter."""
+    save_scene_files(
+        pickle.loads(scene_data),
+        scene_filename,
+        no_scene_id,
+        no_debug_file,
+        only_debug_file
+    )
+    return scene_filename
+
+
+class SceneWriter():
+    """Save scene files in the background, so that generating the next scene
+    doesn't wait on JSON encoding and disk writes. Each scene is copied when
+    it's submitted, so the caller may keep modifying it. At most max_pending
+    scenes may wait to be saved at once; submitting another scene blocks
+    until one is finished. If saving a scene fails, its error is raised by
+    the next call to submit or close (or on exiting the "with" block).
+
+    Use threads by default, or processes if processes is true (faster for
+    big batches since JSON encoding holds the GIL, but each process must
+    import the scene generator first)."""
+
+    def __init__(
+        self,
+        workers: int = 1,
+        max_pending: int = 4,
+        processes: bool = False
+    ):
+        self._executor = (
+            ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context('spawn')
+            ) if processes else ThreadPoolExecutor(max_workers=workers)
+        )
+        self._pending = threading.BoundedSemaphore(max(max_pending, workers))
+        self._futures: List[Tuple[str, Future]] = []
+        self._closed = False
+
+    def __enter__(self) -> 'SceneWriter':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        # Always finish saving each scene that was already submitted, but
+        # don't hide an error from the "with" block with an error from here.
+        if exc_type:
+            self._shutdown()
+        else:
+            self.close()
+
+    def _raise_errors(self) -> None:
+        # Check each finished scene in the order they were submitted.
+        for scene_filename, future in list(self._futures):
+            if not future.done():
+                continue
+            self._futures.remove((scene_filename, future))
+            error = future.exception()
+            if error:
+                raise SceneException(
+                    f'Failed to save scene files: {scene_filename} '
+                    f'({type(error).__name__}: {error})'
+                ) from error
+
+    def _shutdown(self) -> None:
+        if not self._closed:
+            self._closed = True
+            self._executor.shutdown(wait=True)
+
+    def close(self) -> None:
+        """Wait for every submitted scene to be saved, then raise the error
+        from the first scene that failed to save, if any."""
+        self._shutdown()
+        self._raise_errors()
+
+    def submit(
+        self,
+        scene: Scene,
+        scene_filename: str,
+        no_scene_id: bool = False,
+        no_debug_file: bool = False,
+        only_debug_file: bool = False
+    ) -> Future:
+        """Copy the given scene and save it as a normal JSON file and a debug
+        JSON file in the background. Return the Future for the saving."""
+        if self._closed:
+            raise SceneException('Cannot submit scenes to a closed writer')
+        self._raise_errors()
+        # Pickling copies the scene, and is faster than a deepcopy.
+        scene_data = pickle.dumps(scene, protocol=pickle.HIGHEST_PROTOCOL)
+        self._pending.acquire()
+        try:
+            future = self._executor.submit(
+                _save_pickled_scene_files,
+                scene_data,
+                scene_filename,
+                no_scene_id,
+                no_debug_file,
+                only_debug_file
+            )
+        except Exception:
+            self._pending.release()
+            raise
+        future.add_done_callback(lambda _: self._pending.release())
+        self._futures.append((scene_filename, future))
+        return future
@@ -24,8 +24,9 @@
 # https://github.com/JuantAldea/Separating-Axis-Theorem/blob/master/python/separation_axis_theorem.py
 
 # Rewriting things to handle our dict format
-from typing import Dict, List, Union
+from typing import Dict, List, Sequence, Union
 
+import numpy as np
 from machine_common_sense.config_manager import Vector3d
 
 
@@ -95,6 +96,118 @@ def separating_axis_theorem(vertices_a, vertices_b):
     return True
 
 
+def separating_axis_theorem_pairwise(
+    vertices_a: np.ndarray,
+    vertices_b: np.ndarray
+) -> np.ndarray:
+    """Vectorized separating_axis_theorem that tests every polygon in
+    vertices_a, an array of shape (K, V, 2), against every polygon in
+    vertices_b, an array of shape (N, W, 2), in one pass. Returns a boolean
+    array of shape (K, N) that is True for each pair of polygons that
+    collides. The arithmetic mirrors the scalar version so the results are
+    identical."""
+    count_a = vertices_a.shape[0]
+    count_b = vertices_b.shape[0]
+    edges_a = np.roll(vertices_a, -1, axis=1) - vertices_a
+    edges_b = np.roll(vertices_b, -1, axis=1) - vertices_b
+    edges = np.concatenate((
+        np.broadcast_to(
+            edges_a[:, None],
+            (count_a, count_b) + edges_a.shape[1:]
+        ),
+        np.broadcast_to(
+            edges_b[None, :],
+            (count_a, count_b) + edges_b.shape[1:]
+        )
+    ), axis=2)
+
+    # Orthogonal of each edge, then normalized, just like the scalar code.
+    axes_x = edges[:, :, :, 1]
+    axes_z = -edges[:, :, :, 0]
+    norm = np.sqrt(axes_x ** 2 + axes_z ** 2)
+    if not norm.all():
+        # Match the scalar version, which fails on a zero-length edge.
+        raise ZeroDivisionError('float division by zero')
+    axes_x = axes_x / norm
+    axes_z = axes_z / norm
+
+    # Project every vertex onto every axis: shape (K, N, axes, vertices).
+    dots_a = (
+        vertices_a[:, None, None, :, 0] * axes_x[:, :, :, None] +
+        vertices_a[:, None, None, :, 1] * axes_z[:, :, :, None]
+    )
+    dots_b = (
+        vertices_b[None, :, None, :, 0] * axes_x[:, :, :, None] +
+        vertices_b[None, :, None, :, 1] * axes_z[:, :, :, None]
+    )
+    min_a, max_a = dots_a.min(axis=3), dots_a.max(axis=3)
+    min_b, max_b = dots_b.min(axis=3), dots_b.max(axis=3)
+
+    # Two sorted ranges overlap if neither ends before the other starts.
+    overlapping = (min_a <= max_b) & (min_b <= max_a)
+    return overlapping.all(axis=2)
+
+
+def separating_axis_theorem_batch(
+    vertices_a: np.ndarray,
+    vertices_b: np.ndarray
+) -> np.ndarray:
+    """Vectorized separating_axis_theorem that tests the single polygon
+    vertices_a, an array of shape (V, 2), against every polygon in
+    vertices_b, an array of shape (N, W, 2), in one pass. Returns a boolean
+    array of shape (N,) that is True for each polygon that collides."""
+    return separating_axis_theorem_pairwise(vertices_a[None], vertices_b)[0]
+
+
+def _to_vertices(
+    rect: Union[List[Union[Dict[str, float], Vector3d]], np.ndarray]
+) -> Union[List[tuple], np.ndarray]:
+    # Arrays of X/Z points (like ObjectBounds.points_xz) are used as is.
+    if isinstance(rect, np.ndarray):
+        return rect
+    return [
+        (corner.x, corner.z) if isinstance(corner, Vector3d) else
+        (corner['x'], corner['z']) for corner in rect
+    ]
+
+
+def sat_entry_batch(
+    rect: List[Union[Dict[str, float], Vector3d]],
+    rect_list: Sequence[List[Union[Dict[str, float], Vector3d]]]
+) -> np.ndarray:
+    """Like sat_entry, but tests the given rect against every rect in the
+    given list at once. Returns a boolean array that is True for each rect
+    in the list that intersects the given rect. Each rect may also be an
+    array of X/Z points with shape (number_of_points, 2)."""
+    vertices_a = np.array([_to_vertices(rect)], dtype=float)
+    return sat_entry_pairwise(vertices_a, rect_list)[0]
+
+
+def sat_entry_pairwise(
+    vertices_list: np.ndarray,
+    rect_list: Sequence[List[Union[Dict[str, float], Vector3d]]]
+) -> np.ndarray:
+    """Test every polygon in the given array of X/Z vertices, with shape
+    (K, V, 2), against every rect in the given list. Returns a boolean array
+    of shape (K, N) that is True for each pair that intersects."""
+    collisions = np.zeros((len(vertices_list), len(rect_list)), dtype=bool)
+    if not len(vertices_list) or not rect_list:
+        return collisions
+    # Group the rects by vertex count so each group is a regular array.
+    groups: Dict[int, List[int]] = {}
+    for index, other in enumerate(rect_list):
+        groups.setdefault(len(other), []).append(index)
+    for indexes in groups.values():
+        vertices_b = np.array([
+            _to_vertices(rect_list[index]) for index in indexes
+        ], dtype=float)
+        collisions[:, indexes] = separating_axis_theorem_pairwise(
+            vertices_list,
+            vertices_b
+        )
+    return collisions
+
+
 def sat_entry(
     rect_a: List[Union[Dict[str, float], Vector3d]],
     rect_b: List[Union[Dict[str, float], Vector3d]]
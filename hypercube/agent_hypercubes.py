@@ -1,15 +1,17 @@
 import glob
-import json
 import logging
 import os
 import random
-from typing import Callable, Dict, List
+from typing import Callable, Dict, Iterator, List
 
 from machine_common_sense.config_manager import Goal
 
 from generator import Scene, tags
 
-from .agent_scene_pair_json_converter import OccluderMode, convert_scene_pair
+from .agent_scene_pair_json_converter import (
+    OccluderMode,
+    convert_scene_pair_files
+)
 from .hypercubes import Hypercube, HypercubeFactory
 
 logger = logging.getLogger(__name__)
@@ -49,11 +51,6 @@ class AgentHypercube(Hypercube):
             'unexpected': self._filename_prefix + 'u.json'
         }
 
-        json_data = {
-            'expected': None,
-            'unexpected': None
-        }
-
         category_list = ['expected']
         if not self._training:
             category_list.append('unexpected')
@@ -64,21 +61,13 @@ class AgentHypercube(Hypercube):
                 raise ValueError(f'Agent hypercube cannot find {category} '
                                  f'scene JSON file: {json_filename[category]}')
 
-            # Read the data from the JSON scene file.
-            with open(json_filename[category]) as json_file:
-                logger.info(
-                    f'Reading {category} agent scene JSON file: '
-                    f'{json_filename[category]}'
-                )
-                json_data[category] = json.load(json_file)
-
-        # Create the pair of MCS scenes from the JSON data, which should be a
-        # list of trials that each have a list of frames.
-        scenes = convert_scene_pair(
+        # Create the pair of MCS scenes from the JSON files, which should each
+        # have a list of trials that each have a list of frames.
+        scenes = convert_scene_pair_files(
             starter_scene,
             goal_template,
-            json_data['expected'],
-            json_data['unexpected'],
+            json_filename['expected'],
+            json_filename['unexpected'] if not self._training else None,
             self._filename_prefix,
             self._role_to_type,
             self._untrained,
@@ -141,21 +130,19 @@ class AgentHypercubeFactory(HypercubeFactory):
         )
 
     # Override
-    def generate_hypercubes(
+    def iterate_hypercubes(
         self,
         total: int,
         starter_scene_function: Callable[[], Scene],
         role_to_type: Dict[str, str],
         throw_error=False,
         sort_data=False
-    ) -> List[Hypercube]:
+    ) -> Iterator[Hypercube]:
         # Save this now in case it's used by a hypercube factory subclass.
         self.role_to_type = role_to_type
 
-        # Return one hypercube per pair of expected/unexpected JSON scene files
-        # in the folder associated with this factory, or up to the given total.
-        hypercubes = []
-
+        # Yield one hypercube per pair of expected/unexpected JSON scene files
+        # in the folder associated with this factory.
         if self.training:
             logger.info(
                 'Agent hypercube factory set to generate training scenes; '
@@ -190,8 +177,8 @@ class AgentHypercubeFactory(HypercubeFactory):
         else:
             random.shuffle(randomized_prefix_to_number)
 
-        # Generate one hypercube per valid pair of files.
-        count = 0
+        # Find each valid pair of files.
+        prefix_list = []
         for prefix, number in randomized_prefix_to_number:
             if (not self.training) and (number < 2):
                 logger.warn(
@@ -200,18 +187,8 @@ class AgentHypercubeFactory(HypercubeFactory):
                     f'named {prefix + "e.json"} and {prefix + "u.json"}'
                 )
                 continue
-            count += 1
-            self._filename_prefix = prefix
-            hypercube = self._build(starter_scene_function())
-            hypercubes.append(hypercube)
-            # Every other scene pair should have untrained objects.
-            self._untrained = (not self._untrained)
-            if count % 100 == 0:
-                logger.info(
-                    f'Finished initialization of {count} / '
-                    f'{len(randomized_prefix_to_number)} '
-                    f'{self._task_type} hypercubes...'
-                )
+            prefix_list.append(prefix)
+        count = len(prefix_list)
 
         if count < total:
             logger.info(
@@ -228,7 +205,17 @@ class AgentHypercubeFactory(HypercubeFactory):
                 f'be used if other scenes fail.'
             )
 
-        return hypercubes
+        # Generate one hypercube per valid pair of files, only when needed.
+        for index, prefix in enumerate(prefix_list):
+            self._filename_prefix = prefix
+            yield self._build(starter_scene_function())
+            # Every other scene pair should have untrained objects.
+            self._untrained = (not self._untrained)
+            if (index + 1) % 100 == 0:
+                logger.info(
+                    f'Finished initialization of {index + 1} / '
+                    f'{count} {self._task_type} hypercubes...'
+                )
 
 
 class InstrumentalActionTrainingHypercubeFactory(AgentHypercubeFactory):
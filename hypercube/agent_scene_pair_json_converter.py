@@ -1,11 +1,26 @@
 import copy
+import gc
+import json
 import logging
 import math
 import random
+import re
 import uuid
+from collections.abc import Sequence
 from enum import Enum, auto
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    TextIO,
+    Tuple
+)
 
+import numpy as np
 import shapely
 from machine_common_sense.config_manager import Goal, Vector3d
 
@@ -108,22 +123,56 @@ class ObjectConfigWithMaterial(ObjectConfig):
         self.material = material
 
 
+class TrueShape(NamedTuple):
+    """The type, center, size, offset, and Y rotation used to make an object's
+    bounds, so its "true" polygon can be made (or remade) on demand."""
+    object_type: str
+    center_x: float
+    center_z: float
+    size_x: float
+    size_z: float
+    offset_x: float
+    offset_z: float
+    rotation_y: float
+
+
 class TrueObjectBounds(ObjectBounds):
     """Subclass of ObjectBounds that correctly represents the polygons for
-    circular and triangular shapes."""
-    true_poly: shapely.geometry.Polygon = None
+    circular and triangular shapes. If given a true_shape rather than a
+    true_poly, the polygon is only made on first access, and is dropped by
+    release_polygons (and when pickled) to save memory."""
 
     def __init__(
         self,
         bounds: ObjectBounds,
-        true_poly: shapely.geometry.Polygon
+        true_poly: shapely.geometry.Polygon = None,
+        true_shape: TrueShape = None
     ):
         super().__init__(
             box_xz=bounds.box_xz,
             max_y=bounds.max_y,
             min_y=bounds.min_y
         )
-        self.true_poly = true_poly
+        self._true_poly = true_poly
+        self.true_shape = true_shape
+
+    def __getstate__(self) -> Tuple[Any, ...]:
+        points, max_y, min_y, data = super().__getstate__()
+        if self.true_shape:
+            data = {**data, '_true_poly': None}
+        return points, max_y, min_y, data
+
+    @property
+    def true_poly(self) -> shapely.geometry.Polygon:
+        if self._true_poly is None and self.true_shape:
+            self._true_poly = _make_true_poly(self, self.true_shape)
+        return self._true_poly
+
+    @true_poly.setter
+    def true_poly(self, true_poly: shapely.geometry.Polygon) -> None:
+        self._true_poly = true_poly
+        # A custom polygon can't be remade from the shape.
+        self.true_shape = None
 
     def get_true_poly_points(self) -> List[Vector3d]:
         return [
@@ -131,9 +180,102 @@ class TrueObjectBounds(ObjectBounds):
             self.true_poly.exterior.coords
         ]
 
+    def release_polygons(self) -> None:
+        """Release this bounds' polygons (and box_xz list) if they can be
+        remade on demand."""
+        if self.true_shape:
+            self._true_poly = None
+        self._box_xz = None
+        self._polygon_xz = None
+
+
+class BoundsTrack(Sequence):
+    """A compact, read-only list of an object's TrueObjectBounds (or None, if
+    the object isn't in the scene) at each step. Each distinct bounds is only
+    stored once, as a row in NumPy arrays of its center, size, offset, Y
+    rotation, and Y range, and each step is stored as the index of its row, or
+    -1 if the object isn't visible. Each bounds is made on access."""
+
+    def __init__(
+        self,
+        object_type: str,
+        center: np.ndarray,
+        size: np.ndarray,
+        offset: np.ndarray,
+        rotation: np.ndarray,
+        y_range: np.ndarray,
+        step_to_index: np.ndarray
+    ):
+        self.object_type = object_type
+        self.center = center
+        self.size = size
+        self.offset = offset
+        self.rotation = rotation
+        self.y_range = y_range
+        self.step_to_index = step_to_index
+
+    @classmethod
+    def from_bounds_list(
+        cls,
+        bounds_list: List[Optional[TrueObjectBounds]]
+    ) -> Optional['BoundsTrack']:
+        """Return a BoundsTrack of the given bounds list, or None if any of
+        its bounds weren't made from a TrueShape of the same object type."""
+        id_to_index = {}
+        unique_bounds_list = []
+        step_to_index = []
+        for bounds in bounds_list:
+            if not bounds:
+                step_to_index.append(-1)
+                continue
+            if id(bounds) not in id_to_index:
+                id_to_index[id(bounds)] = len(unique_bounds_list)
+                unique_bounds_list.append(bounds)
+            step_to_index.append(id_to_index[id(bounds)])
+        shape_list = [bounds.true_shape for bounds in unique_bounds_list]
+        if not all(shape_list) or len(set(
+            shape.object_type for shape in shape_list
+        )) > 1:
+            return None
+        shapes = np.array(
+            [shape[1:] for shape in shape_list],
+            dtype=float
+        ).reshape(-1, 7)
+        return cls(
+            object_type=shape_list[0].object_type if shape_list else None,
+            center=shapes[:, 0:2],
+            size=shapes[:, 2:4],
+            offset=shapes[:, 4:6],
+            rotation=shapes[:, 6],
+            y_range=np.array([
+                (bounds.min_y, bounds.max_y) for bounds in unique_bounds_list
+            ], dtype=float).reshape(-1, 2),
+            step_to_index=np.array(step_to_index, dtype=np.int32)
+        )
+
+    def __len__(self) -> int:
+        return len(self.step_to_index)
+
+    def __getitem__(self, step):
+        if isinstance(step, slice):
+            return [self[i] for i in range(*step.indices(len(self)))]
+        index = self.step_to_index[step]
+        if index < 0:
+            return None
+        min_y, max_y = self.y_range[index].tolist()
+        return _make_true_bounds_from_shape(TrueShape(
+            self.object_type,
+            *self.center[index].tolist(),
+            *self.size[index].tolist(),
+            *self.offset[index].tolist(),
+            self.rotation[index].item()
+        ), min_y, max_y)
+
 
 # Debug logging
 SAVE_TRIALS_TO_FILE = False
+# The number of characters to read from a JSON scene file at once.
+JSON_READ_SIZE = 2 ** 20
 TRIALS_SUFFIX = '_trials.txt'
 
 EXPECTED = 'expected'
@@ -1703,10 +1845,31 @@ def _create_scene(
     role_to_object_list[tags.ROLES.TARGET] = target_list
     role_to_object_list[tags.ROLES.WALL] = wall_object_list + lock_wall_list
 
+    _compact_object_tracks([
+        mcs_object for object_list in role_to_object_list.values()
+        for mcs_object in object_list
+    ])
     scene = update_scene_objects(scene, role_to_object_list)
     return scene
 
 
+def _compact_object_tracks(object_list: List[SceneObject]) -> None:
+    """Compact each given object's boundsAtStep into a BoundsTrack, and release
+    the polygons of the bounds in its shows, once the scene is finished, so
+    each scene needs much less memory (and is much faster to pickle)."""
+    for mcs_object in object_list:
+        debug = mcs_object.get('debug') or {}
+        bounds_list = debug.get('boundsAtStep')
+        if isinstance(bounds_list, list):
+            debug['boundsAtStep'] = (
+                BoundsTrack.from_bounds_list(bounds_list) or bounds_list
+            )
+        for show in mcs_object.get('shows', []):
+            bounds = show.get('boundingBox')
+            if isinstance(bounds, TrueObjectBounds):
+                bounds.release_polygons()
+
+
 def _create_show(
     begin_frame: int,
     object_type: str,
@@ -2119,37 +2282,77 @@ def _make_true_bounds(
         rotation=rotation,
         standing_y=standing_y
     )
+    return TrueObjectBounds(bounds=bounds, true_shape=TrueShape(
+        object_type,
+        position['x'],
+        position['z'],
+        dimensions['x'],
+        dimensions['z'],
+        offset['x'] if offset else 0,
+        offset['z'] if offset else 0,
+        rotation['y']
+    ))
+
+
+def _make_true_bounds_from_shape(
+    true_shape: TrueShape,
+    min_y: float,
+    max_y: float
+) -> TrueObjectBounds:
+    """Create and return the "true bounds" for the given shape and Y range,
+    the same as the bounds returned by _make_true_bounds."""
+    bounds = geometry.create_bounds(
+        dimensions={'x': true_shape.size_x, 'y': 0, 'z': true_shape.size_z},
+        offset={'x': true_shape.offset_x, 'y': 0, 'z': true_shape.offset_z},
+        position={'x': true_shape.center_x, 'y': 0, 'z': true_shape.center_z},
+        rotation={'x': 0, 'y': true_shape.rotation_y, 'z': 0},
+        standing_y=0
+    )
+    bounds.min_y = min_y
+    bounds.max_y = max_y
+    return TrueObjectBounds(bounds=bounds, true_shape=true_shape)
+
+
+def _make_true_poly(
+    bounds: ObjectBounds,
+    true_shape: TrueShape
+) -> shapely.geometry.Polygon:
+    """Create and return the "true poly" for the given bounds and shape, which
+    may be circular or triangular if appropriate based on the object's type,
+    or otherwise the bounds' own polygon."""
+    position_x = true_shape.center_x
+    position_z = true_shape.center_z
     true_poly = bounds.polygon_xz
     # Agents and "goal" objects may be circular rather than square.
-    if object_type in ROUND_TYPES:
-        center = shapely.geometry.Point(position['x'], position['z'])
+    if true_shape.object_type in ROUND_TYPES:
+        center = shapely.geometry.Point(position_x, position_z)
         circle = center.buffer(1.0)
         true_poly = shapely.affinity.scale(
             circle,
-            (dimensions['x'] / 2.0),
-            (dimensions['z'] / 2.0)
+            (true_shape.size_x / 2.0),
+            (true_shape.size_z / 2.0)
         )
         true_poly = shapely.affinity.rotate(
             true_poly,
-            -rotation['y'],
-            origin=(position['x'], position['z'])
+            -true_shape.rotation_y,
+            origin=(position_x, position_z)
         )
     # Currently only "key" objects are triangles.
-    if object_type == 'triangle':
-        back = position['z'] - (dimensions['z'] / 2.0)
-        front = position['z'] + (dimensions['z'] / 2.0)
-        left = position['x'] - (dimensions['x'] / 2.0)
-        right = position['x'] + (dimensions['x'] / 2.0)
+    if true_shape.object_type == 'triangle':
+        back = position_z - (true_shape.size_z / 2.0)
+        front = position_z + (true_shape.size_z / 2.0)
+        left = position_x - (true_shape.size_x / 2.0)
+        right = position_x + (true_shape.size_x / 2.0)
         # Assume that the triangle's Z rotation is 90, and its X rotation is 0.
         true_poly = shapely.geometry.Polygon([
             (left, front), (right, front), (right, back)
         ])
         true_poly = shapely.affinity.rotate(
             true_poly,
-            -rotation['y'],
-            origin=(position['x'], position['z'])
+            -true_shape.rotation_y,
+            origin=(position_x, position_z)
         )
-    return TrueObjectBounds(bounds=bounds, true_poly=true_poly)
+    return true_poly
 
 
 def _move_agent_past_lock_location(
@@ -2471,6 +2674,90 @@ def _remove_extraneous_object_show(
         mcs_object['shows'] = show_list
 
 
+def _retrieve_bounding_boxes(
+    bounds_list: List[Optional[TrueObjectBounds]]
+) -> np.ndarray:
+    """Return the (min X, min Z, max X, max Z) bounding box of each of the
+    given bounds' polygons (or NaN for None) as a Nx4 array."""
+    # Objects (like walls) and paused agents usually have the same bounds
+    # across many steps, so only find each distinct bounds' box once.
+    ids = np.fromiter(
+        map(id, bounds_list),
+        dtype=np.uint64,
+        count=len(bounds_list)
+    )
+    _, first_indexes, numbers = np.unique(
+        ids,
+        return_index=True,
+        return_inverse=True
+    )
+    boxes = np.array([
+        bounds_list[index].true_poly.bounds if bounds_list[index] else
+        (math.nan, math.nan, math.nan, math.nan)
+        for index in first_indexes.tolist()
+    ])
+    return boxes[numbers]
+
+
+def _find_overlapping_objects(
+    agent_object: SceneObject,
+    other_object_list: List[SceneObject],
+    trial_start: int,
+    trial_end: int,
+    object_to_boxes: Dict[int, np.ndarray]
+) -> Dict[int, List[str]]:
+    """Return the IDs of the other objects that overlap with the given agent
+    object at each step in the given range (see _do_objects_overlap), in the
+    order of the other object list. The agent, and each object, is skipped on
+    the steps it's hidden. Each other object's bounding boxes at each step are
+    cached in the given dict using its Python ID."""
+    object_list = [
+        other_object for other_object in other_object_list
+        if other_object['id'] != agent_object['id']
+    ]
+    if not object_list:
+        return {}
+    for other_object in object_list:
+        if id(other_object) not in object_to_boxes:
+            object_to_boxes[id(other_object)] = _retrieve_bounding_boxes(
+                other_object['debug']['boundsAtStep']
+            )
+
+    # Find each step and object at which the agent's bounding box intersects
+    # with the object's bounding box all at once, since the two can't overlap
+    # otherwise. Comparisons with NaN (if either is hidden) are always False.
+    step_slice = slice(trial_start, trial_end + 1)
+    agent_bounds_list = agent_object['debug']['boundsAtStep'][step_slice]
+    agent_boxes = _retrieve_bounding_boxes(agent_bounds_list)[:, None, :]
+    object_boxes = np.stack([
+        object_to_boxes[id(other_object)][step_slice]
+        for other_object in object_list
+    ], axis=1)
+    candidates = (
+        (agent_boxes[..., 0] <= object_boxes[..., 2]) &
+        (object_boxes[..., 0] <= agent_boxes[..., 2]) &
+        (agent_boxes[..., 1] <= object_boxes[..., 3]) &
+        (object_boxes[..., 1] <= agent_boxes[..., 3])
+    )
+
+    # Then check only those candidates using their polygons.
+    step_to_object_ids = {}
+    for index in np.flatnonzero(candidates.any(axis=1)).tolist():
+        step = trial_start + index
+        object_ids = [
+            object_list[object_index]['id'] for object_index
+            in np.flatnonzero(candidates[index]).tolist()
+            if _do_objects_overlap(
+                agent_bounds_list[index],
+                object_list[object_index]['debug']['boundsAtStep'][step],
+                step
+            )
+        ]
+        if object_ids:
+            step_to_object_ids[step] = object_ids
+    return step_to_object_ids
+
+
 def _remove_intersecting_agent_steps(
     agent_object_list: List[SceneObject],
     other_object_list: List[SceneObject]
@@ -2478,6 +2765,7 @@ def _remove_intersecting_agent_steps(
     """Remove each agent object's step that intersects with any goal object's
     location at that step, since sometimes the agent moves a little too close
     to the goal object."""
+    object_to_boxes = {}
     for agent_object in agent_object_list:
         trial_to_steps = agent_object['debug']['trialToSteps']
         agent_object['debug']['intersectingSteps'] = []
@@ -2486,39 +2774,33 @@ def _remove_intersecting_agent_steps(
             remove_step_list = []
             # Identify the steps of the trial.
             trial_start, trial_end = trial_to_steps[trial_index]
+            # Find all the intersections with other objects in the trial at
+            # once, using the agent's bounds after removing earlier steps.
+            step_to_object_ids = _find_overlapping_objects(
+                agent_object,
+                other_object_list,
+                trial_start,
+                trial_end,
+                object_to_boxes
+            )
             # Loop over each step, starting from the final step in the trial.
             for step in range(trial_end, trial_start - 1, -1):
-                agent_bounds = agent_object['debug']['boundsAtStep'][step]
-                # If the agent is hidden on this step, skip it.
-                if not agent_bounds:
-                    continue
-                agent_poly = agent_bounds.true_poly
-                # Look for intersections with other objects.
-                for other_object in other_object_list:
-                    if other_object['id'] == agent_object['id']:
-                        continue
-                    object_bounds = other_object['debug']['boundsAtStep'][step]
-                    # If the object is hidden on this step, skip it.
-                    if not object_bounds:
-                        continue
-                    intersection = _do_objects_overlap(
-                        agent_bounds,
-                        object_bounds,
-                        step
-                    )
-                    if not intersection:
-                        continue
+                for object_id in step_to_object_ids.get(step, []):
                     # If the agent intersects an object, remove this movement
                     # step, UNLESS it intersects with a wall in the middle of
                     # its movement, when it has one or more non-intersecting
                     # steps later (since this would cause the agent to jump).
-                    should_remove_this_step = True
-                    if other_object['id'].startswith('wall_'):
-                        for next_step in range(step + 1, trial_end + 1):
-                            if next_step not in remove_step_list:
-                                should_remove_this_step = False
-                                break
-                    if should_remove_this_step:
+                    # Each later step was already checked, so they were all
+                    # removed if the remove list has one for each later step.
+                    if (
+                        object_id.startswith('wall_') and
+                        len(remove_step_list) < (trial_end - step)
+                    ):
+                        continue
+                    if logger.isEnabledFor(logging.DEBUG):
+                        agent_poly = (
+                            agent_object['debug']['boundsAtStep'][step]
+                        ).true_poly
                         agent_center = list(agent_poly.centroid.coords)[0]
                         agent_center = (
                             round(agent_center[0], 4),
@@ -2527,10 +2809,10 @@ def _remove_intersecting_agent_steps(
                         logger.debug(
                             f'Removing {agent_center} '
                             f'at step {step} due to agent intersecting with '
-                            f'{other_object["id"]}'
+                            f'{object_id}'
                         )
-                        remove_step_list.append(step)
-                        break
+                    remove_step_list.append(step)
+                    break
             # Remove all the intersecting steps for this trial.
             agent_object['shows'] = [
                 show for show in agent_object['shows']
@@ -2547,6 +2829,9 @@ def _remove_intersecting_agent_steps(
                 last_step = show_step
 
         agent_object['debug']['intersectingSteps'].sort()
+        # This agent's bounds may have changed, if it's another agent's other
+        # object.
+        object_to_boxes.pop(id(agent_object), None)
 
 
 def _reposition_agents_away_from_paddle(
@@ -2666,12 +2951,13 @@ def _save_trials(trial_list: List[List[Dict[str, Any]]], filename_prefix: str):
                 output_file.write('\n')
 
 
-def _validate_trials(
-    trial_list: List[List[Dict[str, Any]]],
+def _collapse_final_trial(
+    trial_list: List[Any],
     filename_prefix: str,
     suffix: str
-) -> List[List[Dict[str, Any]]]:
-    """Fix some formatting issues in the NYU JSON scene files."""
+) -> List[Any]:
+    """Sometimes the frames of the final trial aren't in their own list, so
+    collapse them into a single trial."""
 
     logger.info(f'Found {len(trial_list)} trials...')
 
@@ -2686,31 +2972,208 @@ def _validate_trials(
     if len(trial_list) > 9:
         raise Exception(f'Too many trials in {filename_prefix}{suffix}')
 
-    # Sometimes frames (which are supposed to be dicts) are accidentally lists
-    # of frames instead, so just add all the nested frames to the trial.
+    return trial_list
+
+
+def _validate_trial_frames(
+    trial: List[Any],
+    trial_index: int,
+    filename_prefix: str,
+    suffix: str
+) -> List[Dict[str, Any]]:
+    """Sometimes frames (which are supposed to be dicts) are accidentally lists
+    of frames instead, so just add all the nested frames to the trial."""
+    new_trial = []
+    for frame_index, frame in enumerate(trial):
+        if isinstance(frame, dict):
+            new_trial.append(frame)
+        elif isinstance(frame, list):
+            logger.warn(
+                f'FRAME IS LIST {filename_prefix}{suffix} '
+                f'trial {trial_index + 1} frame {frame_index + 1} / '
+                f'{len(trial)}'
+            )
+            new_trial.extend(frame)
+        else:
+            # If it's not a dict or a list, something's wrong...
+            raise Exception(
+                f'FRAME IS {type(frame).__name__.upper()} '
+                f'{filename_prefix}{suffix} '
+                f'trial {trial_index + 1} frame {frame_index + 1} / '
+                f'{len(trial)}'
+            )
+    return new_trial
+
+
+def _validate_trials(
+    trial_list: List[List[Dict[str, Any]]],
+    filename_prefix: str,
+    suffix: str
+) -> List[List[Dict[str, Any]]]:
+    """Fix some formatting issues in the NYU JSON scene files."""
+
+    trial_list = _collapse_final_trial(trial_list, filename_prefix, suffix)
+
     for trial_index, trial in enumerate(trial_list):
-        new_trial = []
-        for frame_index, frame in enumerate(trial):
-            if isinstance(frame, dict):
-                new_trial.append(frame)
-            elif isinstance(frame, list):
-                logger.warn(
-                    f'FRAME IS LIST {filename_prefix}{suffix} '
-                    f'trial {trial_index + 1} frame {frame_index + 1} / '
-                    f'{len(trial)}'
+        trial_list[trial_index] = _validate_trial_frames(
+            trial,
+            trial_index,
+            filename_prefix,
+            suffix
+        )
+
+    return trial_list
+
+
+_JSON_WHITESPACE = re.compile(r'\s*')
+
+
+class _JsonListReader():
+    """Read a JSON list from a file one item at a time."""
+
+    def __init__(self, json_file: TextIO) -> None:
+        self._decoder = json.JSONDecoder()
+        self._file = json_file
+        self._buffer = ''
+        self._index = 0
+        self._end_of_file = False
+
+    def _read_more(self) -> None:
+        if self._end_of_file:
+            raise json.JSONDecodeError(
+                'Unexpected end of file',
+                self._buffer,
+                self._index
+            )
+        # Read at least as much as the unparsed data in the buffer, so big
+        # values don't take quadratic time to parse.
+        chunk = self._file.read(
+            max(JSON_READ_SIZE, len(self._buffer) - self._index)
+        )
+        self._buffer = self._buffer[self._index:] + chunk
+        self._index = 0
+        self._end_of_file = not chunk
+
+    def _peek(self) -> str:
+        # Return the next non-whitespace character.
+        while True:
+            self._index = _JSON_WHITESPACE.match(
+                self._buffer,
+                self._index
+            ).end()
+            if self._index < len(self._buffer):
+                return self._buffer[self._index]
+            self._read_more()
+
+    def _read_value(self) -> Any:
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(
+                    self._buffer,
+                    self._index
                 )
-                new_trial.extend(frame)
-            else:
-                # If it's not a dict or a list, something's wrong...
-                raise Exception(
-                    f'FRAME IS {type(frame).__name__.upper()} '
-                    f'{filename_prefix}{suffix} '
-                    f'trial {trial_index + 1} frame {frame_index + 1} / '
-                    f'{len(trial)}'
+                # A number at the end of the buffer may be only partially
+                # read (like "1.2" from "1.23"), so ensure the value is
+                # followed by a delimiter.
+                if self._end_of_file or (
+                    end < len(self._buffer) and
+                    self._buffer[end] in ',] \t\n\r'
+                ):
+                    self._index = end
+                    return value
+            except json.JSONDecodeError:
+                if self._end_of_file:
+                    raise
+            self._read_more()
+
+    def _read_list_or_value(self) -> Any:
+        if self._peek() == '[':
+            return list(self.iterate_list())
+        return self._read_value()
+
+    def iterate_list(self, nested: bool = False) -> Iterator[Any]:
+        """Yield each item in the next JSON list. If nested, each item that's
+        a list is also read one item at a time."""
+        if self._peek() != '[':
+            raise json.JSONDecodeError(
+                'Expecting JSON list',
+                self._buffer,
+                self._index
+            )
+        self._index += 1
+        if self._peek() == ']':
+            self._index += 1
+            return
+        while True:
+            yield self._read_list_or_value() if nested else self._read_value()
+            char = self._peek()
+            self._index += 1
+            if char == ']':
+                return
+            if char != ',':
+                raise json.JSONDecodeError(
+                    "Expecting ',' delimiter",
+                    self._buffer,
+                    self._index - 1
                 )
-        trial_list[trial_index] = new_trial
 
-    return trial_list
+
+def _iterate_json_list(json_file: TextIO) -> Iterator[Any]:
+    """Yield each item in the JSON list in the given file, one at a time, so
+    that (unlike json.load) the whole file is never in memory at once. Each
+    item that's a list (like a trial) is also read one item (frame) at a time.
+    """
+    return _JsonListReader(json_file).iterate_list(nested=True)
+
+
+def read_trial_list(
+    json_filename: str,
+    filename_prefix: str,
+    suffix: str
+) -> List[List[Dict[str, Any]]]:
+    """Read the trials from the given NYU JSON scene file, and return the list
+    of frames in each trial that we want to keep in the final MCS scene. The
+    file is parsed one trial at a time, and each trial's extraneous frames are
+    removed as soon as it's read, so the whole file is never in memory."""
+    trial_list = []
+    converted = []
+    # Parsing one frame at a time keeps many new objects (never cyclic) in
+    # memory, which would trigger lots of slow full garbage collections.
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        with open(json_filename) as json_file:
+            for item in _iterate_json_list(json_file):
+                # The first 8 trials are never collapsed into the final trial
+                # (see _collapse_final_trial) so convert them now.
+                is_trial = len(trial_list) < 8 and isinstance(item, list)
+                if is_trial:
+                    item = _create_trial_frame_list(_validate_trial_frames(
+                        item,
+                        len(trial_list),
+                        filename_prefix,
+                        suffix
+                    ), len(trial_list))
+                trial_list.append(item)
+                converted.append(is_trial)
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+    trial_list = _collapse_final_trial(trial_list, filename_prefix, suffix)
+
+    return [
+        trial if converted[trial_index] else _create_trial_frame_list(
+            _validate_trial_frames(
+                trial,
+                trial_index,
+                filename_prefix,
+                suffix
+            ),
+            trial_index
+        ) for trial_index, trial in enumerate(trial_list)
+    ]
 
 
 def convert_scene_pair(
@@ -2726,9 +3189,6 @@ def convert_scene_pair(
     """Create and return the pair of MCS scenes using the given templates
     and trial lists from the JSON file data."""
 
-    # Ignore untrained for now.
-    untrained = False
-
     trial_list_expected = _validate_trials(
         trial_list_expected,
         filename_prefix,
@@ -2746,6 +3206,81 @@ def convert_scene_pair(
         _create_trial_frame_list(trial, index) for index, trial
         in enumerate(trial_list_expected)
     ]
+    converted_trial_list_unexpected = [
+        _create_trial_frame_list(trial, index) for index, trial
+        in enumerate(trial_list_unexpected)
+    ] if trial_list_unexpected else None
+
+    return _convert_trial_list_pair(
+        starter_scene,
+        goal_template,
+        converted_trial_list_expected,
+        converted_trial_list_unexpected,
+        filename_prefix,
+        role_to_type,
+        untrained,
+        occluder_mode
+    )
+
+
+def convert_scene_pair_files(
+    starter_scene: Dict[str, Any],
+    goal_template: Goal,
+    json_filename_expected: str,
+    json_filename_unexpected: Optional[str],
+    filename_prefix: str,
+    role_to_type: Dict[str, str],
+    untrained: bool,
+    occluder_mode: OccluderMode = OccluderMode.NONE
+) -> List[Dict[str, Any]]:
+    """Create and return the pair of MCS scenes using the given templates
+    and NYU JSON scene files (the unexpected file is optional). Each file is
+    read one trial at a time (see read_trial_list)."""
+
+    logger.info(
+        f'Reading expected agent scene JSON file: {json_filename_expected}'
+    )
+    converted_trial_list_expected = read_trial_list(
+        json_filename_expected,
+        filename_prefix,
+        'e'
+    )
+    converted_trial_list_unexpected = None
+    if json_filename_unexpected:
+        logger.info(
+            f'Reading unexpected agent scene JSON file: '
+            f'{json_filename_unexpected}'
+        )
+        converted_trial_list_unexpected = read_trial_list(
+            json_filename_unexpected,
+            filename_prefix,
+            'u'
+        )
+
+    return _convert_trial_list_pair(
+        starter_scene,
+        goal_template,
+        converted_trial_list_expected,
+        converted_trial_list_unexpected,
+        filename_prefix,
+        role_to_type,
+        untrained,
+        occluder_mode
+    )
+
+
+def _convert_trial_list_pair(
+    starter_scene: Dict[str, Any],
+    goal_template: Goal,
+    converted_trial_list_expected: List[List[Dict[str, Any]]],
+    converted_trial_list_unexpected: Optional[List[List[Dict[str, Any]]]],
+    filename_prefix: str,
+    role_to_type: Dict[str, str],
+    untrained: bool,
+    occluder_mode: OccluderMode
+) -> List[Dict[str, Any]]:
+    # Ignore untrained for now.
+    untrained = False
 
     if SAVE_TRIALS_TO_FILE:
         _save_trials(
@@ -2806,12 +3341,8 @@ def convert_scene_pair(
     scenes = [scene_expected]
 
     # Training datasets will not have any unexpected scenes.
-    if trial_list_unexpected:
+    if converted_trial_list_unexpected:
         logger.info('Generating unexpected MCS agent scene from JSON data')
-        converted_trial_list_unexpected = [
-            _create_trial_frame_list(trial, index) for index, trial
-            in enumerate(trial_list_unexpected)
-        ]
         if SAVE_TRIALS_TO_FILE:
             _save_trials(
                 converted_trial_list_unexpected,
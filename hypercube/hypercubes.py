@@ -3,7 +3,7 @@ import math
 import random
 import uuid
 from abc import ABC, abstractmethod
-from typing import Any, Callable, Dict, List
+from typing import Any, Callable, Dict, Iterator, List
 
 from machine_common_sense.config_manager import Goal
 
@@ -439,11 +439,26 @@ class HypercubeFactory(ABC):
         sort_data=False
     ) -> List[Hypercube]:
         """Create and return a new list of hypercubes built by this factory."""
+        return list(self.iterate_hypercubes(
+            total,
+            starter_scene_function,
+            role_to_type,
+            throw_error,
+            sort_data
+        ))
+
+    def iterate_hypercubes(
+        self,
+        total: str,
+        starter_scene_function: Callable[[], Scene],
+        role_to_type: Dict[str, str],
+        throw_error=False,
+        sort_data=False
+    ) -> Iterator[Hypercube]:
+        """Create and yield new hypercubes built by this factory, one at a
+        time, so each is only built when it's needed."""
         # Save this now in case it's used by a hypercube factory subclass.
         self.role_to_type = role_to_type
 
-        hypercubes = []
         for count in range(1, total + 1):
-            hypercube = self._build(starter_scene_function())
-            hypercubes.append(hypercube)
-        return hypercubes
+            yield self._build(starter_scene_function())
@@ -145,7 +145,25 @@ def load_movement_from_json_file():
     )
 
 
-MOVEMENT = load_movement_from_json_file()
+_MOVEMENT = None
+
+
+def get_movement() -> SimpleNamespace:
+    """Return all of the movement data, loading it from its JSON file on first
+    use (rather than on import, which is slow)."""
+    global _MOVEMENT
+    if not _MOVEMENT:
+        _MOVEMENT = load_movement_from_json_file()
+    return _MOVEMENT
+
+
+def __getattr__(name: str) -> Any:
+    # Support the old MOVEMENT global property, now loaded on first use.
+    if name == 'MOVEMENT':
+        return get_movement()
+    raise AttributeError(
+        f'module {__name__!r} has no attribute {name!r}'
+    )
 
 
 def adjust_movement_to_position(
@@ -479,11 +497,13 @@ class IntuitivePhysicsHypercube(Hypercube, ABC):
         # Round the Z position because we're using it as a dict key.
         position_z = round(position['z'], 2)
 
+        movement = get_movement()
+
         # Randomly try each available move-and-exit-the-screen movement.
-        move_exit_index_list = list(range(len(MOVEMENT.MOVE_EXIT_LIST)))
+        move_exit_index_list = list(range(len(movement.MOVE_EXIT_LIST)))
         random.shuffle(move_exit_index_list)
         for index in move_exit_index_list:
-            move_exit = MOVEMENT.MOVE_EXIT_LIST[index]
+            move_exit = movement.MOVE_EXIT_LIST[index]
             # If more than one movement is needed, and the Z position isn't in
             # the option list, then this movement won't work, so skip it.
             if (
@@ -513,10 +533,10 @@ class IntuitivePhysicsHypercube(Hypercube, ABC):
             # Ensure that both roll-across-linearly-in-depth movements have the
             # same direction as in the original movement.
             deep_exit = copy.deepcopy(
-                MOVEMENT.DEEP_EXIT_LIST[option['deepExit']]
+                movement.DEEP_EXIT_LIST[option['deepExit']]
             ) if self._does_have_deep_move() else None
             deep_stop = copy.deepcopy(
-                MOVEMENT.DEEP_STOP_LIST[option['deepStop']]
+                movement.DEEP_STOP_LIST[option['deepStop']]
             ) if (
                 self._does_have_stop_move() and
                 self._does_have_deep_move()
@@ -552,7 +572,7 @@ class IntuitivePhysicsHypercube(Hypercube, ABC):
             # camera's view. (This should already be done in the
             # generate_movement.py script but check again just in case!)
             toss_stop = adjust_movement_to_position(
-                copy.deepcopy(MOVEMENT.TOSS_STOP_LIST[option['tossStop']]),
+                copy.deepcopy(movement.TOSS_STOP_LIST[option['tossStop']]),
                 position,
                 left_side
             ) if (
@@ -604,12 +624,12 @@ class IntuitivePhysicsHypercube(Hypercube, ABC):
                 ),
                 'deepExit': deep_exit,
                 'tossExit': adjust_movement_to_position(
-                    copy.deepcopy(MOVEMENT.TOSS_EXIT_LIST[option['tossExit']]),
+                    copy.deepcopy(movement.TOSS_EXIT_LIST[option['tossExit']]),
                     position,
                     left_side
                 ) if self._does_have_toss_move() else None,
                 'moveStop': adjust_movement_to_position(
-                    copy.deepcopy(MOVEMENT.MOVE_STOP_LIST[option['moveStop']]),
+                    copy.deepcopy(movement.MOVE_STOP_LIST[option['moveStop']]),
                     position,
                     left_side
                 ) if self._does_have_stop_move() else None,
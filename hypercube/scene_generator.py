@@ -1,17 +1,30 @@
 #!/usr/bin/env python3
 
 import argparse
+import collections
+import contextlib
 import copy
 import logging
+import multiprocessing
 import os
 import os.path
 import random
-from typing import Any, Dict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 from machine_common_sense.logging_config import LoggingConfig
 
-from generator import MAX_TRIES, Scene, SceneException, materials, tags
-from generator.scene_saver import find_next_filename, save_scene_files
+from generator import (
+    MAX_TRIES,
+    Scene,
+    SceneException,
+    definitions,
+    materials,
+    tags
+)
+from generator.scene_saver import SceneWriter, find_next_filename
+
+from .hypercubes import Hypercube
 
 STARTER_SCENE = Scene(
     version=2,
@@ -25,6 +38,110 @@ STARTER_SCENE = Scene(
 )
 
 
+def _init_logging(log_level: str) -> None:
+    """Initialize logging to the console with the given log level."""
+    cfg = LoggingConfig.get_configurable_logging_config(
+        log_level=log_level,
+        logger_names=['hypercube', 'generator', 'secret'],
+        console=True, debug_file=False, info_file=False,
+        log_file_name="hypercube", file_format='precise',
+        console_format='precise'
+    )
+    LoggingConfig.init_logging(log_config=cfg)
+
+
+def _init_worker(log_level: str, dataset_shuffle_seed: int) -> None:
+    """Initialize a worker process in the hypercube generation pool. Each
+    worker is a freshly spawned process, so it must shuffle its own datasets
+    the same way as the main process."""
+    _init_logging(log_level)
+    definitions.DATASET_SHUFFLE_SEED = dataset_shuffle_seed
+
+
+def _generate_hypercube_scenes(
+    hypercube: Hypercube,
+    seed: int,
+    type_name: str,
+    sort_hypercube: bool,
+    stop_on_error: bool
+) -> Tuple[Optional[List[Scene]], List[str]]:
+    """Generate the given hypercube's scenes using the given random seed,
+    retrying up to MAX_TRIES times, and randomly shuffle them (unless sorted).
+    Return the scenes (or None if every try failed) and the info of each
+    failed try."""
+    logger = logging.getLogger(__name__)
+    random.seed(seed)
+    scenes = None
+    failed_info = []
+    for try_index in range(MAX_TRIES + 1):
+        try:
+            scenes = hypercube.generate_scenes()
+            break
+        except (
+            SceneException,
+            RuntimeError,
+            TypeError,
+            ValueError,
+            ZeroDivisionError
+        ) as e:
+            if stop_on_error:
+                raise e from e
+            logger.exception(f'Failed to make a {type_name} hypercube')
+            info = hypercube.get_info()
+            if info and info not in failed_info:
+                failed_info.append(info)
+
+    # Randomly shuffle the scenes.
+    if scenes and not sort_hypercube:
+        random.shuffle(scenes)
+    return scenes, failed_info
+
+
+def _iterate_results(
+    function: Callable[..., Any],
+    args_iterator: Iterator[Tuple],
+    workers: int,
+    initargs: Tuple = ()
+) -> Iterator[Any]:
+    """Call the given function with each args tuple from the given iterator,
+    and yield each result in order. With more than one worker, the calls are
+    made in worker processes (each initialized by _init_worker with the given
+    initargs), up to twice as many calls as workers at once, so only the next
+    few args are taken from the iterator at a time. If the caller stops early,
+    any calls not yet started are cancelled."""
+    if workers <= 1:
+        for args in args_iterator:
+            # Don't let the function's use of the random module change the
+            # random state used to make the next args.
+            random_state = random.getstate()
+            result = function(*args)
+            random.setstate(random_state)
+            yield result
+        return
+
+    # Use spawn (rather than fork) like the ILE, so no process-global state is
+    # shared with the workers.
+    executor = ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context('spawn'),
+        initializer=_init_worker,
+        initargs=initargs
+    )
+    pending = collections.deque()
+    try:
+        for args in args_iterator:
+            pending.append(executor.submit(function, *args))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        # Python 3.8 doesn't support shutdown(cancel_futures=True).
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
+
+
 class SceneGenerator():
     excluded_materials = []
 
@@ -67,7 +184,8 @@ class SceneGenerator():
         eval_name: str,
         sort_hypercube: bool,
         stop_on_error: bool,
-        role_to_type: Dict[str, str]
+        role_to_type: Dict[str, str],
+        workers: int = 1
     ) -> None:
         logger = logging.getLogger(__name__)
 
@@ -84,82 +202,91 @@ class SceneGenerator():
         if not hypercube_factory:
             raise ValueError(f'Failed to find {type_name} hypercube factory')
 
-        # Create all of the needed hypercubes.
-        hypercubes = hypercube_factory.generate_hypercubes(
+        # Lazily create each of the needed hypercubes, each with its own
+        # random seed, so its scenes don't depend on the number of workers.
+        # Every process must also shuffle its datasets the same way.
+        definitions.DATASET_SHUFFLE_SEED = random.getrandbits(32)
+        hypercubes = hypercube_factory.iterate_hypercubes(
             total,
             self.generate_starter_scene,
             role_to_type,
             stop_on_error,
             sort_hypercube
         )
+        tasks = (
+            (hypercube, random.getrandbits(32), type_name, sort_hypercube,
+             stop_on_error)
+            for hypercube in hypercubes
+        )
 
-        logger.info(f'Generating {len(hypercubes)} {type_name} hypercubes')
-        index = -1
+        logger.info(
+            f'Generating {total} {type_name} hypercubes'
+            + (f' using {workers} worker processes' if workers > 1 else '')
+        )
         hypercube_index = 1
         failed_info = []
         count = 0
-        for index, hypercube in enumerate(hypercubes):
-            # Identify the next available file name index.
-            base_filename, hypercube_index = find_next_filename(
-                f'{prefix}_',
-                hypercube_index,
-                '04',
-                suffix='_01.json'
+        # Save the scene files in the background (in worker processes too, if
+        # generating the scenes in worker processes), while the next scenes
+        # are generated. On exit, wait for every scene to be saved.
+        results = _iterate_results(
+            _generate_hypercube_scenes,
+            tasks,
+            workers,
+            (
+                logging.getLevelName(logger.getEffectiveLevel()),
+                definitions.DATASET_SHUFFLE_SEED
             )
-
-            # Create and retrieve all of the scenes from this hypercubes.
-            scenes = None
-            for try_index in range(MAX_TRIES + 1):
-                try:
-                    scenes = hypercube.generate_scenes()
-                    break
-                except (
-                    SceneException,
-                    RuntimeError,
-                    TypeError,
-                    ValueError,
-                    ZeroDivisionError
-                ) as e:
-                    if stop_on_error:
-                        raise e from e
-                    logger.exception(f'Failed to make a {type_name} hypercube')
-                    info = hypercube.get_info()
-                    if info and info not in failed_info:
+        )
+        with SceneWriter(
+            workers=workers,
+            processes=(workers > 1)
+        ) as scene_writer, contextlib.closing(results):
+            for scenes, hypercube_failed_info in results:
+                for info in hypercube_failed_info:
+                    if info not in failed_info:
                         failed_info.append(info)
 
-            if not scenes:
-                logger.warn('Skipping hypercube...')
-                continue
-
-            # Randomly shuffle the scenes.
-            if not sort_hypercube:
-                random.shuffle(scenes)
+                if not scenes:
+                    logger.warn('Skipping hypercube...')
+                    continue
 
-            for scene_index, scene in enumerate(scenes):
-                filename, scene_index = find_next_filename(
-                    f'{base_filename}_',
-                    scene_index + 1,
-                    '02'
+                # Identify the next available file name index.
+                base_filename, hypercube_index = find_next_filename(
+                    f'{prefix}_',
+                    hypercube_index,
+                    '04',
+                    suffix='_01.json'
                 )
 
-                scene.debug['hypercubeNumber'] = hypercube_index
-                scene.debug['sceneNumber'] = scene_index
-                scene.debug['evaluation'] = eval_name
-                scene.debug['training'] = hypercube_factory.training
+                for scene_index, scene in enumerate(scenes):
+                    filename, scene_index = find_next_filename(
+                        f'{base_filename}_',
+                        scene_index + 1,
+                        '02'
+                    )
 
-                save_scene_files(
-                    scene,
-                    filename,
-                    no_scene_id=bool(eval_name)
-                )
+                    scene.debug['hypercubeNumber'] = hypercube_index
+                    scene.debug['sceneNumber'] = scene_index
+                    scene.debug['evaluation'] = eval_name
+                    scene.debug['training'] = hypercube_factory.training
 
-            count += 1
-            logger.info(
-                f'Saved {type_name} hypercube {count} / {total} '
-                f'({len(scenes)} scenes): {base_filename}'
-            )
-            if count == total:
-                break
+                    scene_writer.submit(
+                        scene,
+                        filename,
+                        no_scene_id=bool(eval_name)
+                    )
+
+                # The files may not be saved yet, so start the next search
+                # after this hypercube's index.
+                hypercube_index += 1
+                count += 1
+                logger.info(
+                    f'Saved {type_name} hypercube {count} / {total} '
+                    f'({len(scenes)} scenes): {base_filename}'
+                )
+                if count == total:
+                    break
 
         logger.info(f'Finished {count} {type_name} hypercubes')
 
@@ -210,6 +337,14 @@ class SceneGenerator():
             default=False,
             action='store_true',
             help='Stop if an error occurs [default=False]')
+        parser.add_argument(
+            '-w',
+            '--workers',
+            type=int,
+            default=1,
+            help='Number of worker processes to generate hypercubes; each '
+            'hypercube uses its own random seed, so output does not depend on '
+            'the number of workers [default=1]')
         parser.add_argument(
             '-l',
             '--loglevel',
@@ -270,14 +405,7 @@ class SceneGenerator():
         args = parser.parse_args(argv[1:])
         random.seed(args.seed)
 
-        cfg = LoggingConfig.get_configurable_logging_config(
-            log_level=args.loglevel or 'INFO',
-            logger_names=['hypercube', 'generator', 'secret'],
-            console=True, debug_file=False, info_file=False,
-            log_file_name="hypercube", file_format='precise',
-            console_format='precise'
-        )
-        LoggingConfig.init_logging(log_config=cfg)
+        _init_logging(args.loglevel or 'INFO')
 
         role_to_type = {}
         role_to_type[tags.ROLES.AGENT] = args.agent
@@ -298,5 +426,6 @@ class SceneGenerator():
             args.eval,
             args.sort_hypercube,
             args.stop_on_error,
-            role_to_type
+            role_to_type,
+            args.workers
         )
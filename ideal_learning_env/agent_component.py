@@ -10,7 +10,11 @@ from generator.agents import (
 
 from .agent_service import DEFAULT_TEMPLATE_AGENT_MOVEMENT, AgentConfig
 from .choosers import choose_counts, choose_random
-from .components import ILEComponent
+from .components import (
+    DelayedActionLabels,
+    ILEComponent,
+    find_delayed_action_labels
+)
 from .decorators import ile_config_setter
 from .defs import ILEDelayException, find_bounds, return_list
 from .feature_creation_service import FeatureCreationService, FeatureTypes
@@ -116,7 +120,11 @@ class SpecificAgentComponent(ILEComponent):
         self._delayed_templates = []
         if delayed:
             bounds = find_bounds(scene)
-            for template, _ in delayed:
+            for template, error in delayed:
+                # Skip the templates still waiting for their labels.
+                if not find_delayed_action_labels(error).is_ready():
+                    self._delayed_templates.append((template, error))
+                    continue
                 try:
                     FeatureCreationService.create_feature(
                         scene, FeatureTypes.AGENT, template, bounds)
@@ -124,6 +132,12 @@ class SpecificAgentComponent(ILEComponent):
                     self._delayed_templates.append((template, e))
         return scene
 
+    def get_delayed_action_labels(self) -> List[DelayedActionLabels]:
+        return [
+            find_delayed_action_labels(err, template)
+            for template, err in self._delayed_templates
+        ]
+
     def get_delayed_action_error_strings(self) -> List[str]:
         return [str(err) for _, err in self._delayed_templates]
 
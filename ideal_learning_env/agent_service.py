@@ -443,7 +443,8 @@ class AgentCreationService(BaseObjectCreationService):
         if not object_idl:
             raise ILEDelayException(
                 f'Cannot find object_label={reconciled.pointing.object_label} '
-                f'for agent pointing configuration.'
+                f'for agent pointing configuration.',
+                labels=reconciled.pointing.object_label
             )
         # Rotate the agent to face the configured object.
         agent_position = agent['shows'][0]['position']
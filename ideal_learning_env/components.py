@@ -1,8 +1,47 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, get_type_hints
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, get_type_hints
 
 from generator.scene import Scene
 
+from .defs import return_list
+from .object_services import ObjectRepository
+
+
+@dataclass
+class DelayedActionLabels():
+    """The labels of a delayed action of an ILE component: the needed labels
+    that it's waiting for (it may be able to run once an object with any one
+    of them exists), or None if it's waiting for something else, and the
+    labels that it's configured to give its new objects (used to explain
+    circular dependencies; it may give its objects other labels too)."""
+    needed: Optional[List[str]] = None
+    provided: List[str] = field(default_factory=list)
+
+    def is_ready(self) -> bool:
+        """Return whether this action may be able to run now: whether it's
+        waiting for something other than labels, or an object with one of
+        its needed labels exists."""
+        if self.needed is None:
+            return True
+        object_repository = ObjectRepository.get_instance()
+        return any(object_repository.has_label(label) for label in self.needed)
+
+
+def find_delayed_action_labels(
+    error: Exception,
+    template: Any = None
+) -> DelayedActionLabels:
+    """Return the labels of a delayed action using the exception that delayed
+    it (see ILEDelayException) and its config template, if any."""
+    return DelayedActionLabels(
+        needed=getattr(error, 'labels', None),
+        provided=[
+            label for label in return_list(getattr(template, 'labels', None))
+            if isinstance(label, str)
+        ]
+    )
+
 
 class ILEComponent(ABC):
     """Manages a specific subset of ILE config file properties by reading and
@@ -41,6 +80,15 @@ class ILEComponent(ABC):
         """
         return scene
 
+    def get_delayed_action_labels(self) -> List[DelayedActionLabels]:
+        """Returns the labels of each of the component's delayed actions, so
+        they're only run again once they may be able to succeed. By default,
+        no delayed action is waiting for labels."""
+        return [
+            DelayedActionLabels()
+            for _ in range(self.get_num_delayed_actions())
+        ]
+
     def get_delayed_action_error_strings(self) -> List[str]:
         """Called when the system is unable to execute any delayed actions and"
         " must quit.  These strings help the user identify and solve the root"
@@ -32,8 +32,19 @@ class ILEException(Exception):
 
 class ILEDelayException(ILEException):
     """Exception to indicate that the current action may be able to be
-    performed after another component completes its actions."""
-    ...
+    performed after another component completes its actions. If the action is
+    waiting for an object with one of some specific labels to exist, give
+    those labels, so the action is only attempted again once one exists."""
+
+    def __init__(
+        self,
+        message: str = '',
+        labels: Union[str, List[str]] = None
+    ):
+        super().__init__(message)
+        self.labels = [
+            label for label in return_list(labels) if label
+        ] or None
 
 
 class ILEConfigurationException(ILEException):
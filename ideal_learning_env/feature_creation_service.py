@@ -21,6 +21,7 @@ from .defs import (
     RandomizableString,
     return_list
 )
+from . import profiler
 from .numerics import RandomizableInt
 from .object_services import (
     InstanceDefinitionLocationTuple,
@@ -114,6 +115,8 @@ class BaseObjectCreationService(ABC):
     _default_template: BaseFeatureConfig = None
     _type = None
     _last_exception = None
+    # Why is_valid last returned False, for profiling (see add_to_scene).
+    _rejection_reason = None
     bounds = []
 
     def _get_type(self) -> str:
@@ -127,8 +130,24 @@ class BaseObjectCreationService(ABC):
         """Attempts to add object/feature to a scene using template if
         provided.  Returns a list of instances and the reconciled template"""
         self.bounds = bounds
+        name = type(self).__name__
+        with profiler.timer('creationServices', name):
+            return self._add_to_scene_with_tries(
+                scene,
+                source_template,
+                bounds,
+                tries,
+                name
+            )
+
+    def _add_to_scene_with_tries(self, scene: Scene,
+                                 source_template: BaseFeatureConfig,
+                                 bounds: List, tries: int, name: str
+                                 ) -> tuple(List, BaseFeatureConfig):
         # TODO handle retries for loop or tenacity?
         for i in range(tries):
+            profiler.count('placementAttempts', name)
+            self._rejection_reason = None
             try:
                 reconciled = self.reconcile(scene, source_template)
                 instance = self.create_feature_from_specific_values(
@@ -140,13 +159,21 @@ class BaseObjectCreationService(ABC):
                     self._on_valid_instances(scene, reconciled, insts)
                     return insts, reconciled
                 else:
+                    profiler.count(
+                        'rejections',
+                        name,
+                        self._rejection_reason or 'invalid'
+                    )
                     logger.trace(f"Invalid feature:\nreconciled={reconciled}"
                                  f"\nsource={source_template}")
             except ILEDelayException as delay:
+                profiler.count('rejections', name, type(delay).__name__)
                 raise delay from delay
             except ILEConfigurationException as conf:
+                profiler.count('rejections', name, type(conf).__name__)
                 raise conf from conf
             except Exception as e:
+                profiler.count('rejections', name, type(e).__name__)
                 logger.debug(
                     f"Error adding feature {self._get_type()} ",
                     exc_info=e)
@@ -221,10 +248,12 @@ class BaseObjectCreationService(ABC):
     def is_valid(self, scene, new_obj, bounds, try_num, retries):
         valid = False
         if not new_obj or None in new_obj:
+            self._rejection_reason = 'noInstance'
             return False
         if validate_all_locations_and_update_bounds(new_obj, scene, bounds):
             valid = True
         else:
+            self._rejection_reason = 'invalidLocation'
             # Checks if enabled for TRACE logging.
             if logger.isEnabledFor(logging.TRACE):
                 debug_bounds = [{
@@ -392,7 +421,8 @@ def position_relative_to(
         if not found_label:
             raise ILEDelayException(
                 f'Cannot find relative object label {relative_labels} to '
-                f'position a new {debug_str}'
+                f'position a new {debug_str}',
+                labels=relative_labels
             )
 
     return position_x, position_z
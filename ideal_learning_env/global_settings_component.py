@@ -1370,10 +1370,7 @@ class GlobalSettingsComponent(ILEComponent):
         # Look for all viable targets on both the left and the right.
         left_group = []
         right_group = []
-        for instance in scene.objects:
-            # Skip this object if it is not the target type.
-            if instance['type'] != target_type:
-                continue
+        for instance in scene.get_objects_by_type(target_type):
             # Skip this object if it moves upward (assume it is picked up
             # by a placer and held out-of-reach indefinitely).
             movement = instance.get('moves')
@@ -257,7 +257,8 @@ class ToolCreationService(BaseObjectCreationService):
             if not idl:
                 raise ILEDelayException(
                     f'Cannot find object with one of the following labels for '
-                    f'tool to align_with: {source_template.align_with}'
+                    f'tool to align_with: {source_template.align_with}',
+                    labels=align_with
                 )
             # By default, position this tool to the left of (-X) the other
             # object (wheeled toys like cars with a Y rotation of 0 face toward
@@ -942,7 +943,8 @@ def create_user_configured_interactable_object(
                 'identical_except_color'
             )
             raise ILEDelayException(
-                f"Failed to find object with {prop} label: {obj_label}"
+                f"Failed to find object with {prop} label: {obj_label}",
+                labels=obj_label
             )
 
         object_config.shape = obj_to_use.definition.type
@@ -1048,7 +1050,7 @@ def create_surrounding_lava_positions(scene, instance, lava_size=1,
     # We're not actually putting the lava in the scene
     # until we determine that the object in the middle
     # is valid and can be placed in the scene
-    scene_copy = copy.deepcopy(scene)
+    scene_copy = scene.overlay()
     bounds_copy = find_bounds(scene).copy()
     object_to_add = instance['shows'][0]['boundingBox']
     bounds_copy.append(object_to_add)
@@ -31,7 +31,11 @@ from .choosers import (
     choose_random,
     choose_rotation
 )
-from .components import ILEComponent
+from .components import (
+    DelayedActionLabels,
+    ILEComponent,
+    find_delayed_action_labels
+)
 from .decorators import ile_config_setter
 from .defs import (
     ILEDelayException,
@@ -214,17 +218,35 @@ class SpecificInteractableObjectsComponent(ILEComponent):
         self._delayed_separate_lids = []
         tool_templates = self._delayed_tools
         self._delayed_tools = []
-        # Try running the delayed actions again.
-        for _, template, num in templates:
+        # Try running the delayed actions again, except for the ones still
+        # waiting for their labels.
+        for data in templates:
+            if not find_delayed_action_labels(data[0]).is_ready():
+                self._delayed_templates.append(data)
+                continue
+            _, template, num = data
             self._add_objects_from_template(scene, bounds, template, num)
-        for _, instance, separate_lid, separate_lid_after in separate_lids:
-            self._add_separate_lid(
-                scene,
-                instance,
-                separate_lid,
-                separate_lid_after
-            )
-        for _, tool_template, num in tool_templates:
+        for data in separate_lids:
+            if not find_delayed_action_labels(data[0]).is_ready():
+                self._delayed_separate_lids.append(data)
+                continue
+            _, instance, separate_lid, separate_lid_after = data
+            try:
+                self._add_separate_lid(
+                    scene,
+                    instance,
+                    separate_lid,
+                    separate_lid_after
+                )
+            except ILEDelayException as e:
+                self._delayed_separate_lids.append(
+                    (e, instance, separate_lid, separate_lid_after)
+                )
+        for data in tool_templates:
+            if not find_delayed_action_labels(data[0]).is_ready():
+                self._delayed_tools.append(data)
+                continue
+            _, tool_template, num = data
             self._add_tools_from_template(scene, bounds, tool_template, num)
         return scene
 
@@ -235,6 +257,17 @@ class SpecificInteractableObjectsComponent(ILEComponent):
             len(self._delayed_tools)
         )
 
+    def get_delayed_action_labels(self) -> List[DelayedActionLabels]:
+        # The separate lids belong to existing objects, so they don't provide
+        # any labels.
+        return [
+            find_delayed_action_labels(data[0], data[1])
+            for data in self._delayed_templates + self._delayed_tools
+        ] + [
+            find_delayed_action_labels(data[0])
+            for data in self._delayed_separate_lids
+        ]
+
     def get_delayed_action_error_strings(self) -> List[str]:
         delayed = (
             self._delayed_templates + self._delayed_separate_lids +
@@ -668,13 +701,23 @@ class RandomKeywordObjectsComponent(ILEComponent):
         bounds = find_bounds(scene)
         actions = self._delayed_actions
         self._delayed_actions = []
-        for keyword, index, template, _ in actions:
+        for keyword, index, template, error in actions:
+            # Skip the objects still waiting for their labels.
+            if not find_delayed_action_labels(error).is_ready():
+                self._delayed_actions.append((keyword, index, template, error))
+                continue
             self._add_object_to_scene(keyword, scene, bounds, index, template)
         return scene
 
     def get_num_delayed_actions(self) -> bool:
         return len(self._delayed_actions)
 
+    def get_delayed_action_labels(self) -> List[DelayedActionLabels]:
+        return [
+            find_delayed_action_labels(err, template)
+            for _, _, template, err in self._delayed_actions
+        ]
+
     def get_delayed_action_error_strings(self) -> List[str]:
         return [str(err) for _, _, _, err in self._delayed_actions]
 
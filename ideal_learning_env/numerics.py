@@ -1,6 +1,6 @@
 import random
 from dataclasses import dataclass
-from typing import List, Union
+from typing import List, Tuple, Union
 
 from machine_common_sense.config_manager import Vector3d
 
@@ -143,13 +143,13 @@ def retrieve_all_choices(choices: Union[int, float, List, MinMax]) -> List:
     return [choices]
 
 
-def retrieve_all_vectors(
+def retrieve_all_vector_tuples(
     vectors: List[Union[VectorIntConfig, VectorFloatConfig]]
-) -> List[Vector3d]:
-    """Returns the list of all possible vectors for the given vector
-    configurations. Rounds all floats in expanded MinMaxFloats to one decimal
-    place."""
-    outputs = []
+) -> List[Tuple[Union[int, float], Union[int, float], Union[int, float]]]:
+    """Returns the sorted list of all possible vectors for the given vector
+    configurations as (x, y, z) tuples, without making a Vector3d for each
+    one. Rounds all floats in expanded MinMaxFloats to one decimal place."""
+    outputs = set()
     for vector in return_list(vectors):
         x_choices = retrieve_all_choices(vector.x)
         y_choices = retrieve_all_choices(vector.y)
@@ -157,11 +157,20 @@ def retrieve_all_vectors(
         for x_choice in x_choices:
             for y_choice in y_choices:
                 for z_choice in z_choices:
-                    outputs.append((x_choice, y_choice, z_choice))
-    return sorted(
-        [Vector3d(x=x, y=y, z=z) for x, y, z in set(outputs)],
-        key=lambda x: list(vars(x).items())
-    )
+                    outputs.add((x_choice, y_choice, z_choice))
+    return sorted(outputs)
+
+
+def retrieve_all_vectors(
+    vectors: List[Union[VectorIntConfig, VectorFloatConfig]]
+) -> List[Vector3d]:
+    """Returns the list of all possible vectors for the given vector
+    configurations. Rounds all floats in expanded MinMaxFloats to one decimal
+    place."""
+    return [
+        Vector3d(x=x, y=y, z=z)
+        for x, y, z in retrieve_all_vector_tuples(vectors)
+    ]
 
 
 RandomizableVectorInt3d = Union[VectorIntConfig, List[VectorIntConfig]]
@@ -200,7 +200,7 @@ class ObjectRepository():
         """clears the object repository.
         """
         self._id_object_store = {}
-        self._labeled_object_store = DefaultDict(list)
+        self._labeled_object_store = DefaultDict(_LabeledObjects)
 
     def has_label(self, label: str):
         return (label in self._labeled_object_store or
@@ -220,7 +220,7 @@ class ObjectRepository():
                     f"Adding object '{obj_defn_loc_tuple.instance['id']}' with"
                     f" label '{label}' to the object repository"
                 )
-                self._labeled_object_store[label].append(obj_defn_loc_tuple)
+                self._labeled_object_store[label].add(obj_defn_loc_tuple)
         if obj_defn_loc_tuple and obj_defn_loc_tuple.instance:
             if id := obj_defn_loc_tuple.instance.get('id'):
                 self._id_object_store[id] = obj_defn_loc_tuple
@@ -233,7 +233,7 @@ class ObjectRepository():
         if label and label in self._id_object_store:
             return self._id_object_store.get(label)
         if label and label in self._labeled_object_store:
-            objs = self._labeled_object_store[label]
+            objs = self._labeled_object_store[label].to_list()
             return random.choice(objs)
 
     def get_all_from_labeled_objects(
@@ -244,16 +244,74 @@ class ObjectRepository():
         if label and label in self._id_object_store:
             return [self._id_object_store.get(label)]
         if label and label in self._labeled_object_store:
-            return self._labeled_object_store[label]
+            # Return a copy, so callers (like KeywordLocation, which shuffles
+            # it) can't change the stored objects or their order.
+            return list(self._labeled_object_store[label].to_list())
 
-    def remove_from_labeled_objects(self, instance_id: str, label: str):
-        """Removes the object with the given ID from the given label."""
-        if label and label in self._labeled_object_store:
-            logger.debug(f'Removing object {instance_id} from label {label}')
-            self._labeled_object_store[label] = [
-                idl for idl in self._labeled_object_store[label]
-                if idl.instance['id'] != instance_id
+    def remove_from_labeled_objects(
+            self,
+            instance_id: str,
+            labels: RandomizableString):
+        """Removes the object with the given ID from a single or multiple
+        labels."""
+        labels = labels if isinstance(labels, list) else [labels]
+        for label in labels:
+            if label and label in self._labeled_object_store:
+                logger.debug(
+                    f'Removing object {instance_id} from label {label}'
+                )
+                self._labeled_object_store[label].remove(instance_id)
+
+
+class _LabeledObjects():
+    """The objects with a label in the ObjectRepository, in the order they
+    were added, indexed by their IDs so removing one doesn't need to search
+    (or copy) all of them."""
+
+    def __init__(self):
+        # Maps a unique key (in the order added) to each object.
+        self._objects: Dict[int, InstanceDefinitionLocationTuple] = {}
+        # Maps each object's ID (when it was added) to its keys.
+        self._keys_by_id: Dict[str, List[int]] = {}
+        self._next_key = 0
+        # The objects as a list, remade after a removal only when needed.
+        self._list: Optional[List[InstanceDefinitionLocationTuple]] = []
+
+    def add(self, idl: InstanceDefinitionLocationTuple) -> None:
+        self._objects[self._next_key] = idl
+        self._keys_by_id.setdefault(idl.instance.get('id'), []).append(
+            self._next_key
+        )
+        self._next_key += 1
+        if self._list is not None:
+            self._list.append(idl)
+
+    def remove(self, instance_id: str) -> None:
+        """Remove each object with the given ID."""
+        keys = [
+            key for key in self._keys_by_id.pop(instance_id, [])
+            if key in self._objects
+        ]
+        if not keys or any(
+            self._objects[key].instance.get('id') != instance_id
+            for key in keys
+        ):
+            # An object's ID may have been changed after it was added.
+            keys = [
+                key for key, idl in self._objects.items()
+                if idl.instance.get('id') == instance_id
             ]
+        for key in keys:
+            del self._objects[key]
+        if keys:
+            self._list = None
+
+    def to_list(self) -> List[InstanceDefinitionLocationTuple]:
+        """Return the objects in the order they were added. The list is
+        cached, so don't modify it."""
+        if self._list is None:
+            self._list = list(self._objects.values())
+        return self._list
 
 
 class KeywordLocation():
@@ -336,7 +394,8 @@ class KeywordLocation():
                 f'keyword location "{keyword_location.keyword}". '
                 f'The relative object label or corresponding '
                 f'keyword could be misspelled, invalid, '
-                f'or does not exist'
+                f'or does not exist',
+                labels=label
             )
         agent_idl = obj_repo.get_one_from_labeled_objects(label=label)
         agent = agent_idl.instance
@@ -465,7 +524,8 @@ class KeywordLocation():
                     f'"{obj_tag}" for keyword location "{keyword}". '
                     f'The relative object label or corresponding '
                     f'keyword could be misspelled, invalid, '
-                    f'or does not exist'
+                    f'or does not exist',
+                    labels=obj_tag
                 )
 
             idl = obj_repo.get_one_from_labeled_objects(obj_tag)
@@ -622,7 +682,8 @@ class KeywordLocation():
                 f'keyword location "{keyword}". '
                 f'The container object label or corresponding '
                 f'keyword could be misspelled, invalid, '
-                f'or does not exist'
+                f'or does not exist',
+                labels=con_tag
             )
 
         idl = obj_repo.get_one_from_labeled_objects(con_tag)
@@ -844,7 +905,8 @@ def get_step_after_movement(labels: RandomizableString) -> int:
         objects = object_repository.get_all_from_labeled_objects(label)
         if not objects:
             raise ILEDelayException(
-                f'Cannot find any existing objects with label: {label}'
+                f'Cannot find any existing objects with label: {label}',
+                labels=label
             )
         for idl in objects:
             step = instances.get_earliest_active_step(idl.instance)
@@ -869,7 +931,8 @@ def get_step_after_movement_or_start(labels: RandomizableString) -> int:
         objects = object_repository.get_all_from_labeled_objects(label)
         if not objects:
             raise ILEDelayException(
-                'Cannot find any existing objects with label: {label}'
+                'Cannot find any existing objects with label: {label}',
+                labels=label
             )
         for idl in objects:
             step = instances.get_earliest_active_step(idl.instance)
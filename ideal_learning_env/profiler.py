@@ -0,0 +1,119 @@
+import contextlib
+import copy
+import time
+from typing import Any, ContextManager, Dict, Iterator, Optional
+
+
+class GenerationProfiler():
+    """Records the wall and CPU time spent in each part of ILE scene
+    generation (like each ILE component, creation service, and delayed action
+    round), and counts the placement attempts, rejections, and scene retries
+    made along the way. Timings are inclusive, so the time of a creation
+    service is also part of the time of the component that called it."""
+
+    def __init__(self):
+        # Maps each category to each name to its calls, wall, and CPU time.
+        self.timings: Dict[str, Dict[str, Dict[str, float]]] = {}
+        # Maps each category to each name (and optional nested names) to its
+        # count.
+        self.counts: Dict[str, Any] = {}
+
+    @contextlib.contextmanager
+    def timer(self, category: str, name: str) -> Iterator[None]:
+        """Record the wall and CPU time of the code run within the context
+        under the given category and name."""
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield
+        finally:
+            timing = self.timings.setdefault(category, {}).setdefault(name, {
+                'calls': 0,
+                'wallTime': 0.0,
+                'cpuTime': 0.0
+            })
+            timing['calls'] += 1
+            timing['wallTime'] += time.perf_counter() - wall_start
+            timing['cpuTime'] += time.process_time() - cpu_start
+
+    def count(self, category: str, *names: str, amount: int = 1) -> None:
+        """Add the given amount to the count with the given category and
+        names, like count('rejections', 'WallCreationService', 'invalid')."""
+        data = self.counts
+        for key in (category,) + names[:-1]:
+            data = data.setdefault(key, {})
+        data[names[-1]] = data.get(names[-1], 0) + amount
+
+    def merge(self, report: Dict[str, Any]) -> None:
+        """Add the timings and counts from the given report (from another
+        profiler, like one in a worker process) to this profiler."""
+        _merge_data(self.timings, report.get('timings', {}))
+        _merge_data(self.counts, report.get('counts', {}))
+
+    def report(self) -> Dict[str, Any]:
+        """Return a copy of the timings and counts as a JSON-serializable
+        dict, with the timings in each category sorted by wall time, slowest
+        first."""
+        return {
+            'timings': {
+                category: dict(sorted(
+                    copy.deepcopy(timings).items(),
+                    key=lambda item: item[1]['wallTime'],
+                    reverse=True
+                )) for category, timings in self.timings.items()
+            },
+            'counts': copy.deepcopy(self.counts)
+        }
+
+    def reset(self) -> None:
+        """Remove all of the timings and counts."""
+        self.timings.clear()
+        self.counts.clear()
+
+
+def _merge_data(data: Dict[str, Any], other: Dict[str, Any]) -> None:
+    for key, value in other.items():
+        if isinstance(value, dict):
+            _merge_data(data.setdefault(key, {}), value)
+        else:
+            data[key] = data.get(key, 0) + value
+
+
+# The profiler of this process, or None if profiling is disabled (the
+# default, so generation isn't slowed down).
+_profiler: Optional[GenerationProfiler] = None
+
+
+def enable_profiling() -> GenerationProfiler:
+    """Enable profiling in this process and return the profiler."""
+    global _profiler
+    if not _profiler:
+        _profiler = GenerationProfiler()
+    return _profiler
+
+
+def disable_profiling() -> None:
+    """Disable profiling in this process and discard the profiler."""
+    global _profiler
+    _profiler = None
+
+
+def get_profiler() -> Optional[GenerationProfiler]:
+    """Return the profiler of this process, or None if profiling is
+    disabled."""
+    return _profiler
+
+
+def timer(category: str, name: str) -> ContextManager:
+    """Return a context to record the time of its code under the given
+    category and name, if profiling is enabled."""
+    if _profiler:
+        return _profiler.timer(category, name)
+    return contextlib.nullcontext()
+
+
+def count(category: str, *names: str, amount: int = 1) -> None:
+    """Add the given amount to the count with the given category and names,
+    if profiling is enabled."""
+    if _profiler:
+        _profiler.count(category, *names, amount=amount)
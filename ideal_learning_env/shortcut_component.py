@@ -3053,7 +3053,10 @@ class ShortcutComponent(ILEComponent):
         object_repository = ObjectRepository.get_instance()
         idls = object_repository.get_all_from_labeled_objects(label)
         if not idls:
-            raise ILEDelayException(f'Cannot find {key}={label} for {prop}.')
+            raise ILEDelayException(
+                f'Cannot find {key}={label} for {prop}.',
+                labels=label
+            )
         return [idl.instance for idl in idls]
 
     def _update_turntables_with_agent_and_non_agent(
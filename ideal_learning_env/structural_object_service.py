@@ -6,9 +6,10 @@ import math
 import random
 from dataclasses import dataclass
 from enum import Enum
-from itertools import combinations
-from typing import Dict, List, Optional, Tuple, Union
+from itertools import combinations, islice
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 
+import numpy as np
 import shapely
 from machine_common_sense.config_manager import (
     FloorTexturesConfig,
@@ -97,7 +98,7 @@ from .numerics import (
     RandomizableVectorFloat3dOrFloat,
     VectorFloatConfig,
     VectorIntConfig,
-    retrieve_all_vectors
+    retrieve_all_vector_tuples
 )
 from .object_services import (
     DEBUG_FINAL_POSITION_KEY,
@@ -191,47 +192,105 @@ LABEL_RAMP = "ramps"
 LABEL_BIDIRECTIONAL_RAMP = "bidirectional"
 LABEL_CONNECTED_TO_RAMP = "connected_to_ramp"
 
+# The first and most combinations to validate at once in _check_for_collisions.
+MIN_COLLISION_BATCH_SIZE = 64
+MAX_COLLISION_BATCH_SIZE = 4096
+
+
+def _iterate_valid_locations(
+    scene: Scene,
+    definition: ObjectDefinition,
+    positions: RandomizableVectorFloat3d,
+    rotations: RandomizableVectorFloat3d,
+    bounds_list: List[ObjectBounds],
+    shuffle: bool = False
+) -> Iterator[Tuple[Vector3d, Vector3d]]:
+    """Yields each valid combination of the given positions and rotations (see
+    _check_for_collisions) as a (position, rotation) tuple, in order (or in a
+    random order if shuffle), validating the combinations lazily in batches
+    of array math rather than making an ObjectBounds for each one."""
+    if not positions and not rotations:
+        return
+    all_positions = retrieve_all_vector_tuples(
+        positions or [VectorFloatConfig(0, 0, 0)]
+    )
+    all_rotations = retrieve_all_vector_tuples(
+        rotations or [VectorIntConfig(0, 0, 0)]
+    )
+    position_array = np.array(all_positions, dtype=float)
+    dimensions = vars(definition.dimensions)
+    offset = vars(definition.offset)
+    position_y = definition.positionY
+    total = len(all_positions) * len(all_rotations)
+    # Each combination is an index into the product of positions and
+    # rotations, so the product is never made.
+    order = (
+        np.random.default_rng(random.getrandbits(32)).permutation(total)
+        if shuffle else None
+    )
+    start = 0
+    batch_size = MIN_COLLISION_BATCH_SIZE
+    while start < total:
+        stop = min(start + batch_size, total)
+        indexes = order[start:stop] if shuffle else np.arange(start, stop)
+        position_indexes = indexes // len(all_rotations)
+        rotation_indexes = indexes % len(all_rotations)
+        # Add and subtract the standing Y like create_bounds would.
+        min_y = (position_array[position_indexes, 1] + position_y) - position_y
+        vertices = geometry.find_pose_vertices(
+            dimensions,
+            offset,
+            position_array[position_indexes, 0],
+            position_array[position_indexes, 2],
+            [all_rotations[index][1] for index in rotation_indexes.tolist()]
+        )
+        valid = geometry.validate_pose_vertices(
+            vertices,
+            min_y,
+            min_y + dimensions['y'],
+            vars(scene.performer_start.position),
+            bounds_list,
+            vars(scene.room_dimensions)
+        )
+        for index in indexes[valid].tolist():
+            x, y, z = all_positions[index // len(all_rotations)]
+            rotation_x, rotation_y, rotation_z = all_rotations[
+                index % len(all_rotations)
+            ]
+            yield (
+                Vector3d(x=x, y=y + position_y, z=z),
+                Vector3d(x=rotation_x, y=rotation_y, z=rotation_z)
+            )
+        start = stop
+        # Start small, in case the caller stops after the first few.
+        batch_size = min(batch_size * 2, MAX_COLLISION_BATCH_SIZE)
+
 
 def _check_for_collisions(
     scene: Scene,
     definition: ObjectDefinition,
     positions: RandomizableVectorFloat3d,
     rotations: RandomizableVectorFloat3d,
-    bounds_list: List[ObjectBounds]
+    bounds_list: List[ObjectBounds],
+    limit: Optional[int] = None,
+    shuffle: bool = False
 ) -> List[Tuple[Vector3d, Vector3d]]:
     """Checks all possible combinations of the given positions and rotations
     for collisions with the given bounds list using the given object defintion,
     and returns the list of all valid combinations as (position, rotation)
     tuples. If either positions or rotations is null/empty, substitutes the
     vector (0, 0, 0). If both positions and rotations are null/empty, returns
-    no valid locations."""
-    if not positions and not rotations:
-        return []
-    valid_locations = []
-    all_positions = retrieve_all_vectors(
-        positions or [VectorFloatConfig(0, 0, 0)]
-    )
-    all_rotations = retrieve_all_vectors(
-        rotations or [VectorIntConfig(0, 0, 0)]
-    )
-    for position in all_positions:
-        position.y = position.y + definition.positionY
-        for rotation in all_rotations:
-            bounds = geometry.create_bounds(
-                vars(definition.dimensions),
-                vars(definition.offset),
-                vars(position),
-                vars(rotation),
-                definition.positionY
-            )
-            if geometry.validate_location_rect(
-                bounds,
-                vars(scene.performer_start.position),
-                bounds_list,
-                vars(scene.room_dimensions)
-            ):
-                valid_locations.append((position, rotation))
-    return valid_locations
+    no valid locations. If limit is given, stops after finding that many
+    valid combinations; if shuffle, checks the combinations in a random order,
+    so the first valid combination is a uniformly random choice of them."""
+    return list(islice(_iterate_valid_locations(
+        scene,
+        definition,
+        positions,
+        rotations,
+        bounds_list,
+        shuffle
+    ), limit))
 
 
 def _retrieve_object_height_at_step(
@@ -840,7 +899,7 @@ class StructuralThrowerCreationService(
             y=room_dim.y,
             z=room_dim.z + 2
         )
-        scene_copy = copy.deepcopy(scene)
+        scene_copy = scene.overlay()
         scene_copy.room_dimensions = room_dimensions_extended
         projectile_dimensions = None
 
@@ -1096,7 +1155,8 @@ class StructuralThrowerCreationService(
                 raise ILEDelayException(
                     f'Cannot find object with one of the following labels for '
                     f'thrown object to {"collide" if collide else "avoid"}: '
-                    f'{reconciled.path_relative.labels}'
+                    f'{reconciled.path_relative.labels}',
+                    labels=reconciled.path_relative.labels
                 )
 
         # Save the projectile labels from the source template.
@@ -1110,9 +1170,12 @@ class StructuralThrowerCreationService(
 
     def is_valid(self, scene, new_obj, bounds, try_num, retries):
         # droppers are intentionally embedded in walls.
-        altered_scene: Scene = copy.deepcopy(scene)
-        altered_scene.room_dimensions.x += 2
-        altered_scene.room_dimensions.z += 2
+        altered_scene: Scene = scene.overlay()
+        altered_scene.room_dimensions = Vector3d(
+            x=scene.room_dimensions.x + 2,
+            y=scene.room_dimensions.y,
+            z=scene.room_dimensions.z + 2
+        )
         # Throwers should ignore the holes and lava directly underneath them.
         bounds = find_bounds(scene, ignore_ground=True)
         return super().is_valid(
@@ -1191,7 +1254,8 @@ class StructuralThrowerCreationService(
             if not object_repo.has_label(label):
                 raise ILEDelayException(
                     f'Cannot find object label {label} to identify thrower '
-                    f'"stop_position" for "behind" configuration.'
+                    f'"stop_position" for "behind" configuration.',
+                    labels=label
                 )
             idl = object_repo.get_one_from_labeled_objects(label)
             occluder_x = idl.instance['shows'][0]['position']['x']
@@ -2009,6 +2073,15 @@ class StructuralPlacersCreationService(
                 if lid_placer_move_begin > object_move_end:
                     objects_to_reposition.extend([lid, lid_placer])
 
+            # Map each held object's ID to the placers holding it.
+            placers_by_held_id = {}
+            for possible_placer in scene.objects:
+                held_id = possible_placer['debug'].get('heldObjectId')
+                if held_id:
+                    placers_by_held_id.setdefault(held_id, []).append(
+                        possible_placer
+                    )
+
             # If any other objects were positioned above our moved object,
             # and are "placed" after our object was moved, reposition them.
             for possibly_held in scene.objects:
@@ -2023,11 +2096,10 @@ class StructuralPlacersCreationService(
                 if above_id != idl.instance['id']:
                     continue
                 # Find its corresponding placer...
-                for possible_placer in scene.objects:
-                    # If this object is a placer holding the other object...
-                    held_id = possible_placer['debug'].get('heldObjectId')
-                    if held_id != possibly_held['id']:
-                        continue
+                for possible_placer in placers_by_held_id.get(
+                    possibly_held['id'],
+                    []
+                ):
                     # If this placer activates after our object was moved...
                     move_step = possible_placer['moves'][0]['stepBegin']
                     if move_step > reconciled.activation_step:
@@ -2259,7 +2331,8 @@ class StructuralPlacersCreationService(
                 raise ILEDelayException(
                     f'Cannot find the configured placed_object_above label '
                     f'"{reconciled.placed_object_above}" to position a new '
-                    f'placer.'
+                    f'placer.',
+                    labels=reconciled.placed_object_above
                 )
 
             above_object = obj_repo.get_one_from_labeled_objects(
@@ -2345,7 +2418,9 @@ class StructuralPlacersCreationService(
                 self.object_idl.definition,
                 source_template.placed_object_position,
                 rotation_vectors,
-                bounds_list
+                bounds_list,
+                limit=1,
+                shuffle=True
             )
             if not valid_start_locations:
                 data = [vars(position) for position in (
@@ -2359,8 +2434,9 @@ class StructuralPlacersCreationService(
                     f'id={self.object_idl.instance["id"]} would collide '
                     f'with an existing object in the scene.'
                 )
-            # Randomly choose from one of the valid options.
-            position, rotation = random.choice(valid_start_locations)
+            # The valid options were checked in a random order, so the first
+            # one is a random choice.
+            position, rotation = valid_start_locations[0]
             reconciled.placed_object_position = position
             reconciled.placed_object_rotation = rotation.y
         else:
@@ -2419,7 +2495,9 @@ class StructuralPlacersCreationService(
                 self.object_idl.definition,
                 move_object_end_position,
                 VectorIntConfig(rotation['x'], rotation['y'], rotation['z']),
-                bounds_list + [start_bounds]
+                bounds_list + [start_bounds],
+                limit=1,
+                shuffle=True
             )
             if not valid_end_locations:
                 data = [
@@ -2432,8 +2510,9 @@ class StructuralPlacersCreationService(
                     f'{reconciled.placed_object_position} would collide '
                     f'with an existing object in the scene.'
                 )
-            # Randomly choose from one of the valid options.
-            position, _ = random.choice(valid_end_locations)
+            # The valid options were checked in a random order, so the first
+            # one is a random choice.
+            position, _ = valid_end_locations[0]
             reconciled.move_object_end_position = position
 
         # If needed, adjust this placer's position relative to another object.
@@ -2464,7 +2543,8 @@ class StructuralPlacersCreationService(
             if not obj_repo.has_label(end_height_obj_label):
                 raise ILEDelayException(
                     f'Cannot find end height relative object label '
-                    f'"{end_height_obj_label}" to position a new placer'
+                    f'"{end_height_obj_label}" to position a new placer',
+                    labels=end_height_obj_label
                 )
             else:
                 end_height_obj = obj_repo.get_one_from_labeled_objects(
@@ -3993,15 +4073,16 @@ def _post_instance(scene, new_obj, template, source_template, type):
         else:
             new_obj["debug"]["labels"] = [LABEL_CONNECTED_TO_RAMP]
         # if we ever try to attach to l_occluders, this won't work
-        start_scene = copy.deepcopy(scene)
         last_exception = None
         for _ in range(MAX_TRIES):
+            # Stage any changes to the scene, in case this try fails.
+            staged_scene = scene.overlay()
             try:
                 new_objs = _add_platform_attached_objects(
-                    scene, template, new_obj)
+                    staged_scene, template, new_obj)
+                staged_scene.commit()
                 return new_objs
             except ILEException as e:
-                scene = copy.deepcopy(start_scene)
                 last_exception = e
                 continue
         raise ILEException(
@@ -4890,7 +4971,10 @@ def _get_existing_held_object_idl(
         ) if idl_count else 'no matching object(s) were previously generated'
         raise ILEDelayException(
             f'Failed to find an available object with "{labels=}" for a new '
-            f'dropper/placer/thrower because {error_message}.'
+            f'dropper/placer/thrower because {error_message}.',
+            # If the objects exist but are already used, it's waiting for
+            # more objects with the labels, so it may run again at any time.
+            labels=None if idl_count else labels
         )
     return None
 
@@ -6,7 +6,11 @@ from generator import geometry, materials
 from generator.scene import Scene
 
 from .choosers import choose_counts, choose_random
-from .components import ILEComponent
+from .components import (
+    DelayedActionLabels,
+    ILEComponent,
+    find_delayed_action_labels
+)
 from .decorators import ile_config_setter
 from .defs import (
     TARGET_LABEL,
@@ -1001,7 +1005,11 @@ class SpecificStructuralObjectsComponent(ILEComponent):
         self._delayed_templates = []
         if delayed:
             bounds = find_bounds(scene)
-            for s_type, template, _ in delayed:
+            for s_type, template, error in delayed:
+                # Skip the templates still waiting for their labels.
+                if not find_delayed_action_labels(error).is_ready():
+                    self._delayed_templates.append((s_type, template, error))
+                    continue
                 try:
                     FeatureCreationService.create_feature(
                         scene, s_type, template, bounds)
@@ -1009,6 +1017,12 @@ class SpecificStructuralObjectsComponent(ILEComponent):
                     self._delayed_templates.append((s_type, template, e))
         return scene
 
+    def get_delayed_action_labels(self) -> List[DelayedActionLabels]:
+        return [
+            find_delayed_action_labels(err, template)
+            for _, template, err in self._delayed_templates
+        ]
+
     def get_delayed_action_error_strings(self) -> List[str]:
         return [str(err) for _, _, err in self._delayed_templates]
 
@@ -1,12 +1,13 @@
 import logging
+import math
 from typing import Any, Dict, List, Union
 
-from extremitypathfinder import PolygonEnvironment
-from extremitypathfinder.plotting import PlottingEnvironment
 from machine_common_sense.config_manager import Vector2dInt
 from shapely.geometry import JOIN_STYLE, mapping
 
 from generator import ObjectBounds, Scene, geometry
+from generator.grid_pathfinding import find_grid_path
+from generator.pathfinding_cache import find_prepared_environment
 
 from .components import ILEComponent
 from .decorators import ile_config_setter
@@ -18,6 +19,7 @@ from .structural_object_service import (
     LABEL_PLATFORM,
     LABEL_RAMP
 )
+from .validators import ValidateNumber
 
 logger = logging.getLogger(__name__)
 
@@ -56,6 +58,30 @@ class ValidPathComponent(ILEComponent):
     ```
     """
 
+    check_valid_path_grid_size: float = None
+    """
+    (float):
+    If set, the `check_valid_path` check first tries to find a path on a grid
+    with cells of this size (in meters), which is much faster than the exact
+    check on scenes with many obstacles. The grid result is only used if it
+    proves that a path does or does not exist; otherwise (like if the only
+    path is very close to an obstacle) the exact check is run. Smaller cells
+    are slower but rarely need the exact check. The path saved for debugging
+    follows the grid cells, so it may be a little longer than the shortest
+    path. Only used if `check_valid_path` is set. Default: not set (always
+    use the exact check)
+
+    Simple Example:
+    ```
+    check_valid_path_grid_size: null
+    ```
+
+    Advanced Example:
+    ```
+    check_valid_path_grid_size: 0.1
+    ```
+    """
+
     _step_height = 0.2
     _debug_plot = False
     _delayed_target = False
@@ -130,9 +156,6 @@ class ValidPathComponent(ILEComponent):
 
         logger.info(f'Running path validation check on {label}...')
 
-        environ = PlottingEnvironment(
-            "./plots/") if self._debug_plot else PolygonEnvironment()
-
         blocked_area = []
         if self._delayed_target:
             raise ILEDelayException(f"No {label} objects found.")
@@ -160,18 +183,15 @@ class ValidPathComponent(ILEComponent):
         self._add_blocked_areas(scene.holes, blocked_area, 0.6)
         # validate
 
-        logger.trace("Setting pathfinding environment")
-        environ.store(
-            boundary,
-            list_of_hole_coordinates=blocked_area,
-            validate=True)
-        logger.trace("pre-computing possible paths")
-        environ.prepare()
-        logger.trace(
-            "finding shortest path from performer start to target")
-
+        environ = None
         for target in targets:
             start, end = self._compute_start_end(scene, target)
+            if self._find_grid_path(boundary, blocked_area, start, end):
+                continue
+            if not environ:
+                environ = self._prepare_environment(boundary, blocked_area)
+            logger.trace(
+                "finding shortest path from performer start to target")
             try:
                 # if plotting is off, path will be blank and distance will be 0
                 self.last_path, self.last_distance = (
@@ -185,6 +205,54 @@ class ValidPathComponent(ILEComponent):
             except Exception as e:
                 raise ILEException("Failed to generate valid path") from e
 
+    def _find_grid_path(self, boundary, blocked_area, start, end) -> bool:
+        """Return whether the grid check (if configured) proves that a path
+        exists, or raise an ILEException if it proves no path exists."""
+        if not self.get_check_valid_path_grid_size():
+            return False
+        logger.trace("finding grid path from performer start to target")
+        reachable, path = find_grid_path(
+            boundary,
+            blocked_area,
+            start,
+            end,
+            self.get_check_valid_path_grid_size()
+        )
+        if reachable is None:
+            logger.trace("grid path is borderline; using exact check")
+            return False
+        if not reachable:
+            self.last_path, self.last_distance = [], None
+            raise ILEException("Failed to generate valid path")
+        self.last_path = path
+        self.last_distance = sum(
+            math.dist(path[index - 1], path[index])
+            for index in range(1, len(path))
+        )
+        logger.debug(
+            f'Found grid path with distance {self.last_distance} using '
+            f'path {self.last_path}')
+        return True
+
+    def _prepare_environment(self, boundary, blocked_area):
+        logger.trace("Setting pathfinding environment")
+        if self._debug_plot:
+            # Only import the plotting module (which imports matplotlib, which
+            # is slow to import) if needed.
+            from extremitypathfinder.plotting import PlottingEnvironment
+            environ = PlottingEnvironment("./plots/")
+            environ.store(
+                boundary,
+                list_of_hole_coordinates=blocked_area,
+                validate=True)
+            logger.trace("pre-computing possible paths")
+            environ.prepare()
+            return environ
+        # Reuse the environment from a previous check (like a retry of this
+        # scene) if it has the same boundary and blocked areas.
+        logger.trace("pre-computing possible paths (or using cache)")
+        return find_prepared_environment(boundary, blocked_area)
+
     def _compute_start_end(self, scene, tgt):
         start = (
             scene.performer_start.position.x,
@@ -462,3 +530,10 @@ class ValidPathComponent(ILEComponent):
     @ile_config_setter()
     def set_check_valid_path(self, data: Any) -> None:
         self.check_valid_path = data
+
+    def get_check_valid_path_grid_size(self) -> float:
+        return self.check_valid_path_grid_size
+
+    @ile_config_setter(validator=ValidateNumber(min_value=0.01))
+    def set_check_valid_path_grid_size(self, data: Any) -> None:
+        self.check_valid_path_grid_size = data
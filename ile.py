@@ -1,16 +1,29 @@
 #!/usr/bin/env python3
 
 import argparse
+import contextlib
+import functools
+import json
 import logging
+import multiprocessing
+import os
+import random
+import signal
 import sys
-from typing import List, Type
+import time
+from concurrent.futures import Future
+from typing import Any, Dict, List, Optional, Tuple, Type
 
 import yaml
 from machine_common_sense.logging_config import LoggingConfig
 
-from generator import MAX_TRIES, SceneException
+from generator import MAX_TRIES, SceneException, definitions
 from generator.scene import Scene
-from generator.scene_saver import find_next_filename, save_scene_files
+from generator.scene_saver import (
+    SceneWriter,
+    reserve_next_filename,
+    save_scene_files
+)
 from ideal_learning_env import (
     ActionRestrictionsComponent,
     GlobalSettingsComponent,
@@ -21,12 +34,14 @@ from ideal_learning_env import (
     RandomStructuralObjectsComponent,
     ShortcutComponent,
     SpecificInteractableObjectsComponent,
-    ValidPathComponent
+    ValidPathComponent,
+    profiler
 )
 from ideal_learning_env.agent_component import (
     RandomAgentComponent,
     SpecificAgentComponent
 )
+from ideal_learning_env.components import DelayedActionLabels
 from ideal_learning_env.interactable_object_service import ObjectRepository
 from ideal_learning_env.structural_objects_component import (
     SpecificStructuralObjectsComponent
@@ -64,76 +79,454 @@ def generate_ile_scene(
     ObjectRepository.get_instance().clear()
     # Each component will update the scene template based on the config data.
     for component in component_list:
-        scene = component.update_ile_scene(scene)
+        with profiler.timer('components', type(component).__name__):
+            scene = component.update_ile_scene(scene)
 
     scene = _handle_delayed_actions(component_list, scene)
     scene = _handle_actions_at_end_of_scene_generation(component_list, scene)
     return scene
 
 
-def _handle_delayed_actions(component_list, scene):
-    previous_sum = 0
-    while True:
-        # Deteremine the number of delayed actions.  If we can't perform one
-        # of them each loop, we quit with error.
-        new_sum = sum(
-            component.get_num_delayed_actions() for component in component_list
+def _order_delayed_action_components(
+    component_list: List[ILEComponent]
+) -> List[ILEComponent]:
+    """Return a copy of the given components in the order in which to run
+    their delayed actions."""
+    # Swap the GlobalSettingsComponent to be after ShortcutComponent so
+    # performer_look_at happens after any position change from
+    # shortcut_component
+    component_list = component_list.copy()
+    global_settings_indexes = [
+        index for index, component in enumerate(component_list)
+        if isinstance(component, GlobalSettingsComponent)
+    ]
+    shortcut_indexes = [
+        index for index, component in enumerate(component_list)
+        if isinstance(component, ShortcutComponent)
+    ]
+    if global_settings_indexes and shortcut_indexes:
+        global_settings_index = global_settings_indexes[0]
+        shortcut_index = shortcut_indexes[0]
+        if global_settings_index < shortcut_index:
+            component_list[global_settings_index], component_list[
+                shortcut_index
+            ] = (
+                component_list[shortcut_index],
+                component_list[global_settings_index]
+            )
+    return component_list
+
+
+def _is_delayed_action_component_ready(component: ILEComponent) -> bool:
+    """Return whether any delayed action of the given component may be able
+    to run now."""
+    return any(
+        labels.is_ready() for labels in component.get_delayed_action_labels()
+    )
+
+
+def _find_delayed_action_cycle(
+    actions: List[Tuple[str, DelayedActionLabels]]
+) -> List[Tuple[str, DelayedActionLabels]]:
+    """Return a cycle of the given (component name, labels) delayed actions in
+    which each action needs a label that the next one is configured to
+    provide, or an empty list if there's no cycle."""
+    # Each action links to the actions that provide one of its labels.
+    links = [[
+        other_index for other_index, (_, other) in enumerate(actions)
+        if set(labels.needed or []) & set(other.provided)
+    ] for _, labels in actions]
+    # Depth-first search for an action linking back to one on the path.
+    visited = set()
+    for start in range(len(actions)):
+        if start in visited:
+            continue
+        path = [start]
+        iterators = [iter(links[start])]
+        visited.add(start)
+        while iterators:
+            next_index = next(iterators[-1], None)
+            if next_index is None:
+                iterators.pop()
+                path.pop()
+            elif next_index in path:
+                return [
+                    actions[index] for index in
+                    path[path.index(next_index):] + [next_index]
+                ]
+            elif next_index not in visited:
+                visited.add(next_index)
+                path.append(next_index)
+                iterators.append(iter(links[next_index]))
+    return []
+
+
+def _list_delayed_actions_needing_labels(
+    component_list: List[ILEComponent]
+) -> List[Tuple[str, DelayedActionLabels]]:
+    """Return the (component name, labels) of each delayed action of the
+    given components that's waiting for an object with a label."""
+    return [
+        (type(component).__name__, labels)
+        for component in component_list
+        for labels in component.get_delayed_action_labels()
+        if labels.needed is not None
+    ]
+
+
+def _create_delayed_actions_error(
+    component_list: List[ILEComponent],
+    cycle: List[Tuple[str, DelayedActionLabels]]
+) -> ILEException:
+    """Return an exception explaining why none of the delayed actions of the
+    given components can be run, including the given cycle of delayed
+    actions (see _find_delayed_action_cycle), if it's still stuck."""
+    reasons = []
+    for component in component_list:
+        reasons += component.get_delayed_action_error_strings()
+    actions = _list_delayed_actions_needing_labels(component_list)
+
+    # backslash isn't allowed in fstring.
+    nl = '\n'
+    message = (
+        f"Failed to execute any delayed actions.  This can occur when"
+        f" a required label doesn't exist, a label is mispelled, or "
+        f"there is a circular dependency.  Please verify all spellings"
+        f".{nl}Reasons:{nl}  {f'{nl}  '.join(reasons)}"
+    )
+    provided = set(
+        label for _, labels in actions for label in labels.provided
+    )
+    missing = sorted(set(
+        label for _, labels in actions for label in labels.needed
+    ) - provided)
+    if missing:
+        message += f"{nl}Missing labels: {', '.join(missing)}"
+    # Another action may have provided a label the cycle needed since it was
+    # found, so only report it if none of its actions can run yet.
+    if cycle and not any(labels.is_ready() for _, labels in cycle):
+        message += f"{nl}Circular dependency: " + ' -> '.join(
+            f"{name} (needs {', '.join(labels.needed)})"
+            for name, labels in cycle
         )
+    return ILEException(message)
 
+
+def _handle_delayed_actions(component_list, scene):
+    """Run the delayed actions of the given components (the actions that
+    needed something, usually an object with a specific label, that didn't
+    exist yet) until they're all done. A component is only run again once
+    another delayed action has been done since it last ran, and one of its
+    delayed actions either needs an object with a label that now exists or
+    needs something other than labels. If no component can be run, raise an
+    ILEException (listing any missing labels or circular dependencies) rather
+    than trying all the delayed actions again. Circular dependencies are
+    looked for once, before the first round, but only reported if no
+    component can be run."""
+    component_list = _order_delayed_action_components(component_list)
+    cycle = _find_delayed_action_cycle(
+        _list_delayed_actions_needing_labels(component_list)
+    )
+    # The number of delayed actions done so far, and the number that were
+    # done when each component (by its index) last ran.
+    done = 0
+    done_at_last_run = {}
+    delayed_round = 0
+    while True:
+        pending = [
+            index for index, component in enumerate(component_list)
+            if component.get_num_delayed_actions() > 0
+        ]
         # If there are no more actions, we are done!
-        if new_sum == 0:
+        if not pending:
             break
-        # If we didn't completed a delayed action last run, we're in an
-        # infinite loop and should quit.
-        if new_sum == previous_sum:
-            reasons = []
-            for component in component_list:
-                reasons += component.get_delayed_action_error_strings()
-
-            # backslash isn't allowed in fstring.
-            nl = '\n'
-            raise ILEException(
-                f"Failed to execute any delayed actions.  This can occur when"
-                f" a required label doesn't exist, a label is mispelled, or "
-                f"there is a circular dependency.  Please verify all spellings"
-                f".{nl}Reasons:{nl}  {f'{nl}  '.join(reasons)}"
-            )
-
-        # Swap the GlobalSettingsComponent to be after ShortcutComponent so
-        # performer_look_at happens after any position change from
-        # shortcut_component
-        component_list = component_list.copy()
-        global_settings_component_index = component_list.index([
-            c for c in component_list if
-            isinstance(c, GlobalSettingsComponent)][0])
-        shortcut_component_index = component_list.index([
-            c for c in component_list if
-            isinstance(c, ShortcutComponent)][0])
-        temp = component_list[global_settings_component_index]
-        component_list[global_settings_component_index] = component_list[
-            shortcut_component_index]
-        component_list[shortcut_component_index] = temp
+        # If no component can run a delayed action, we'd be in an infinite
+        # loop and should quit.
+        if not any(
+            done_at_last_run.get(index, -1) < done and
+            _is_delayed_action_component_ready(component_list[index])
+            for index in pending
+        ):
+            raise _create_delayed_actions_error(component_list, cycle)
 
         # Loop through components and run delayed actions if the components
-        # have any.
-        for component in component_list:
-            if component.get_num_delayed_actions() > 0:
-                scene = component.run_delayed_actions(scene)
-        previous_sum = new_sum
+        # have any that are ready (checking each in turn, since the previous
+        # components may have just added the objects with their labels).
+        delayed_round += 1
+        with profiler.timer('delayedActionRounds', str(delayed_round)):
+            for index in pending:
+                component = component_list[index]
+                name = type(component).__name__
+                count = component.get_num_delayed_actions()
+                if (
+                    done_at_last_run.get(index, -1) >= done or
+                    not _is_delayed_action_component_ready(component)
+                ):
+                    profiler.count('delayedActionSkips', name)
+                    continue
+                done_at_last_run[index] = done
+                with profiler.timer('delayedActions', name):
+                    scene = component.run_delayed_actions(scene)
+                done += max(count - component.get_num_delayed_actions(), 0)
     return scene
 
 
 def _handle_actions_at_end_of_scene_generation(component_list, scene):
     for component in component_list:
-        scene = component.run_actions_at_end_of_scene_generation(scene)
+        with profiler.timer('endOfGeneration', type(component).__name__):
+            scene = component.run_actions_at_end_of_scene_generation(scene)
     return scene
 
 
+def _generate_scene_with_retries(
+    component_list: List[ILEComponent],
+    index: int,
+    total: int,
+    scene_filename: str,
+    scene_index: int,
+    max_tries: int,
+    seed: Optional[int] = None
+) -> Optional[Scene]:
+    """Try generating the scene with the given index multiple times, in case a
+    randomized setup doesn't work the first time. Return the scene, or None if
+    every try failed."""
+    if seed is not None:
+        random.seed(seed)
+    suffix = '.json'
+    tries = 0
+    while tries < max_tries:
+        tries += 1
+        try:
+            if (tries > 1):
+                logger.info(
+                    f'Retrying generaton of scene {index + 1} of '
+                    f'{total} (try {tries} / {max_tries}), '
+                    f'filename: {scene_filename}{suffix}'
+                )
+            profiler.count('scenes', 'tries')
+            with profiler.timer('scenes', 'generate'):
+                return generate_ile_scene(component_list, scene_index)
+        except (
+            ILEException,
+            SceneException,
+            RuntimeError,
+            TypeError,
+            ValueError,
+            ZeroDivisionError
+        ) as e:
+            # Count each failed try (retried unless it's the last) by reason.
+            profiler.count('sceneRetries', type(e).__name__)
+            error_message = (
+                f'Failed to generate scene {index + 1} of '
+                f'{total} (try {tries} / {max_tries}), '
+                f'filename: {scene_filename}{suffix}'
+            )
+            if logger.isEnabledFor(logging.DEBUG) or (tries >= max_tries):
+                logging.exception(error_message)
+            else:
+                logger.info(error_message)
+    profiler.count('scenes', 'failed')
+    return None
+
+
+def _generate_and_save_scene(
+    component_list: List[ILEComponent],
+    index: int,
+    total: int,
+    prefix: str,
+    max_tries: int,
+    seed: Optional[int] = None,
+    scene_writer: Optional[SceneWriter] = None
+) -> Optional[str]:
+    """Generate the scene with the given index and save its normal and debug
+    JSON files, in the background if given a scene writer. Return the scene
+    filename, or None if generation failed."""
+    suffix = '.json'
+    # Reserve the next available scene filename and index. For example, if
+    # name_1.json already exists, then start with name_2.json. The reservation
+    # is atomic, so parallel workers never write to the same file.
+    scene_filename, scene_index = reserve_next_filename(
+        f'{prefix}{"_" if prefix else ""}',
+        index + 1,
+        '06', suffix=suffix
+    )
+
+    logger.info(
+        f'[+] Generating scene {index + 1} of {total}, '
+        f'filename: {scene_filename}{suffix}'
+    )
+
+    saved = False
+    try:
+        scene = _generate_scene_with_retries(
+            component_list,
+            index,
+            total,
+            scene_filename,
+            scene_index,
+            max_tries,
+            seed
+        )
+        if not scene:
+            return None
+
+        # If successful, save the normal and debug JSON scene files.
+        if scene_writer:
+            future = scene_writer.submit(scene, scene_filename)
+            future.add_done_callback(functools.partial(
+                _release_filename_if_failed,
+                f'{scene_filename}{suffix}'
+            ))
+        else:
+            save_scene_files(scene, scene_filename)
+        saved = True
+    finally:
+        # Release the reserved filename if the scene wasn't saved, even on an
+        # unexpected error or an interruption, so no empty file is left.
+        if not saved:
+            _release_filename(f'{scene_filename}{suffix}')
+    logger.info(
+        f'Finished generating scene {index + 1} of {total}, '
+        f'filename: {scene_filename}{suffix}'
+    )
+    return scene_filename
+
+
+def _release_filename(filename: str) -> None:
+    """Remove the given reserved (or partially saved) scene file."""
+    try:
+        os.remove(filename)
+    except FileNotFoundError:
+        pass
+
+
+def _release_filename_if_failed(filename: str, future: Future) -> None:
+    """Remove the given reserved scene file if saving it in the background
+    failed."""
+    if future.cancelled() or future.exception():
+        _release_filename(filename)
+
+
+def _exit_worker(signum: int, frame: Any) -> None:
+    """Exit a worker process on SIGTERM (like from Pool.terminate) by raising
+    SystemExit, so its scene filename reservation is released."""
+    sys.exit(1)
+
+
+# The ILE components owned by this worker process (see _init_worker).
+_worker_component_list: List[ILEComponent] = None
+
+
+def _init_worker(
+    config_data: Dict[str, Any],
+    args: argparse.Namespace,
+    dataset_shuffle_seed: Optional[int] = None
+):
+    """Initialize a worker process in the scene generation pool. Each worker
+    is a freshly spawned process, so it has its own ObjectRepository singleton
+    and builds its own ILE components from the config data, and it must
+    shuffle its own datasets the same way as every other process."""
+    global logger, _worker_component_list
+    signal.signal(signal.SIGTERM, _exit_worker)
+    definitions.DATASET_SHUFFLE_SEED = dataset_shuffle_seed
+    _init_logging(args)
+    logger = logging.getLogger('ideal_learning_env')
+    if getattr(args, 'profile', None):
+        profiler.enable_profiling()
+    _worker_component_list = [
+        component_class(config_data) for component_class in ILE_COMPONENTS
+    ]
+
+
+def _run_worker_task(
+    task: Tuple[int, int, str, int, Optional[int]]
+) -> Tuple[int, Optional[str], Optional[Dict[str, Any]]]:
+    """Generate and save one scene in a worker process. Return the scene's
+    index, its filename (or None if generation failed), and its profiling
+    report (or None if profiling is disabled)."""
+    index, total, prefix, max_tries, seed = task
+    scene_filename = _generate_and_save_scene(
+        _worker_component_list,
+        index,
+        total,
+        prefix,
+        max_tries,
+        seed
+    )
+    worker_profiler = profiler.get_profiler()
+    if not worker_profiler:
+        return index, scene_filename, None
+    # Send the scene's profiling data to the main process, and start over.
+    report = worker_profiler.report()
+    worker_profiler.reset()
+    return index, scene_filename, report
+
+
+def _scene_seed(args: argparse.Namespace, index: int) -> Optional[int]:
+    """Return the deterministic random seed for the scene with the given
+    index, or None if no seed was given."""
+    return None if args.seed is None else args.seed + index
+
+
 def main(args):
     """Generate and save one or more MCS JSON scenes using the given config
     for the Interactive Learning Environment (ILE)."""
     logger.info('[*] Starting the ILE Scene Generator')
 
+    profile_filename = getattr(args, 'profile', None)
+    if not profile_filename:
+        _generate_scenes(args)
+        return
+
+    # Record where the time goes, and save the report even if it fails.
+    run_profiler = profiler.enable_profiling()
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    try:
+        _generate_scenes(args, run_profiler)
+    finally:
+        _save_profiling_report(
+            profile_filename,
+            args,
+            run_profiler,
+            time.perf_counter() - wall_start,
+            time.process_time() - cpu_start
+        )
+        profiler.disable_profiling()
+
+
+def _save_profiling_report(
+    filename: str,
+    args: argparse.Namespace,
+    run_profiler: profiler.GenerationProfiler,
+    wall_time: float,
+    cpu_time: float
+) -> None:
+    """Save the profiling report of the run with the given command line
+    arguments to the given JSON file. The CPU time is only for the main
+    process; the timings from worker processes are merged into the
+    report."""
+    report = {
+        'config': args.config,
+        'number': args.number,
+        'workers': getattr(args, 'workers', 1) or 1,
+        'seed': args.seed,
+        'wallTime': wall_time,
+        'cpuTime': cpu_time,
+        **run_profiler.report()
+    }
+    with open(filename, 'w') as report_file:
+        json.dump(report, report_file, indent=2)
+    logger.info(f'[*] Saved profiling report: {filename}')
+
+
+def _generate_scenes(
+    args: argparse.Namespace,
+    run_profiler: Optional[profiler.GenerationProfiler] = None
+) -> None:
+    """Generate and save the scenes for the given command line arguments.
+    If given a profiler, merge the profiling reports of any worker processes
+    into it."""
     # Read the ILE config data from the YAML config file.
     config_data = {}
     if args.config:
@@ -141,69 +534,95 @@ def main(args):
         with open(args.config) as config_file:
             config_data = yaml.safe_load(config_file)
 
+    max_tries = 1 if args.throw_error else MAX_TRIES
+    workers = getattr(args, 'workers', 1) or 1
+
+    # With a seed, every process must shuffle its datasets the same way, so
+    # each scene doesn't depend on which scenes its process made before it.
+    if args.seed is not None and definitions.DATASET_SHUFFLE_SEED != args.seed:
+        definitions.DATASET_SHUFFLE_SEED = args.seed
+        # Reshuffle any datasets that were already made.
+        definitions.DATASETS.clear()
+
+    if workers > 1:
+        logger.info(f'[*] Generating scenes using {workers} worker processes')
+        tasks = [
+            (index, args.number, args.prefix, max_tries,
+             _scene_seed(args, index))
+            for index in range(args.number)
+        ]
+        # Use spawn (rather than fork) so that no process-global state, like
+        # the ObjectRepository singleton, is shared with the workers.
+        context = multiprocessing.get_context('spawn')
+        with context.Pool(
+            processes=workers,
+            initializer=_init_worker,
+            initargs=(config_data, args, definitions.DATASET_SHUFFLE_SEED)
+        ) as pool:
+            for index, scene_filename, report in pool.imap_unordered(
+                _run_worker_task,
+                tasks
+            ):
+                if run_profiler and report:
+                    run_profiler.merge(report)
+                if not scene_filename:
+                    pool.terminate()
+                    sys.exit(1)
+        logger.info(f"[*] Generated {args.number} scenes successfully!")
+        return
+
     # Initialize each ILE component using the config data.
     component_list = [
         component_class(config_data) for component_class in ILE_COMPONENTS
     ]
 
-    max_tries = 1 if args.throw_error else MAX_TRIES
-    suffix = ".json"
-    for index in list(range(args.number)):
-        scene = None
-        # Find the next available scene filename and index. For example, if
-        # name_1.json already exists, then start with name_2.json.
-        scene_filename, scene_index = find_next_filename(
-            f'{args.prefix}{"_" if args.prefix else ""}',
-            index + 1,
-            '06', suffix=suffix
-        )
-
-        logger.info(
-            f'[+] Generating scene {index + 1} of {args.number}, '
-            f'filename: {scene_filename}{suffix}'
-        )
+    # Optionally save the scene files in background processes while the
+    # next scene is generated. On exit, wait for every scene to be saved.
+    save_workers = getattr(args, 'save_workers', 0) or 0
+    with (
+        SceneWriter(workers=save_workers, processes=True) if save_workers
+        else contextlib.nullcontext()
+    ) as scene_writer:
+        for index in list(range(args.number)):
+            scene_filename = _generate_and_save_scene(
+                component_list,
+                index,
+                args.number,
+                args.prefix,
+                max_tries,
+                _scene_seed(args, index),
+                scene_writer
+            )
+            if not scene_filename:
+                sys.exit(1)
+    logger.info(f"[*] Generated {args.number} scenes successfully!")
 
-        # Try creating the scene multiple times, in case a randomized setup
-        # doesn't work the first time.
-        tries = 0
-        while tries < max_tries:
-            tries += 1
-            try:
-                if (tries > 1):
-                    logger.info(
-                        f'Retrying generaton of scene {index + 1} of '
-                        f'{args.number} (try {tries} / {max_tries}), '
-                        f'filename: {scene_filename}{suffix}'
-                    )
-                scene = generate_ile_scene(component_list, scene_index)
-                break
-            except (
-                ILEException,
-                SceneException,
-                RuntimeError,
-                TypeError,
-                ValueError,
-                ZeroDivisionError
-            ):
-                error_message = (
-                    f'Failed to generate scene {index + 1} of '
-                    f'{args.number} (try {tries} / {max_tries}), '
-                    f'filename: {scene_filename}{suffix}'
-                )
-                if logger.isEnabledFor(logging.DEBUG) or (tries >= max_tries):
-                    logging.exception(error_message)
-                else:
-                    logger.info(error_message)
-                if tries >= max_tries:
-                    sys.exit(1)
 
-        # If successful, save the normal and debug JSON scene files.
-        save_scene_files(scene, scene_filename)
-        logger.info(
-            f'Finished generating scene {index + 1} of {args.number}, '
-            f'filename: {scene_filename}{suffix}'
+def _init_logging(args: argparse.Namespace) -> None:
+    """Initialize logging using the given command line arguments."""
+    if args.log_config == "dev":
+        dev = LoggingConfig.get_configurable_logging_config(
+            log_level=args.log_level or 'DEBUG',
+            logger_names=['ideal_learning_env'],
+            console=True, debug_file=True, info_file=False,
+            log_file_name="mcs", file_format='precise',
+            console_format='precise'
+        )
+        LoggingConfig.init_logging(log_config=dev)
+    elif not args.log_config:
+        std = LoggingConfig.get_configurable_logging_config(
+            log_level=args.log_level or 'INFO',
+            logger_names=['ideal_learning_env'],
+            console=True, debug_file=False, info_file=False,
+            log_file_name="mcs", file_format='precise',
+            console_format='precise'
+        )
+        LoggingConfig.init_logging(log_config=std)
+    else:
+        LoggingConfig.init_logging(
+            log_config=None,
+            log_config_file=args.log_config
         )
-    logger.info(f"[*] Generated {args.number} scenes successfully!")
 
 
 if __name__ == '__main__':
@@ -247,31 +666,44 @@ if __name__ == '__main__':
         action='store_true',
         help='Stop immediately if errors are thrown [default=False]'
     )
+    parser.add_argument(
+        '-w',
+        '--workers',
+        type=int,
+        default=1,
+        help='Number of worker processes generating scenes in parallel '
+        '[default=1]'
+    )
+    parser.add_argument(
+        '--save-workers',
+        type=int,
+        default=0,
+        help='Number of background processes saving scene files while the '
+        'next scene is generated; ignored if using more than one worker '
+        '[default=0]'
+    )
+    parser.add_argument(
+        '-s',
+        '--seed',
+        type=int,
+        default=None,
+        help='Random number seed; each scene N uses seed + N, and every '
+        'process shuffles its object datasets using the seed, so output '
+        '(other than object IDs) does not depend on the number of workers '
+        '[default=None]'
+    )
+    parser.add_argument(
+        '--profile',
+        type=str,
+        default=None,
+        help='Save a JSON report of the wall and CPU time spent in each ILE '
+        'component, creation service, and delayed action round, and the '
+        'counts of placement attempts, rejections, and scene retries, to '
+        'this file [default=None]'
+    )
 
     args = parser.parse_args()
 
-    if args.log_config == "dev":
-        dev = LoggingConfig.get_configurable_logging_config(
-            log_level=args.log_level or 'DEBUG',
-            logger_names=['ideal_learning_env'],
-            console=True, debug_file=True, info_file=False,
-            log_file_name="mcs", file_format='precise',
-            console_format='precise'
-        )
-        LoggingConfig.init_logging(log_config=dev)
-    elif not args.log_config:
-        std = LoggingConfig.get_configurable_logging_config(
-            log_level=args.log_level or 'INFO',
-            logger_names=['ideal_learning_env'],
-            console=True, debug_file=False, info_file=False,
-            log_file_name="mcs", file_format='precise',
-            console_format='precise'
-        )
-        LoggingConfig.init_logging(log_config=std)
-    else:
-        LoggingConfig.init_logging(
-            log_config=None,
-            log_config_file=args.log_config
-        )
+    _init_logging(args)
     logger = logging.getLogger('ideal_learning_env')
     main(args)
@@ -1,6 +1,11 @@
-from _ctypes import PyObj_FromPtr
 import json
-import re
+from json.encoder import (
+    INFINITY,
+    _make_iterencode,
+    c_make_encoder,
+    encode_basestring,
+    encode_basestring_ascii
+)
 
 # From
 # https://stackoverflow.com/questions/13249415/how-to-implement-custom-indentation-when-pretty-printing-with-the-json-module
@@ -13,46 +18,71 @@ class PrettyJsonNoIndent(object):
         self.value = value
 
 
+class _PrettyJsonRaw(str):
+    """ Already encoded JSON, written to the output as is. """
+
+
 class PrettyJsonEncoder(json.JSONEncoder):
-    FORMAT_SPEC = '@@{}@@'
-    regex = re.compile(FORMAT_SPEC.format(r'(\d+)'))
+    """JSON encoder that writes each value wrapped in PrettyJsonNoIndent on a
+    single line (without indentation), even if the rest of the output is
+    indented. Each wrapped value is encoded inline, in the same pass as the
+    rest of the output."""
 
     def __init__(self, **kwargs):
         # Save copy of any keyword argument values needed for use here.
         self.__sort_keys = kwargs.get('sort_keys', None)
+        self.__no_indent_encoder = None
         super(PrettyJsonEncoder, self).__init__(**kwargs)
 
     def default(self, obj):
-        return (
-            self.FORMAT_SPEC.format(id(obj))
-            if isinstance(obj, PrettyJsonNoIndent)
-            else super(PrettyJsonEncoder, self).default(obj)
+        if isinstance(obj, PrettyJsonNoIndent):
+            # Encode the wrapped value with its own compact encoder (which
+            # handles any nested wrapped values the same way).
+            if not self.__no_indent_encoder:
+                self.__no_indent_encoder = PrettyJsonEncoder(
+                    sort_keys=self.__sort_keys,
+                    separators=(',', ':')
+                )
+            return _PrettyJsonRaw(self.__no_indent_encoder.encode(obj.value))
+        return super(PrettyJsonEncoder, self).default(obj)
+
+    def iterencode(self, o, _one_shot=False):
+        # Same as JSONEncoder.iterencode, except that already encoded JSON
+        # returned by the default function isn't encoded again as a string.
+        markers = {} if self.check_circular else None
+        encode_string = (
+            encode_basestring_ascii if self.ensure_ascii
+            else encode_basestring
         )
 
-    def encode(self, obj):
-        format_spec = self.FORMAT_SPEC  # Local var to expedite access.
-        json_repr = super(PrettyJsonEncoder, self).encode(obj)  # Default JSON.
-
-        # Replace any marked-up object ids in the JSON repr with the
-        # value returned from the json.dumps() of the corresponding
-        # wrapped Python object.
-        for match in self.regex.finditer(json_repr):
-            # see https://stackoverflow.com/a/15012814/355230
-            id = int(match.group(1))
-            no_indent = PyObj_FromPtr(id)
-            json_obj_repr = json.dumps(
-                no_indent.value,
-                cls=PrettyJsonEncoder,
-                sort_keys=self.__sort_keys,
-                separators=(
-                    ',',
-                    ':'))
-
-            # Replace the matched id string with json formatted representation
-            # of the corresponding Python object.
-            json_repr = json_repr.replace(
-                '"{}"'.format(
-                    format_spec.format(id)),
-                json_obj_repr)
-
-        return json_repr
+        def _encoder(o):
+            return o if isinstance(o, _PrettyJsonRaw) else encode_string(o)
+
+        def floatstr(o, allow_nan=self.allow_nan, _repr=float.__repr__,
+                     _inf=INFINITY, _neginf=-INFINITY):
+            if o != o:
+                text = 'NaN'
+            elif o == _inf:
+                text = 'Infinity'
+            elif o == _neginf:
+                text = '-Infinity'
+            else:
+                return _repr(o)
+            if not allow_nan:
+                raise ValueError(
+                    "Out of range float values are not JSON compliant: " +
+                    repr(o))
+            return text
+
+        if (_one_shot and c_make_encoder is not None and
+                self.indent is None):
+            _iterencode = c_make_encoder(
+                markers, self.default, _encoder, self.indent,
+                self.key_separator, self.item_separator, self.sort_keys,
+                self.skipkeys, self.allow_nan)
+        else:
+            _iterencode = _make_iterencode(
+                markers, self.default, _encoder, self.indent, floatstr,
+                self.key_separator, self.item_separator, self.sort_keys,
+                self.skipkeys, _one_shot)
+        return _iterencode(o, 0)
@@ -1,4 +1,8 @@
 import copy
+import io
+import json
+import math
+import pickle
 
 import pytest
 from machine_common_sense.config_manager import Goal, Vector3d
@@ -21,9 +25,12 @@ from hypercube.agent_scene_pair_json_converter import (
     ObjectConfig,
     ObjectConfigWithMaterial,
     OccluderMode,
+    BoundsTrack,
     TrueObjectBounds,
+    TrueShape,
     _append_each_show_to_object,
     _choose_config_list,
+    _compact_object_tracks,
     _create_action_list,
     _create_agent_object_list,
     _create_fuse_wall_object_list,
@@ -39,15 +46,19 @@ from hypercube.agent_scene_pair_json_converter import (
     _create_static_wall_object_list,
     _create_trial_frame_list,
     _create_wall_object_list,
+    _find_overlapping_objects,
     _fix_key_location,
     _identify_trial_index_starting_step,
+    _iterate_json_list,
     _make_true_bounds,
     _move_agent_adjacent_to_goal,
     _move_agent_past_lock_location,
     _remove_extraneous_object_show,
     _remove_intersecting_agent_steps,
     _reposition_agents_away_from_paddle,
-    _retrieve_unit_size
+    _retrieve_unit_size,
+    _validate_trials,
+    read_trial_list
 )
 
 UNIT_SIZE = [0.025, 0.025]
@@ -3736,6 +3747,175 @@ def test_create_wall_object_list_with_fuse_multiple_trials():
     verify_fuse_wall_list_trial_2(wall_object_list[9:])
 
 
+def test_find_overlapping_objects():
+    bounds_a = create_simple_bounds(0, 0.25, 0, 0.25)
+    bounds_b = create_simple_bounds(0.5, 0.75, 0.5, 0.75)
+    bounds_c = create_simple_bounds(1, 1.25, 1, 1.25)
+    agent = {
+        'id': 'agent_1',
+        'debug': {
+            'boundsAtStep': [bounds_a, bounds_a, None, bounds_b, bounds_c]
+        }
+    }
+    # Same bounds as the agent at step 0-1 (within), overlapping at step 3.
+    object_1 = {
+        'id': 'object_1',
+        'debug': {
+            'boundsAtStep': [bounds_a] * 3 + [
+                create_simple_bounds(0.6, 1.1, 0.6, 1.1),
+                None
+            ]
+        }
+    }
+    # Only touching the agent at step 3-4 (doesn't overlap).
+    object_2 = {
+        'id': 'wall_2',
+        'debug': {
+            'boundsAtStep': [create_simple_bounds(0.75, 1, 0.5, 1)] * 5
+        }
+    }
+    # Overlapping at every step.
+    object_3 = {
+        'id': 'wall_3',
+        'debug': {'boundsAtStep': [create_simple_bounds(-1, 2, -1, 2)] * 5}
+    }
+    object_to_boxes = {}
+    assert _find_overlapping_objects(
+        agent,
+        [object_1, object_2, object_3, agent],
+        0,
+        4,
+        object_to_boxes
+    ) == {
+        0: ['object_1', 'wall_3'],
+        1: ['object_1', 'wall_3'],
+        3: ['object_1', 'wall_3'],
+        4: ['wall_3']
+    }
+    assert sorted(object_to_boxes) == sorted(
+        [id(object_1), id(object_2), id(object_3)]
+    )
+    assert _find_overlapping_objects(
+        agent,
+        [object_2, object_1],
+        1,
+        3,
+        object_to_boxes
+    ) == {1: ['object_1'], 3: ['object_1']}
+
+
+def test_make_true_bounds_true_poly_on_demand():
+    bounds = create_ellipsoidal_bounds(1, 2, 0.5, 0.25)
+    assert bounds.true_shape == TrueShape('cylinder', 1, 2, 1, 0.5, 0, 0, 0)
+    true_poly = bounds.true_poly
+    assert true_poly.area == pytest.approx(math.pi * 0.5 * 0.25, rel=0.01)
+    assert bounds.true_poly is true_poly
+
+    bounds.release_polygons()
+    assert bounds.true_poly is not true_poly
+    assert bounds.true_poly.equals(true_poly)
+
+    # The polygon isn't pickled, but is made again after unpickling.
+    copied_bounds = pickle.loads(pickle.dumps(bounds))
+    assert copied_bounds == bounds
+    assert copied_bounds.true_shape == bounds.true_shape
+    assert copied_bounds.true_poly.equals(true_poly)
+
+    # A custom polygon is never released.
+    bounds = create_simple_bounds(0, 1, 0, 1)
+    assert bounds.true_shape is None
+    true_poly = bounds.true_poly
+    bounds.release_polygons()
+    assert bounds.true_poly is true_poly
+
+
+def test_bounds_track():
+    bounds_a = create_ellipsoidal_bounds(1, 2, 0.5, 0.25)
+    bounds_b = _make_true_bounds(
+        'cylinder',
+        dimensions={'x': 0.3, 'y': 0.4, 'z': 0.2},
+        offset={'x': 0.01, 'y': 0, 'z': 0.02},
+        position={'x': -1.25, 'y': 0.2, 'z': 0.75},
+        rotation={'x': 0, 'y': 45, 'z': 0},
+        standing_y=0.1
+    )
+    bounds_list = [bounds_a, bounds_a, None, bounds_b, None]
+    track = BoundsTrack.from_bounds_list(bounds_list)
+    assert len(track) == 5
+    assert track.step_to_index.tolist() == [0, 0, -1, 1, -1]
+    for step, bounds in enumerate(bounds_list):
+        if bounds is None:
+            assert track[step] is None
+            continue
+        assert track[step] == bounds
+        assert track[step].true_shape == bounds.true_shape
+        assert track[step].true_poly.equals(bounds.true_poly)
+    assert track[-2] == bounds_b
+    assert track[1:4] == [bounds_a, None, bounds_b]
+    assert list(track) == bounds_list
+    with pytest.raises(IndexError):
+        track[5]
+
+    assert len(BoundsTrack.from_bounds_list([None, None])) == 2
+    assert len(BoundsTrack.from_bounds_list([])) == 0
+
+    # Bounds with custom polygons or different types can't be compacted.
+    assert BoundsTrack.from_bounds_list([
+        bounds_a,
+        create_simple_bounds(0, 1, 0, 1)
+    ]) is None
+    assert BoundsTrack.from_bounds_list([
+        bounds_a,
+        _make_true_bounds(
+            'cube',
+            dimensions={'x': 1, 'y': 1, 'z': 1},
+            offset=None,
+            position={'x': 0, 'y': 0, 'z': 0},
+            rotation={'x': 0, 'y': 0, 'z': 0},
+            standing_y=0
+        )
+    ]) is None
+
+
+def test_compact_object_tracks():
+    bounds_a = create_ellipsoidal_bounds(1, 2, 0.5, 0.25)
+    bounds_b = create_ellipsoidal_bounds(1.5, 2, 0.5, 0.25)
+    true_poly_a = bounds_a.true_poly
+    simple_bounds = create_simple_bounds(0, 1, 0, 1)
+    agent = {
+        'id': 'agent',
+        'shows': [
+            {'stepBegin': 0, 'boundingBox': bounds_a},
+            {'stepBegin': 2, 'boundingBox': bounds_b}
+        ],
+        'debug': {'boundsAtStep': [bounds_a, bounds_a, bounds_b, None]}
+    }
+    wall = {
+        'id': 'wall',
+        'shows': [{'stepBegin': 0, 'boundingBox': simple_bounds}],
+        'debug': {'boundsAtStep': [simple_bounds] * 4}
+    }
+    platform = {'id': 'platform', 'shows': [{'stepBegin': 0}], 'debug': {}}
+    _compact_object_tracks([agent, wall, platform])
+
+    assert isinstance(agent['debug']['boundsAtStep'], BoundsTrack)
+    assert list(agent['debug']['boundsAtStep']) == [
+        bounds_a,
+        bounds_a,
+        bounds_b,
+        None
+    ]
+    assert agent['shows'][0]['boundingBox'] is bounds_a
+    assert bounds_a.true_poly is not true_poly_a
+    assert bounds_a.true_poly.equals(true_poly_a)
+    assert wall['debug']['boundsAtStep'] == [simple_bounds] * 4
+    assert platform == {
+        'id': 'platform',
+        'shows': [{'stepBegin': 0}],
+        'debug': {}
+    }
+
+
 def test_fix_key_location():
     # negative_x
     json_key = [[90, 90], 10, 'triangle0.png']
@@ -3966,6 +4146,32 @@ def test_identify_trial_index_starting_step():
     assert _identify_trial_index_starting_step(2, trial_list_b) == 7
 
 
+def test_iterate_json_list(monkeypatch):
+    data = [
+        [{'agent': [[25, 25], 5, 'agent_1']}, {'a': None, 'b': 'c,]'}],
+        1.25,
+        -100,
+        None,
+        [],
+        {}
+    ]
+    for read_size in [1, 2, 1000]:
+        monkeypatch.setattr(
+            'hypercube.agent_scene_pair_json_converter.JSON_READ_SIZE',
+            read_size
+        )
+        for text in [json.dumps(data), json.dumps(data, indent=2), '[]']:
+            assert list(_iterate_json_list(io.StringIO(text))) == (
+                json.loads(text)
+            )
+
+
+def test_iterate_json_list_invalid():
+    for text in ['', '{}', '[1', '[1,', '[1 2]', '[1,]', '[{"a":}]']:
+        with pytest.raises(json.JSONDecodeError):
+            list(_iterate_json_list(io.StringIO(text)))
+
+
 def test_move_agent_adjacent_to_goal():
     agent = create_test_agent_moving_diagonally()
     original = copy.deepcopy(agent['shows'])
@@ -5017,6 +5223,53 @@ def test_move_agent_past_lock_location_with_ellipses():
     assert len(agent_object['shows']) == 12
 
 
+def create_test_trial_file_data():
+    trial = [{
+        'agent': [[25, 25], 5, 'agent_1'],
+        'size': [200, 200]
+    }] + [{
+        'agent': [[25, 25 + (index // 3)], 5, 'agent_1']
+    } for index in range(30)]
+    return trial, [copy.deepcopy(trial) for _ in range(9)]
+
+
+def test_read_trial_list(tmp_path):
+    trial, trial_list = create_test_trial_file_data()
+    # Sometimes frames are nested in lists.
+    trial_list[1][5] = [trial[5], trial[6]]
+    (tmp_path / 'scene_e.json').write_text(json.dumps(trial_list))
+    validated_trial_list = _validate_trials(
+        copy.deepcopy(trial_list),
+        'scene_',
+        'e'
+    )
+    expected = [
+        _create_trial_frame_list(data, index) for index, data
+        in enumerate(validated_trial_list)
+    ]
+    actual = read_trial_list(str(tmp_path / 'scene_e.json'), 'scene_', 'e')
+    assert len(actual) == 9
+    assert actual == expected
+
+
+def test_read_trial_list_collapse_final_trial(tmp_path):
+    trial, trial_list = create_test_trial_file_data()
+    # Sometimes the final trial's frames aren't in their own list.
+    trial_list = trial_list[:8] + trial
+    (tmp_path / 'scene_e.json').write_text(json.dumps(trial_list))
+    actual = read_trial_list(str(tmp_path / 'scene_e.json'), 'scene_', 'e')
+    assert len(actual) == 9
+    assert actual[8] == _create_trial_frame_list(trial, 8)
+
+
+def test_read_trial_list_too_many_trials(tmp_path):
+    _, trial_list = create_test_trial_file_data()
+    trial_list = [{'agent': None}] + trial_list
+    (tmp_path / 'scene_e.json').write_text(json.dumps(trial_list))
+    with pytest.raises(Exception, match='Too many trials in scene_e'):
+        read_trial_list(str(tmp_path / 'scene_e.json'), 'scene_', 'e')
+
+
 def test_remove_extraneous_object_show_single_step():
     agent_object_list = [{
         'debug': {},
@@ -0,0 +1,105 @@
+import copy
+
+from machine_common_sense.config_manager import Vector3d
+
+from generator import ObjectBounds
+from generator.bounds_index import IndexedBoundsList
+
+
+def create_bounds(x: float, z: float, size: float = 1) -> ObjectBounds:
+    return ObjectBounds(box_xz=[
+        Vector3d(x=x, y=0, z=z),
+        Vector3d(x=x + size, y=0, z=z),
+        Vector3d(x=x + size, y=0, z=z + size),
+        Vector3d(x=x, y=0, z=z + size)
+    ], max_y=1, min_y=0)
+
+
+def test_indexed_bounds_list_find_nearby():
+    bounds_1 = create_bounds(0.1, 0.1, 0.5)
+    bounds_2 = create_bounds(3.1, 3.1, 0.5)
+    bounds_3 = create_bounds(-4, -4, 8)
+    bounds_list = IndexedBoundsList([bounds_1, bounds_2, bounds_3])
+    assert bounds_list == [bounds_1, bounds_2, bounds_3]
+    assert bounds_list.find_nearby(bounds_1.box_xz) == [bounds_1, bounds_3]
+    assert bounds_list.find_nearby(bounds_2.box_xz) == [bounds_2, bounds_3]
+    assert bounds_list.find_nearby(create_bounds(-10, -10).box_xz) == []
+
+
+def test_indexed_bounds_list_find_nearby_touching():
+    bounds_1 = create_bounds(0, 0, 1)
+    bounds_list = IndexedBoundsList([bounds_1])
+    # Bounds that only share an edge may still collide.
+    assert bounds_list.find_nearby(create_bounds(1, 0).box_xz) == [bounds_1]
+    assert bounds_list.find_nearby(create_bounds(-1, 0).box_xz) == [bounds_1]
+
+
+def test_indexed_bounds_list_mutation():
+    bounds_1 = create_bounds(0.1, 0.1, 0.5)
+    bounds_2 = create_bounds(3.1, 3.1, 0.5)
+    bounds_list = IndexedBoundsList()
+    bounds_list.append(bounds_1)
+    assert bounds_list.find_nearby(bounds_1.box_xz) == [bounds_1]
+    bounds_list.extend([bounds_2])
+    assert bounds_list.find_nearby(bounds_2.box_xz) == [bounds_2]
+    bounds_list.remove(bounds_1)
+    assert bounds_list.find_nearby(bounds_1.box_xz) == []
+    bounds_list[0] = bounds_1
+    assert bounds_list.find_nearby(bounds_1.box_xz) == [bounds_1]
+    assert bounds_list.find_nearby(bounds_2.box_xz) == []
+    bounds_list.pop()
+    assert bounds_list == []
+    assert bounds_list.find_nearby(bounds_1.box_xz) == []
+
+
+def test_indexed_bounds_list_copy():
+    bounds_1 = create_bounds(0.1, 0.1, 0.5)
+    bounds_2 = create_bounds(3.1, 3.1, 0.5)
+    bounds_list = IndexedBoundsList([bounds_1])
+
+    copy_list = bounds_list.copy()
+    copy_list.append(bounds_2)
+    assert isinstance(copy_list, IndexedBoundsList)
+    assert bounds_list == [bounds_1]
+    assert bounds_list.find_nearby(bounds_2.box_xz) == []
+    assert copy_list.find_nearby(bounds_2.box_xz) == [bounds_2]
+
+    add_list = bounds_list + [bounds_2]
+    assert isinstance(add_list, IndexedBoundsList)
+    assert add_list == [bounds_1, bounds_2]
+    assert add_list.find_nearby(bounds_2.box_xz) == [bounds_2]
+
+    deep_list = copy.deepcopy(add_list)
+    assert isinstance(deep_list, IndexedBoundsList)
+    assert deep_list == [bounds_1, bounds_2]
+    assert deep_list.find_nearby(bounds_2.box_xz) == [deep_list[1]]
+
+
+def test_indexed_bounds_list_copy_on_write():
+    bounds_1 = create_bounds(0.1, 0.1, 0.5)
+    bounds_2 = create_bounds(0.2, 0.2, 0.5)
+    bounds_3 = create_bounds(3.1, 3.1, 0.5)
+    bounds_list = IndexedBoundsList([bounds_1])
+
+    # Copies share the grid until one of them is changed.
+    copy_1 = bounds_list.copy()
+    copy_2 = bounds_list.copy()
+    assert copy_1._grid is bounds_list._grid
+    copy_1.append(bounds_2)
+    copy_2.append(bounds_3)
+    bounds_list.append(bounds_3)
+    assert bounds_list.find_nearby(bounds_1.box_xz) == [bounds_1]
+    assert bounds_list.find_nearby(bounds_3.box_xz) == [bounds_3]
+    assert copy_1.find_nearby(bounds_1.box_xz) == [bounds_1, bounds_2]
+    assert copy_1.find_nearby(bounds_3.box_xz) == []
+    assert copy_2.find_nearby(bounds_1.box_xz) == [bounds_1]
+    assert copy_2.find_nearby(bounds_3.box_xz) == [bounds_3]
+
+    # A copy of a copy works the same way.
+    copy_3 = copy_1.copy()
+    copy_3.append(bounds_3)
+    assert copy_1.find_nearby(bounds_3.box_xz) == []
+    assert copy_3.find_nearby(bounds_3.box_xz) == [bounds_3]
+    copy_1.remove(bounds_2)
+    assert copy_1.find_nearby(bounds_1.box_xz) == [bounds_1]
+    assert copy_3.find_nearby(bounds_1.box_xz) == [bounds_1, bounds_2]
@@ -0,0 +1,14 @@
+import os
+import shutil
+import tempfile
+
+# Keep the expanded dataset cache out of the developer's home directory, so
+# the tests don't depend on (or add to) whatever is cached there. Set it in
+# the environment before the generator is imported, so subprocesses (like
+# worker processes) use the same temporary cache.
+_DATASET_CACHE_DIR = tempfile.mkdtemp(prefix='mcs-dataset-cache-')
+os.environ['MCS_DATASET_CACHE_DIR'] = _DATASET_CACHE_DIR
+
+
+def pytest_unconfigure(config):
+    shutil.rmtree(_DATASET_CACHE_DIR, ignore_errors=True)
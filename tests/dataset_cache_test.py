@@ -0,0 +1,133 @@
+import pytest
+from machine_common_sense.config_manager import Vector3d
+from shapely.geometry import Polygon
+
+from generator import MaterialChoice, ObjectDefinition, dataset_cache
+from generator.dataset_cache import (
+    find_dataset_cache_path,
+    load_cached_dataset,
+    save_cached_dataset
+)
+from generator.definitions import create_dataset
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(monkeypatch, tmp_path):
+    monkeypatch.setattr(dataset_cache, 'DATASET_CACHE_DIR', str(tmp_path))
+    yield tmp_path
+
+
+def create_definition_list():
+    return [[
+        ObjectDefinition(
+            type='a',
+            dimensions=Vector3d(x=1, y=1, z=1),
+            chooseMaterialList=[
+                MaterialChoice(materialCategory=['metal']),
+                MaterialChoice(materialCategory=['plastic'])
+            ]
+        ),
+        ObjectDefinition(type='b', dimensions=Vector3d(x=2, y=2, z=2))
+    ]]
+
+
+def test_find_dataset_cache_path(cache_dir):
+    path = find_dataset_cache_path('TEST', create_definition_list())
+    assert path.parent == cache_dir
+    assert path.name.startswith('TEST-')
+    assert path.suffix == '.pickle'
+    assert find_dataset_cache_path('TEST', create_definition_list()) == path
+
+    definition_list = create_definition_list()
+    definition_list[0][1].dimensions.x = 3
+    assert find_dataset_cache_path('TEST', definition_list) != path
+    assert find_dataset_cache_path('OTHER', create_definition_list()) != path
+
+
+def test_find_dataset_cache_path_with_poly():
+    definition_list = create_definition_list()
+    definition_list[0][1].poly = Polygon([(0, 0), (0, 1), (1, 1)])
+    path = find_dataset_cache_path('TEST', definition_list)
+    definition_list = create_definition_list()
+    definition_list[0][1].poly = Polygon([(0, 0), (0, 1), (1, 1)])
+    assert find_dataset_cache_path('TEST', definition_list) == path
+    definition_list[0][1].poly = Polygon([(0, 0), (0, 2), (2, 2)])
+    assert find_dataset_cache_path('TEST', definition_list) != path
+
+
+def test_find_dataset_cache_path_disabled(monkeypatch):
+    monkeypatch.setattr(dataset_cache, 'DATASET_CACHE_DIR', None)
+    assert find_dataset_cache_path('TEST', create_definition_list()) is None
+    assert load_cached_dataset(None) is None
+    save_cached_dataset(None, ((),))
+
+
+def test_save_and_load_cached_dataset(cache_dir):
+    path = find_dataset_cache_path('TEST', create_definition_list())
+    assert load_cached_dataset(path) is None
+    save_cached_dataset(path, (('a', 'b'), ('c',)))
+    assert load_cached_dataset(path) == (('a', 'b'), ('c',))
+    assert list(cache_dir.iterdir()) == [path]
+
+
+def test_save_cached_dataset_removes_outdated(cache_dir):
+    path_1 = find_dataset_cache_path('TEST', create_definition_list())
+    save_cached_dataset(path_1, ('a',))
+    other_path = find_dataset_cache_path('OTHER', create_definition_list())
+    save_cached_dataset(other_path, ('b',))
+
+    definition_list = create_definition_list()
+    definition_list[0][1].dimensions.x = 3
+    path_2 = find_dataset_cache_path('TEST', definition_list)
+    save_cached_dataset(path_2, ('c',))
+    assert not path_1.exists()
+    assert sorted(cache_dir.iterdir()) == sorted([path_2, other_path])
+
+
+def test_load_cached_dataset_corrupt(cache_dir):
+    path = find_dataset_cache_path('TEST', create_definition_list())
+    path.write_bytes(b'corrupt')
+    assert load_cached_dataset(path) is None
+
+
+def test_create_dataset_cached(cache_dir, monkeypatch):
+    dataset_1 = create_dataset(
+        create_definition_list(),
+        unshuffled=True,
+        cache_name='TEST'
+    )
+    assert dataset_1._definition_groups == create_dataset(
+        create_definition_list(),
+        unshuffled=True
+    )._definition_groups
+    assert len(list(cache_dir.iterdir())) == 1
+
+    # The second dataset must be loaded from the cache.
+    def _fail(*args, **kwargs):
+        raise AssertionError('Expanded the definitions again')
+
+    monkeypatch.setattr(
+        'generator.definitions.retrieve_complete_definition_list',
+        _fail
+    )
+    dataset_2 = create_dataset(
+        create_definition_list(),
+        unshuffled=True,
+        cache_name='TEST'
+    )
+    assert dataset_2._definition_groups == dataset_1._definition_groups
+
+    # Shuffled datasets are loaded from the same cache.
+    dataset_3 = create_dataset(create_definition_list(), cache_name='TEST')
+    assert dataset_3.size() == dataset_1.size()
+    assert sorted(
+        definition.materials or [] for definition in dataset_3.definitions()
+    ) == sorted(
+        definition.materials or [] for definition in dataset_1.definitions()
+    )
+
+
+def test_create_dataset_not_cached(cache_dir):
+    create_dataset(create_definition_list(), unshuffled=True)
+    create_dataset(create_definition_list())
+    assert list(cache_dir.iterdir()) == []
@@ -1,3 +1,5 @@
+import copy
+
 import pytest
 from machine_common_sense.config_manager import Vector3d
 
@@ -12,6 +14,8 @@ from generator import (
 )
 from generator.definitions import (
     create_dataset,
+    create_definition_from_immutable,
+    create_immutable_definition,
     finalize_each_definition_choice,
     finalize_object_definition,
     finalize_object_materials_and_colors,
@@ -159,6 +163,104 @@ def test_definition_dataset_definitions():
         assert isinstance(definition, ObjectDefinition)
 
 
+def test_create_definition_from_immutable():
+    immutable = ImmutableObjectDefinition(
+        type='a',
+        attributes=['pickupable'],
+        dimensions=Vector3d(x=1, y=2, z=3),
+        materials=['Custom/Materials/Metal'],
+        mass=2
+    )
+    definition = create_definition_from_immutable(immutable)
+    assert isinstance(definition, ObjectDefinition)
+    assert definition == ObjectDefinition(**immutable._asdict())
+    assert ObjectDefinition(**immutable._asdict()) == definition
+    assert definition.type == 'a'
+    assert definition.attributes == ['pickupable']
+    assert definition.dimensions == Vector3d(x=1, y=2, z=3)
+    assert definition.mass == 2
+    # Same defaults as the ObjectDefinition constructor.
+    assert definition.massMultiplier == 1
+    assert definition.offset == Vector3d()
+    assert definition.rotation == Vector3d()
+    assert definition.shape == []
+    assert definition.chooseMaterialList == []
+
+
+def test_create_definition_from_immutable_copies_on_read():
+    immutable = ImmutableObjectDefinition(
+        type='a',
+        attributes=['pickupable'],
+        dimensions=Vector3d(x=1, y=2, z=3)
+    )
+    definition = create_definition_from_immutable(immutable)
+    definition.attributes.append('receptacle')
+    definition.dimensions.x = 4
+    definition.type = 'b'
+    assert definition.attributes == ['pickupable', 'receptacle']
+    assert definition.dimensions == Vector3d(x=4, y=2, z=3)
+    assert definition.type == 'b'
+    assert immutable.attributes == ['pickupable']
+    assert immutable.dimensions == Vector3d(x=1, y=2, z=3)
+    assert immutable.type == 'a'
+
+    # Each definition has its own copies.
+    definition_2 = create_definition_from_immutable(immutable)
+    assert definition_2.attributes == ['pickupable']
+    assert definition_2.dimensions == Vector3d(x=1, y=2, z=3)
+    assert definition_2.type == 'a'
+
+
+def test_create_definition_from_immutable_deepcopy():
+    immutable = ImmutableObjectDefinition(
+        type='a',
+        dimensions=Vector3d(x=1, y=2, z=3)
+    )
+    definition = create_definition_from_immutable(immutable)
+    definition.dimensions.x = 4
+    definition_copy = copy.deepcopy(definition)
+    assert definition_copy == definition
+    assert definition_copy._immutable is immutable
+    definition_copy.dimensions.y = 5
+    assert definition.dimensions == Vector3d(x=4, y=2, z=3)
+    assert definition_copy.dimensions == Vector3d(x=4, y=5, z=3)
+    assert immutable.dimensions == Vector3d(x=1, y=2, z=3)
+
+
+def test_create_definition_from_immutable_single_choice():
+    immutable = ImmutableObjectDefinition(type='a', chooseSizeList=[
+        SizeChoice(dimensions=Vector3d(x=1, y=1, z=1), mass=2)
+    ])
+    definition = create_definition_from_immutable(immutable)
+    assert definition == ObjectDefinition(**immutable._asdict())
+    assert definition.chooseSizeList == []
+    assert definition.dimensions == Vector3d(x=1, y=1, z=1)
+    assert definition.mass == 2
+
+
+def test_create_immutable_definition():
+    definition = ObjectDefinition(type='a', attributes=['pickupable'])
+    immutable = create_immutable_definition(definition)
+    assert immutable == ImmutableObjectDefinition(**vars(definition))
+    definition_2 = create_definition_from_immutable(immutable)
+    definition_2.type = 'b'
+    assert create_immutable_definition(definition_2).type == 'b'
+    assert create_immutable_definition(definition_2).attributes == [
+        'pickupable'
+    ]
+
+
+def test_definition_dataset_definitions_are_copies():
+    dataset = create_interesting_dataset()
+    for definition in dataset.definitions():
+        definition.type = 'z'
+        if definition.dimensions:
+            definition.dimensions.x = 100
+    for definition in dataset.definitions():
+        assert definition.type != 'z'
+        assert not definition.dimensions or definition.dimensions.x != 100
+
+
 def test_definition_dataset_filter_on_trained():
     dataset = create_dataset([[
         ObjectDefinition(type='a'),
@@ -216,6 +318,133 @@ def test_definition_dataset_filter_on_untrained():
     assert actual_2[0].type == 'f'
 
 
+def test_definition_dataset_filter_on_type():
+    dataset = create_interesting_dataset()
+
+    actual_1 = dataset.filter_on_type(must_be=['a', 'c']).definitions(
+        unshuffled=True
+    )
+    assert len(actual_1) == 3
+    assert set(definition.type for definition in actual_1) == {'a', 'c'}
+
+    actual_2 = dataset.filter_on_type(cannot_be=['a', 'd']).definitions(
+        unshuffled=True
+    )
+    assert len(actual_2) == 19
+    assert set(definition.type for definition in actual_2) == {'b', 'c'}
+
+    assert dataset.filter_on_type().size() == 108
+    assert dataset.filter_on_type(must_be=['foobar']).size() == 0
+
+
+def test_definition_dataset_filter_keeps_groups():
+    dataset = create_interesting_dataset()
+    filtered = dataset.filter_on_type(cannot_be=['b'])
+    assert isinstance(filtered._definition_groups, tuple)
+    assert len(filtered._definition_groups) == 2
+    assert len(filtered._definition_groups[0]) == 3
+    assert filtered._definition_groups[0][0][0].type == 'a'
+    assert filtered._definition_groups[0][1][0].type == 'c'
+    assert len(filtered._definition_groups[1]) == 4
+    assert filtered._definition_groups[1][0][0].type == 'd'
+
+
+def test_definition_dataset_filter_memoized():
+    dataset = create_interesting_dataset()
+    filtered = dataset.filter_on_type(must_be=['a'])
+    assert dataset.filter_on_type(must_be=['a']) is filtered
+    assert dataset.filter_on_type(must_be=['b']) is not filtered
+    assert dataset.filter_on_trained() is dataset.filter_on_trained()
+    assert (
+        dataset.filter_on_untrained('untrainedShape') is
+        dataset.filter_on_untrained('untrainedShape')
+    )
+
+
+def test_definition_dataset_filter_on_similar():
+    dataset = create_dataset([[
+        ObjectDefinition(
+            type='a',
+            materials=['blue'],
+            color=['blue'],
+            dimensions=Vector3d(x=1, y=1, z=1)
+        ),
+        ObjectDefinition(
+            type='a',
+            materials=['red'],
+            color=['red'],
+            dimensions=Vector3d(x=1, y=1, z=1)
+        ),
+        ObjectDefinition(
+            type='a',
+            materials=['blue'],
+            color=['blue'],
+            dimensions=Vector3d(x=2, y=2, z=2)
+        ),
+        ObjectDefinition(
+            type='b',
+            materials=['blue'],
+            color=['blue'],
+            dimensions=Vector3d(x=1.04, y=1, z=1)
+        ),
+        ObjectDefinition(
+            type='b',
+            materials=['red'],
+            color=['red'],
+            dimensions=Vector3d(x=1, y=1, z=1)
+        ),
+        ObjectDefinition(
+            type='c',
+            color=['blue', 'green'],
+            dimensions=Vector3d(x=0.96, y=1, z=1)
+        )
+    ]], unshuffled=True)
+    target = ObjectDefinition(
+        type='a',
+        materials=['blue'],
+        color=['blue'],
+        dimensions=Vector3d(x=1, y=1, z=1)
+    )
+
+    actual_1 = dataset.filter_on_similar_except_color(target).definitions(
+        unshuffled=True
+    )
+    assert [(item.type, item.materials) for item in actual_1] == [
+        ('a', ['red'])
+    ]
+
+    actual_2 = dataset.filter_on_similar_except_shape(target).definitions(
+        unshuffled=True
+    )
+    assert [(item.type, item.materials) for item in actual_2] == [
+        ('b', ['blue']), ('c', [])
+    ]
+
+    actual_3 = dataset.filter_on_similar_except_size(target).definitions(
+        unshuffled=True
+    )
+    assert [(item.type, item.dimensions.x) for item in actual_3] == [
+        ('a', 2)
+    ]
+
+    assert dataset.filter_on_similar_except_color(target) is (
+        dataset.filter_on_similar_except_color(target)
+    )
+    assert dataset.filter_on_similar_except_color(target) is not (
+        dataset.filter_on_similar_except_color(
+            target,
+            only_diagonal_size=True
+        )
+    )
+
+
+def test_definition_dataset_size():
+    dataset = create_interesting_dataset()
+    assert dataset.size() == 108
+    assert dataset.filter_on_type(must_be=['d']).size() == 88
+    assert dataset.filter_on_type(must_be=['foobar']).size() == 0
+
+
 def test_finalize_each_definition_choice():
     definition = ObjectDefinition(
         type='test_type',
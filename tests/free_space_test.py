@@ -0,0 +1,73 @@
+import random
+
+import pytest
+from shapely.geometry import Point, box
+
+from generator.free_space import FreeSpace
+
+ROOM_DIMENSIONS = {'x': 10, 'y': 3, 'z': 8}
+
+
+def create_points(min_x, min_z, max_x, max_z):
+    return [(max_x, max_z), (max_x, min_z), (min_x, min_z), (min_x, max_z)]
+
+
+def test_free_space_empty_room():
+    free_space = FreeSpace(
+        create_points(-0.5, -0.25, 0.5, 0.25),
+        [],
+        ROOM_DIMENSIONS
+    )
+    assert free_space.region.bounds == (-4.5, -3.75, 4.5, 3.75)
+    assert free_space.area == pytest.approx(9 * 7.5)
+
+
+def test_free_space_obstacles():
+    # The footprint is offset from the object's position.
+    footprint = create_points(0, -0.5, 1, 0.5)
+    obstacles = [create_points(-1, -1, 1, 1), create_points(2, 2, 3, 3)]
+    free_space = FreeSpace(footprint, obstacles, ROOM_DIMENSIONS)
+    assert free_space.region.equals(
+        box(-5, -3.5, 4, 3.5)
+        .difference(box(-2, -1.5, 1, 1.5))
+        .difference(box(1, 1.5, 3, 3.5))
+    )
+
+
+def test_free_space_too_big():
+    free_space = FreeSpace(
+        create_points(-6, -1, 6, 1),
+        [],
+        ROOM_DIMENSIONS
+    )
+    assert free_space.area == 0
+    assert free_space.sample() is None
+
+
+def test_free_space_full():
+    free_space = FreeSpace(
+        create_points(-0.5, -0.5, 0.5, 0.5),
+        [create_points(-5, -4, 5, 4)],
+        ROOM_DIMENSIONS
+    )
+    assert free_space.area == 0
+    assert free_space.sample() is None
+
+
+def test_free_space_sample():
+    footprint = create_points(-0.3, -0.3, 0.3, 0.3)
+    obstacles = [
+        [(1, 1), (2, -1), (0, -2), (-1, 0)],
+        [(3, 3), (4, 3), (4, 4)],
+        create_points(-5, -4, -2, 4)
+    ]
+    free_space = FreeSpace(footprint, obstacles, ROOM_DIMENSIONS)
+    random.seed(1)
+    points = [Point(free_space.sample()) for _ in range(5000)]
+    region = free_space.region.buffer(1e-6)
+    assert all(region.contains(point) for point in points)
+    # The points are uniform over the free space.
+    for area in [box(-5, -4, 0, 0), box(0, 0, 5, 4), box(-1, -1, 1, 1)]:
+        expected = free_space.region.intersection(area).area / free_space.area
+        actual = sum(area.contains(point) for point in points) / len(points)
+        assert actual == pytest.approx(expected, abs=0.03)
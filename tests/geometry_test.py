@@ -1,4 +1,7 @@
+import copy
 import math
+import pickle
+import random
 
 import pytest
 import shapely
@@ -12,7 +15,7 @@ from generator.geometry import (
     rotate_point_around_origin
 )
 from generator.instances import instantiate_object
-from generator.separating_axis_theorem import sat_entry
+from generator.separating_axis_theorem import sat_entry, sat_entry_batch
 
 DEFAULT_ROOM_X_MAX = (geometry.DEFAULT_ROOM_DIMENSIONS['x'] / 2.0)
 DEFAULT_ROOM_Z_MAX = (geometry.DEFAULT_ROOM_DIMENSIONS['z'] / 2.0)
@@ -51,6 +54,39 @@ def test_object_bounds():
     assert bounds.min_y == 3
 
 
+def test_object_bounds_rounds_points():
+    box_xz = [
+        Vector3d(x=1.00000001, y=0, z=1), Vector3d(x=1, y=0, z=2),
+        Vector3d(x=2, y=0, z=2.00000001), Vector3d(x=2, y=0, z=1)
+    ]
+    bounds = ObjectBounds(box_xz=box_xz, max_y=4, min_y=3)
+    assert bounds.box_xz == [
+        Vector3d(x=1, y=0, z=1), Vector3d(x=1, y=0, z=2),
+        Vector3d(x=2, y=0, z=2), Vector3d(x=2, y=0, z=1)
+    ]
+    assert bounds.points_xz.tolist() == [[1, 1], [1, 2], [2, 2], [2, 1]]
+    assert list(bounds.polygon_xz.exterior.coords) == [
+        (1, 1), (1, 2), (2, 2), (2, 1), (1, 1)
+    ]
+
+
+def test_object_bounds_copy():
+    box_xz = [
+        Vector3d(x=1, y=0, z=1), Vector3d(x=1, y=0, z=2),
+        Vector3d(x=2, y=0, z=2), Vector3d(x=2, y=0, z=1)
+    ]
+    bounds = ObjectBounds(box_xz=box_xz, max_y=4, min_y=3)
+    bounds_copy = copy.deepcopy(bounds)
+    assert bounds_copy == bounds
+    assert bounds_copy is not bounds
+    bounds_copy.extend_bottom_to_ground()
+    bounds_copy.expand_by(1)
+    assert bounds.box_xz == box_xz
+    assert bounds.min_y == 3
+    assert bounds_copy != bounds
+    assert pickle.loads(pickle.dumps(bounds)) == bounds
+
+
 def test_expand_by():
     box_xz = [
         Vector3d(x=1, y=0, z=1), Vector3d(x=1, y=0, z=2),
@@ -142,6 +178,31 @@ def test_rect_intersection():
     assert sat_entry(C, A) is True
 
 
+def test_rect_intersection_batch():
+    A = [{'x': 0, 'y': 0, 'z': 0}, {'x': 1, 'y': 0, 'z': 0},
+         {'x': 1, 'y': 0, 'z': 1}, {'x': 0, 'y': 0, 'z': 1}]
+    B = [{'x': .25, 'y': 0, 'z': .25}, {'x': .75, 'y': 0, 'z': .25},
+         {'x': .75, 'y': 0, 'z': .75},
+         {'x': .25, 'y': 0, 'z': .75}]
+    C = [{'x': .8, 'y': 0, 'z': 1.2}, {'x': 1.1, 'y': 0, 'z': 1.8},
+         {'x': 2, 'y': 0, 'z': 1.5},
+         {'x': 1.1, 'y': 0, 'z': .3}]
+    D = [{'x': 1, 'y': 0, 'z': 0}, {'x': 2, 'y': 0, 'z': 1.5},
+         {'x': 3, 'y': 0, 'z': 0}, {'x': 2, 'y': 0, 'z': -1.5}]
+    E = [Vector3d(x=1, y=0, z=1), Vector3d(x=2, y=0, z=1),
+         Vector3d(x=2, y=0, z=2)]
+    assert sat_entry_batch(A, []).tolist() == []
+    assert sat_entry_batch(A, [B, C, D]).tolist() == [True, True, True]
+    assert sat_entry_batch(B, [A, C, D]).tolist() == [True, False, False]
+    assert sat_entry_batch(C, [A, B, D]).tolist() == [True, False, True]
+    # Rects with different numbers of vertices.
+    assert sat_entry_batch(A, [E, B]).tolist() == [True, True]
+    assert sat_entry_batch(B, [E, C]).tolist() == [False, False]
+    for rect_a in [A, B, C, D, E]:
+        expected = [sat_entry(rect_a, rect_b) for rect_b in [A, B, C, D, E]]
+        assert sat_entry_batch(rect_a, [A, B, C, D, E]).tolist() == expected
+
+
 def test_is_within_room():
     valid_1 = Vector3d(**{'x': 0, 'y': 0, 'z': 0})
     valid_2 = Vector3d(**{'x': 5, 'y': 0, 'z': 5})
@@ -471,6 +532,57 @@ def test_random_real():
     assert n * 10 % 1 < 1e-8
 
 
+def test_calc_obj_pos():
+    definition = {'debug': {
+        'dimensions': {'x': 1, 'y': 1, 'z': 1},
+        'offset': {'x': 0, 'y': 0, 'z': 0},
+        'positionY': 0,
+        'rotation': {'x': 0, 'y': 0, 'z': 0}
+    }}
+    room_dimensions = {'x': 10, 'y': 3, 'z': 10}
+    for batch in [True, False]:
+        bounds_list = []
+        for _ in range(10):
+            location = geometry.calc_obj_pos(
+                {'x': 0, 'y': 0, 'z': 0},
+                bounds_list,
+                definition,
+                room_dimensions=room_dimensions,
+                batch=batch
+            )
+            assert location
+            assert location['rotation']['y'] in geometry.VALID_ROTATIONS
+            assert location['boundingBox'] == bounds_list[-1]
+            assert geometry.validate_location_rect(
+                location['boundingBox'],
+                {'x': 0, 'y': 0, 'z': 0},
+                bounds_list[:-1],
+                room_dimensions
+            )
+
+
+def test_calc_obj_pos_no_space():
+    definition = {'debug': {
+        'dimensions': {'x': 1, 'y': 1, 'z': 1},
+        'offset': {'x': 0, 'y': 0, 'z': 0},
+        'positionY': 0,
+        'rotation': {'x': 0, 'y': 0, 'z': 0}
+    }}
+    room_dimensions = {'x': 10, 'y': 3, 'z': 10}
+    # The whole room is covered by a hole, so no position is valid.
+    bounds_list = [geometry.generate_floor_area_bounds(0, 0)]
+    bounds_list[0].expand_by(5)
+    for batch in [True, False]:
+        assert geometry.calc_obj_pos(
+            {'x': 0, 'y': 0, 'z': 0},
+            bounds_list,
+            definition,
+            room_dimensions=room_dimensions,
+            batch=batch
+        ) is None
+        assert len(bounds_list) == 1
+
+
 def test_object_collision():
     r1 = geometry.create_bounds(
         position={'x': -1.97, 'y': 0, 'z': 1.75},
@@ -4080,3 +4192,41 @@ def test_calculate_rotation_amount():
 
     assert calculate_rotation_amount(-1, back, center) == 1
     assert calculate_rotation_amount(361, back, center) == -1
+
+
+def test_calc_obj_pos_crowded():
+    definition = {'debug': {
+        'dimensions': {'x': 1, 'y': 1, 'z': 1},
+        'offset': {'x': 0, 'y': 0, 'z': 0},
+        'positionY': 0,
+        'rotation': {'x': 0, 'y': 0, 'z': 0}
+    }}
+    room_dimensions = {'x': 10, 'y': 3, 'z': 10}
+    # Only a small gap around (3, 3) is free, so random poses almost never
+    # fit, but the free space of the room is used instead.
+    bounds_list = [
+        geometry.create_bounds(
+            dimensions={'x': size_x, 'y': 1, 'z': size_z},
+            offset=None,
+            position={'x': x, 'y': 0, 'z': z},
+            rotation={'x': 0, 'y': 0, 'z': 0},
+            standing_y=0
+        ) for x, z, size_x, size_z in [
+            (-1.3, 0, 7.4, 10),
+            (4.3, 0, 1.4, 10),
+            (3, -1.3, 1.2, 7.4),
+            (3, 4.3, 1.2, 1.4)
+        ]
+    ]
+    random.seed(1)
+    for _ in range(5):
+        location = geometry.calc_obj_pos(
+            {'x': -4.5, 'y': 0, 'z': -4.5},
+            bounds_list.copy(),
+            definition,
+            room_dimensions=room_dimensions
+        )
+        assert location
+        assert location['position']['x'] == pytest.approx(3, abs=0.1)
+        assert location['position']['z'] == pytest.approx(3, abs=0.1)
+        assert location['rotation']['y'] in [0, 90, 180, 270]
@@ -0,0 +1,143 @@
+import math
+
+import numpy as np
+
+from generator.grid_pathfinding import (
+    OccupancyGrid,
+    _find_cell_path,
+    find_grid_path
+)
+
+BOUNDARY = [(-4.5, -4.5), (4.5, -4.5), (4.5, 4.5), (-4.5, 4.5)]
+
+
+def wall(z: float, min_x: float, max_x: float, half_depth: float = 0.25):
+    return [
+        (min_x, z - half_depth), (min_x, z + half_depth),
+        (max_x, z + half_depth), (max_x, z - half_depth)
+    ]
+
+
+def test_occupancy_grid_no_holes():
+    grid = OccupancyGrid(BOUNDARY, [], 0.5)
+    assert grid.size_x == 18
+    assert grid.size_z == 18
+    assert not grid.conservative.any()
+    assert not grid.optimistic.any()
+
+
+def test_occupancy_grid_partial_cells_on_boundary():
+    grid = OccupancyGrid(BOUNDARY, [], 0.4)
+    assert grid.size_x == 23
+    assert grid.size_z == 23
+    # The last row and column extend past the boundary.
+    assert grid.conservative[-1, :].all()
+    assert grid.conservative[:, -1].all()
+    assert not grid.conservative[:-1, :-1].any()
+    assert not grid.optimistic.any()
+
+
+def test_occupancy_grid_hole():
+    hole = [(-1, -1), (-1, 1), (1, 1), (1, -1)]
+    grid = OccupancyGrid(BOUNDARY, [hole], 0.5)
+    # Cells touching the hole (including only on their edges) are blocked.
+    assert np.argwhere(grid.conservative).min(axis=0).tolist() == [6, 6]
+    assert np.argwhere(grid.conservative).max(axis=0).tolist() == [11, 11]
+    assert grid.conservative.sum() == 36
+    # Only cells entirely inside the hole (not on its edges) are blocked.
+    assert np.argwhere(grid.optimistic).min(axis=0).tolist() == [8, 8]
+    assert np.argwhere(grid.optimistic).max(axis=0).tolist() == [9, 9]
+    assert grid.optimistic.sum() == 4
+
+
+def test_occupancy_grid_rotated_hole():
+    hole = [(0, -2), (-2, 0), (0, 2), (2, 0)]
+    grid = OccupancyGrid(BOUNDARY, [hole], 0.5)
+    assert grid.conservative[grid.find_cell((0.1, 0.1))]
+    assert grid.conservative[grid.find_cell((1.6, 0.1))]
+    assert grid.conservative[grid.find_cell((1.1, 1.1))]
+    assert not grid.conservative[grid.find_cell((1.6, 1.6))]
+    assert grid.optimistic[grid.find_cell((0.1, 0.1))]
+    assert not grid.optimistic[grid.find_cell((1.6, 0.1))]
+    assert not grid.optimistic[grid.find_cell((1.1, 1.1))]
+
+
+def test_find_cell():
+    grid = OccupancyGrid(BOUNDARY, [], 0.5)
+    assert grid.find_cell((-4.5, -4.5)) == (0, 0)
+    assert grid.find_cell((0, 0)) == (9, 9)
+    assert grid.find_cell((-0.1, 0.1)) == (8, 9)
+    assert grid.find_cell((4.49, 4.49)) == (17, 17)
+    assert grid.find_cell((4.5, 0)) is None
+    assert grid.find_cell((-5, 0)) is None
+    assert grid.find_cell_center((9, 9)) == (0.25, 0.25)
+
+
+def test_find_cell_path():
+    blocked = np.zeros((3, 3), dtype=bool)
+    assert _find_cell_path(blocked, (0, 0), (2, 2), False) == [
+        (0, 0), (1, 1), (2, 2)
+    ]
+    blocked[1, 1] = True
+    path = _find_cell_path(blocked, (0, 0), (2, 2), True)
+    assert len(path) == 4
+    assert path[0] == (0, 0)
+    assert path[-1] == (2, 2)
+    assert (1, 1) not in path
+
+
+def test_find_cell_path_corner_cutting():
+    blocked = np.array([[False, True], [True, False]])
+    assert _find_cell_path(blocked, (0, 0), (1, 1), True) == [(0, 0), (1, 1)]
+    assert _find_cell_path(blocked, (0, 0), (1, 1), False) is None
+
+
+def test_find_cell_path_blocked():
+    blocked = np.zeros((3, 3), dtype=bool)
+    blocked[:, 1] = True
+    assert _find_cell_path(blocked, (0, 0), (0, 2), True) is None
+    assert _find_cell_path(blocked, (0, 1), (0, 2), True) is None
+
+
+def test_find_grid_path_no_holes():
+    reachable, path = find_grid_path(BOUNDARY, [], (0, 0), (-1, 4), 0.1)
+    assert reachable is True
+    assert path[0] == (0, 0)
+    assert path[-1] == (-1, 4)
+    # The grid path is a little longer than the straight line.
+    distance = sum(math.dist(a, b) for a, b in zip(path, path[1:]))
+    assert math.dist((0, 0), (-1, 4)) < distance < 5
+
+
+def test_find_grid_path_around_hole():
+    holes = [wall(2, -3, 3)]
+    reachable, path = find_grid_path(BOUNDARY, holes, (0, 0), (0, 4), 0.1)
+    assert reachable is True
+    assert path[0] == (0, 0)
+    assert path[-1] == (0, 4)
+    assert all(abs(x) > 3 or abs(z - 2) > 0.25 for x, z in path)
+
+
+def test_find_grid_path_blocked():
+    holes = [wall(2, -5, 5)]
+    assert find_grid_path(BOUNDARY, holes, (0, 0), (0, 4), 0.1) == (False, [])
+
+
+def test_find_grid_path_blocked_by_many_holes():
+    holes = [wall(2, x - 0.6, x + 0.6, 0.6) for x in range(-5, 6)]
+    assert find_grid_path(BOUNDARY, holes, (0, 0), (0, 4), 0.1) == (False, [])
+
+
+def test_find_grid_path_start_in_hole():
+    holes = [wall(0, -1, 1)]
+    assert find_grid_path(BOUNDARY, holes, (0, 0), (0, 4), 0.1) == (False, [])
+
+
+def test_find_grid_path_borderline():
+    # The gap between the walls is too small for the grid to prove a path.
+    holes = [wall(2, -5, -0.005), wall(2, 0.005, 5)]
+    assert find_grid_path(BOUNDARY, holes, (0, 0), (0, 4), 0.1) == (None, [])
+
+
+def test_find_grid_path_outside_boundary():
+    assert find_grid_path(BOUNDARY, [], (0, 0), (0, 5), 0.1) == (None, [])
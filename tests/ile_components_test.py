@@ -1,8 +1,21 @@
 import pytest
 
 from generator.scene import Scene
-from ideal_learning_env import ILEException, VectorFloatConfig
+from ideal_learning_env import (
+    ILEDelayException,
+    ILEException,
+    InstanceDefinitionLocationTuple,
+    ObjectRepository,
+    VectorFloatConfig
+)
+from ideal_learning_env.components import (
+    DelayedActionLabels,
+    find_delayed_action_labels
+)
 from ideal_learning_env.mock_component import MockClass, MockComponent
+from ideal_learning_env.structural_object_service import (
+    StructuralPlacerConfig
+)
 
 
 def test_ile_component_call_each_setter_on_init():
@@ -665,3 +678,30 @@ def test_ile_component_validate_fail_union_str_empty():
         MockComponent({
             'union_str_prop': ''
         })
+
+
+def test_ile_component_delayed_action_labels():
+    assert MockComponent({}).get_delayed_action_labels() == []
+
+    labels = find_delayed_action_labels(
+        ILEDelayException('mock', labels=['a', None, 'b']),
+        StructuralPlacerConfig(labels=['c', 'd'])
+    )
+    assert labels == DelayedActionLabels(['a', 'b'], ['c', 'd'])
+    assert find_delayed_action_labels(ILEException('mock')) == (
+        DelayedActionLabels(None, [])
+    )
+    assert find_delayed_action_labels(ILEDelayException('mock', 'a')) == (
+        DelayedActionLabels(['a'], [])
+    )
+
+    repo = ObjectRepository.get_instance()
+    repo.clear()
+    assert DelayedActionLabels().is_ready()
+    assert not labels.is_ready()
+    repo.add_to_labeled_objects(
+        InstanceDefinitionLocationTuple({'id': 'mock_id'}, None, None),
+        'b'
+    )
+    assert labels.is_ready()
+    repo.clear()
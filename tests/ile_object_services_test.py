@@ -131,6 +131,54 @@ def test_object_repository_remove():
     assert repo.get_all_from_labeled_objects('label_c') is None
 
 
+def test_object_repository_remove_many():
+    repo = ObjectRepository.get_instance()
+    idls = [
+        InstanceDefinitionLocationTuple({'id': f'object_{index}'}, {}, {})
+        for index in range(5)
+    ]
+    for idl in idls:
+        repo.add_to_labeled_objects(idl, ['label_a', 'label_b'])
+
+    repo.remove_from_labeled_objects('object_1', ['label_a', 'label_b'])
+    repo.remove_from_labeled_objects('object_3', 'label_a')
+    assert repo.get_all_from_labeled_objects('label_a') == [
+        idls[0], idls[2], idls[4]
+    ]
+    assert repo.get_all_from_labeled_objects('label_b') == [
+        idls[0], idls[2], idls[3], idls[4]
+    ]
+    assert repo.get_one_from_labeled_objects('label_a') in [
+        idls[0], idls[2], idls[4]
+    ]
+
+    # An object is removed by its current ID, even if it was changed after
+    # the object was added.
+    idls[0].instance['id'] = 'object_changed'
+    repo.remove_from_labeled_objects('object_0', 'label_a')
+    assert repo.get_all_from_labeled_objects('label_a') == [
+        idls[0], idls[2], idls[4]
+    ]
+    repo.remove_from_labeled_objects('object_changed', 'label_a')
+    assert repo.get_all_from_labeled_objects('label_a') == [idls[2], idls[4]]
+    repo.remove_from_labeled_objects('object_changed', 'label_b')
+    assert repo.get_all_from_labeled_objects('label_b') == [
+        idls[2], idls[3], idls[4]
+    ]
+
+    repo.add_to_labeled_objects(idls[1], 'label_a')
+    assert repo.get_all_from_labeled_objects('label_a') == [
+        idls[2], idls[4], idls[1]
+    ]
+
+    # Changing the returned list doesn't change the stored objects.
+    repo.get_all_from_labeled_objects('label_a').reverse()
+    repo.get_all_from_labeled_objects('label_a').clear()
+    assert repo.get_all_from_labeled_objects('label_a') == [
+        idls[2], idls[4], idls[1]
+    ]
+
+
 def test_object_repository_singleton():
     repo1 = ObjectRepository.get_instance()
     repo2 = ObjectRepository.get_instance()
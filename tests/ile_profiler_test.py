@@ -0,0 +1,206 @@
+import argparse
+import json
+import logging
+
+import pytest
+
+import ile
+from generator.scene import Scene
+from ideal_learning_env import ILEException, profiler
+from ideal_learning_env.feature_creation_service import (
+    BaseObjectCreationService
+)
+from ideal_learning_env.mock_component import MockComponent
+
+
+@pytest.fixture(autouse=True)
+def run_profiler():
+    yield profiler.enable_profiling()
+    profiler.disable_profiling()
+
+
+class MockCreationService(BaseObjectCreationService):
+    def __init__(self, results):
+        self.results = results
+
+    def reconcile(self, scene, source_template):
+        return source_template
+
+    def create_feature_from_specific_values(
+        self,
+        scene,
+        reconciled,
+        source_template
+    ):
+        result = self.results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    def is_valid(self, scene, new_obj, bounds, try_num, retries):
+        if new_obj[0] == 'invalid':
+            self._rejection_reason = 'invalidLocation'
+            return False
+        return new_obj[0] != 'unknown'
+
+    def _on_valid_instances(self, scene, reconciled, new_obj):
+        pass
+
+
+class FailingComponent(MockComponent):
+    def __init__(self, failures):
+        super().__init__({})
+        self.failures = failures
+
+    def update_ile_scene(self, scene):
+        if self.failures:
+            self.failures -= 1
+            raise ILEException('mock failure')
+        return scene
+
+
+def test_profiler_timer(run_profiler):
+    with run_profiler.timer('category', 'a'):
+        pass
+    with run_profiler.timer('category', 'a'):
+        sum(range(100000))
+    with pytest.raises(ValueError):
+        with run_profiler.timer('category', 'b'):
+            raise ValueError()
+    timings = run_profiler.report()['timings']
+    assert list(timings) == ['category']
+    assert timings['category']['a']['calls'] == 2
+    assert timings['category']['a']['wallTime'] > 0
+    assert timings['category']['a']['cpuTime'] >= 0
+    assert timings['category']['b']['calls'] == 1
+    # Slowest first.
+    assert list(timings['category']) == ['a', 'b']
+
+
+def test_profiler_count_merge_and_reset(run_profiler):
+    run_profiler.count('attempts', 'a')
+    run_profiler.count('attempts', 'a', amount=2)
+    run_profiler.count('rejections', 'a', 'invalid')
+    report = run_profiler.report()
+    assert report['counts'] == {
+        'attempts': {'a': 3},
+        'rejections': {'a': {'invalid': 1}}
+    }
+
+    run_profiler.merge(report)
+    run_profiler.merge({'counts': {'rejections': {'b': {'invalid': 1}}}})
+    assert run_profiler.report()['counts'] == {
+        'attempts': {'a': 6},
+        'rejections': {'a': {'invalid': 2}, 'b': {'invalid': 1}}
+    }
+    # The report is a copy.
+    assert report['counts']['attempts']['a'] == 3
+
+    run_profiler.reset()
+    assert run_profiler.report() == {'timings': {}, 'counts': {}}
+
+
+def test_profiler_disabled():
+    profiler.disable_profiling()
+    assert profiler.get_profiler() is None
+    with profiler.timer('category', 'a'):
+        profiler.count('attempts', 'a')
+    run_profiler = profiler.enable_profiling()
+    assert profiler.get_profiler() is run_profiler
+    assert profiler.enable_profiling() is run_profiler
+    assert run_profiler.report() == {'timings': {}, 'counts': {}}
+
+
+def test_add_to_scene_counts(run_profiler):
+    service = MockCreationService(
+        ['invalid', ValueError(), 'unknown', 'valid']
+    )
+    assert service.add_to_scene(Scene(), 'template', [])[0] == ['valid']
+    report = run_profiler.report()
+    assert report['counts'] == {
+        'placementAttempts': {'MockCreationService': 4},
+        'rejections': {'MockCreationService': {
+            'invalidLocation': 1,
+            'ValueError': 1,
+            'invalid': 1
+        }}
+    }
+    assert report['timings']['creationServices']['MockCreationService'][
+        'calls'
+    ] == 1
+
+
+def test_add_to_scene_failure_counts(run_profiler):
+    service = MockCreationService(['invalid', 'invalid'])
+    with pytest.raises(ILEException):
+        service.add_to_scene(Scene(), 'template', [], tries=2)
+    assert run_profiler.report()['counts'] == {
+        'placementAttempts': {'MockCreationService': 2},
+        'rejections': {'MockCreationService': {'invalidLocation': 2}}
+    }
+
+
+def test_generate_ile_scene_timings(run_profiler):
+    ile.generate_ile_scene([MockComponent({}), FailingComponent(0)], 1)
+    timings = run_profiler.report()['timings']
+    assert sorted(timings['components']) == [
+        'FailingComponent',
+        'MockComponent'
+    ]
+    assert sorted(timings['endOfGeneration']) == [
+        'FailingComponent',
+        'MockComponent'
+    ]
+    assert 'delayedActionRounds' not in timings
+
+
+def test_generate_scene_with_retries_counts(monkeypatch, run_profiler):
+    monkeypatch.setattr(ile, 'logger', logging.getLogger(__name__))
+    scene = ile._generate_scene_with_retries(
+        [FailingComponent(2)], 0, 1, 'scene', 1, 3
+    )
+    assert scene
+    assert run_profiler.report()['counts'] == {
+        'scenes': {'tries': 3},
+        'sceneRetries': {'ILEException': 2}
+    }
+
+    run_profiler.reset()
+    assert not ile._generate_scene_with_retries(
+        [FailingComponent(2)], 0, 1, 'scene', 1, 2
+    )
+    assert run_profiler.report()['counts'] == {
+        'scenes': {'tries': 2, 'failed': 1},
+        'sceneRetries': {'ILEException': 2}
+    }
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_main_profile(monkeypatch, tmp_path, workers):
+    profiler.disable_profiling()
+    monkeypatch.setattr(ile, 'logger', logging.getLogger(__name__))
+    report_path = tmp_path / 'report.json'
+    ile.main(argparse.Namespace(
+        config=None,
+        number=2,
+        prefix=str(tmp_path / 'scene'),
+        log_config=None,
+        log_level=None,
+        throw_error=False,
+        workers=workers,
+        save_workers=0,
+        seed=1,
+        profile=str(report_path)
+    ))
+    assert profiler.get_profiler() is None
+    with open(report_path) as report_file:
+        report = json.load(report_file)
+    assert report['number'] == 2
+    assert report['workers'] == workers
+    assert report['seed'] == 1
+    assert report['wallTime'] > 0
+    assert report['counts']['scenes'] == {'tries': 2}
+    assert report['timings']['scenes']['generate']['calls'] == 2
+    assert report['timings']['components']['GlobalSettingsComponent'][
+        'calls'
+    ] == 2
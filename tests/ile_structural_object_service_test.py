@@ -1,7 +1,9 @@
+import random
+
 import pytest
 from machine_common_sense.config_manager import RoomMaterials, Vector3d
 
-from generator import materials
+from generator import ObjectDefinition, geometry, materials
 from generator.base_objects import (
     create_soccer_ball,
     create_specific_definition_from_base
@@ -13,7 +15,9 @@ from ideal_learning_env.defs import ILEDelayException
 from ideal_learning_env.numerics import (
     MinMaxFloat,
     MinMaxInt,
-    VectorFloatConfig
+    VectorFloatConfig,
+    VectorIntConfig,
+    retrieve_all_vectors
 )
 from ideal_learning_env.object_services import (
     InstanceDefinitionLocationTuple,
@@ -65,6 +69,7 @@ from ideal_learning_env.structural_object_service import (
     StructuralWallConfig,
     StructuralWallCreationService,
     WallSide,
+    _check_for_collisions,
     is_wall_too_close
 )
 from tests.ile_helper import (
@@ -3221,3 +3226,146 @@ def test_tube_occluder_creation_reconcile_down_after_and_up_after():
     reconciled = service.reconcile(scene, config)
     assert reconciled.down_step == 11
     assert reconciled.up_step == 51
+
+
+def check_for_collisions_one_by_one(
+    scene,
+    definition,
+    positions,
+    rotations,
+    bounds_list
+):
+    # Validate each combination with its own ObjectBounds.
+    output = []
+    for position in retrieve_all_vectors(positions):
+        position.y = position.y + definition.positionY
+        for rotation in retrieve_all_vectors(rotations):
+            bounds = geometry.create_bounds(
+                vars(definition.dimensions),
+                vars(definition.offset),
+                vars(position),
+                vars(rotation),
+                definition.positionY
+            )
+            if geometry.validate_location_rect(
+                bounds,
+                vars(scene.performer_start.position),
+                bounds_list,
+                vars(scene.room_dimensions)
+            ):
+                output.append((vars(position), vars(rotation)))
+    return output
+
+
+def test_check_for_collisions():
+    scene = prior_scene_custom_start(start_x=1, start_z=1)
+    definition = ObjectDefinition(
+        dimensions=Vector3d(x=0.5, y=0.4, z=0.3),
+        offset=Vector3d(x=0, y=0.2, z=0.05),
+        positionY=0.2
+    )
+    bounds_list = [geometry.create_bounds(
+        {'x': 1, 'y': 1, 'z': 1},
+        None,
+        {'x': -2, 'y': 0, 'z': -2},
+        {'x': 0, 'y': 30, 'z': 0},
+        0
+    ), geometry.create_bounds(
+        # Above the object, so never a collision.
+        {'x': 10, 'y': 1, 'z': 10},
+        None,
+        {'x': 0, 'y': 2, 'z': 0},
+        {'x': 0, 'y': 0, 'z': 0},
+        0
+    )]
+    positions = [
+        VectorFloatConfig(MinMaxFloat(-5, 5), 0, MinMaxFloat(-5, 5)),
+        VectorFloatConfig(0, [0, 1.5], 3)
+    ]
+    rotations = VectorIntConfig(0, [0, 45, 90], 0)
+    expected = check_for_collisions_one_by_one(
+        scene,
+        definition,
+        positions,
+        rotations,
+        bounds_list
+    )
+    output = _check_for_collisions(
+        scene,
+        definition,
+        positions,
+        rotations,
+        bounds_list
+    )
+    assert 0 < len(expected) < 101 * 101 * 3
+    assert [
+        (vars(position), vars(rotation)) for position, rotation in output
+    ] == expected
+
+    # Stop after the first valid combinations, in order.
+    output = _check_for_collisions(
+        scene,
+        definition,
+        positions,
+        rotations,
+        bounds_list,
+        limit=5
+    )
+    assert [
+        (vars(position), vars(rotation)) for position, rotation in output
+    ] == expected[:5]
+
+    # Or in a random order.
+    random.seed(1)
+    output = _check_for_collisions(
+        scene,
+        definition,
+        positions,
+        rotations,
+        bounds_list,
+        limit=1,
+        shuffle=True
+    )
+    assert len(output) == 1
+    assert (vars(output[0][0]), vars(output[0][1])) in expected
+    random.seed(1)
+    assert _check_for_collisions(
+        scene,
+        definition,
+        positions,
+        rotations,
+        bounds_list,
+        limit=1,
+        shuffle=True
+    ) == output
+
+
+def test_check_for_collisions_defaults():
+    scene = prior_scene()
+    definition = ObjectDefinition(
+        dimensions=Vector3d(x=1, y=1, z=1),
+        offset=Vector3d(),
+        positionY=0.5
+    )
+    assert _check_for_collisions(scene, definition, None, None, []) == []
+    # The performer is at the origin.
+    assert _check_for_collisions(
+        scene,
+        definition,
+        None,
+        VectorIntConfig(0, 90, 0),
+        []
+    ) == []
+    output = _check_for_collisions(
+        scene,
+        definition,
+        VectorFloatConfig(2, 0, [-2, 2]),
+        None,
+        []
+    )
+    assert [
+        (vars(position), vars(rotation)) for position, rotation in output
+    ] == [
+        ({'x': 2, 'y': 0.5, 'z': -2}, {'x': 0, 'y': 0, 'z': 0}),
+        ({'x': 2, 'y': 0.5, 'z': 2}, {'x': 0, 'y': 0, 'z': 0})
+    ]
@@ -1,6 +1,26 @@
+import argparse
+import logging
+import re
+
+import pytest
+
+import ile
+from generator import definitions
 from generator.scene import Scene
+from ideal_learning_env import (
+    GlobalSettingsComponent,
+    ILEException,
+    InstanceDefinitionLocationTuple,
+    ObjectRepository,
+    ShortcutComponent
+)
+from ideal_learning_env.components import DelayedActionLabels
 from ideal_learning_env.mock_component import MockComponent
-from ile import generate_ile_scene
+from ile import (
+    _generate_and_save_scene,
+    _order_delayed_action_components,
+    generate_ile_scene
+)
 
 
 def test_generate_ile_scene():
@@ -31,3 +51,199 @@ def test_generate_ile_scene_with_mock_components():
         'str_prop': 'foobar'
     }
     )
+
+
+class DelayedComponent(MockComponent):
+    """Mock component with delayed actions that each add an object with a
+    label once an object with one of their needed labels exists."""
+
+    def __init__(self, actions, fail=False):
+        super().__init__({})
+        # Each action is a tuple of its needed labels and provided label.
+        self.actions = actions
+        self.fail = fail
+        self.runs = 0
+
+    def run_delayed_actions(self, scene):
+        self.runs += 1
+        actions = self.actions
+        self.actions = []
+        for needed, provided in actions:
+            repo = ObjectRepository.get_instance()
+            if self.fail or not (
+                needed is None or any(repo.has_label(n) for n in needed)
+            ):
+                self.actions.append((needed, provided))
+                continue
+            repo.add_to_labeled_objects(
+                InstanceDefinitionLocationTuple({'id': provided}, None, None),
+                provided
+            )
+        return scene
+
+    def get_num_delayed_actions(self):
+        return len(self.actions)
+
+    def get_delayed_action_labels(self):
+        return [
+            DelayedActionLabels(needed, [provided])
+            for needed, provided in self.actions
+        ]
+
+    def get_delayed_action_error_strings(self):
+        return [f'Needs {needed}' for needed, _ in self.actions]
+
+
+def test_handle_delayed_actions():
+    component_1 = DelayedComponent([(['b'], 'c'), (['c'], 'd')])
+    component_2 = DelayedComponent([(['a', 'x'], 'b')])
+    component_3 = DelayedComponent([(None, 'a')])
+    component_list = [component_1, component_2, component_3]
+    generate_ile_scene(component_list, 1)
+    repo = ObjectRepository.get_instance()
+    assert all(repo.has_label(label) for label in ['a', 'b', 'c', 'd'])
+    # Each component only ran once its needed labels existed.
+    assert component_3.runs == 1
+    assert component_2.runs == 1
+    assert component_1.runs == 1
+
+
+def test_handle_delayed_actions_circular_dependency():
+    component_1 = DelayedComponent([(['a'], 'b')])
+    component_2 = DelayedComponent([(['b'], 'a'), (['x'], 'y')])
+    with pytest.raises(ILEException) as error:
+        generate_ile_scene([component_1, component_2], 1)
+    assert 'Missing labels: x\n' in str(error.value)
+    assert str(error.value).endswith(
+        'Circular dependency: DelayedComponent (needs a) -> '
+        'DelayedComponent (needs b) -> DelayedComponent (needs a)'
+    )
+    # Neither component ran, since none of their labels existed.
+    assert component_1.runs == 0
+    assert component_2.runs == 0
+
+
+def test_handle_delayed_actions_circular_dependency_resolved():
+    component_1 = DelayedComponent([(['a'], 'b')])
+    component_2 = DelayedComponent([(['b'], 'a'), (['x'], 'y')])
+    component_3 = DelayedComponent([(None, 'a')])
+    with pytest.raises(ILEException) as error:
+        generate_ile_scene([component_1, component_2, component_3], 1)
+    assert str(error.value).endswith('Missing labels: x')
+    # The cycle was found before the first round, but isn't reported, since
+    # the third component gave it a label it needed.
+    assert 'Circular dependency' not in str(error.value)
+    assert component_1.runs == 1
+
+
+def test_handle_delayed_actions_failure():
+    component_1 = DelayedComponent([(None, 'a')], fail=True)
+    component_2 = DelayedComponent([(['a'], 'b')])
+    with pytest.raises(ILEException) as error:
+        generate_ile_scene([component_1, component_2], 1)
+    assert 'Reasons:\n  Needs None\n  Needs [\'a\']' in str(error.value)
+    # The first component only ran once, since nothing changed after that.
+    assert component_1.runs == 1
+    assert component_2.runs == 0
+
+
+def test_order_delayed_action_components():
+    component_1 = MockComponent({})
+    global_settings = GlobalSettingsComponent({})
+    shortcut = ShortcutComponent({})
+    component_2 = MockComponent({})
+    assert _order_delayed_action_components([
+        component_1, global_settings, shortcut, component_2
+    ]) == [component_1, shortcut, global_settings, component_2]
+    assert _order_delayed_action_components([
+        component_1, shortcut, global_settings, component_2
+    ]) == [component_1, shortcut, global_settings, component_2]
+    assert _order_delayed_action_components([
+        component_1, component_2
+    ]) == [component_1, component_2]
+
+
+class InterruptedComponent(MockComponent):
+    def __init__(self, error):
+        super().__init__({})
+        self.error = error
+
+    def update_ile_scene(self, scene):
+        raise self.error
+
+
+def test_generate_and_save_scene(monkeypatch, tmp_path):
+    monkeypatch.setattr(ile, 'logger', logging.getLogger(__name__))
+    prefix = str(tmp_path / 'scene')
+    assert _generate_and_save_scene([MockComponent({})], 0, 1, prefix, 1) == (
+        f'{prefix}_000001'
+    )
+    assert (tmp_path / 'scene_000001.json').stat().st_size > 0
+    assert (tmp_path / 'scene_000001_debug.json').exists()
+
+
+@pytest.mark.parametrize('error', [
+    ILEException('mock failure'),
+    KeyError('mock error'),
+    KeyboardInterrupt()
+])
+def test_generate_and_save_scene_releases_filename(
+    monkeypatch,
+    tmp_path,
+    error
+):
+    monkeypatch.setattr(ile, 'logger', logging.getLogger(__name__))
+    prefix = str(tmp_path / 'scene')
+    component_list = [InterruptedComponent(error)]
+    if isinstance(error, ILEException):
+        assert not _generate_and_save_scene(component_list, 0, 1, prefix, 1)
+    else:
+        with pytest.raises(type(error)):
+            _generate_and_save_scene(component_list, 0, 1, prefix, 1)
+    # The reserved (empty) scene file was removed.
+    assert list(tmp_path.iterdir()) == []
+
+
+def run_ile_main(tmp_path, workers):
+    config_path = tmp_path / 'config.yaml'
+    config_path.write_text(
+        'specific_interactable_objects:\n'
+        '  - num: 3\n'
+        'keyword_objects:\n'
+        '  - keyword: containers\n'
+        '    num: 1\n'
+    )
+    output_path = tmp_path / f'workers_{workers}'
+    ile.main(argparse.Namespace(
+        config=str(config_path),
+        number=4,
+        prefix=str(output_path / 'scene'),
+        log_config=None,
+        log_level=None,
+        throw_error=False,
+        workers=workers,
+        save_workers=0,
+        seed=1,
+        profile=None
+    ))
+    # Object IDs are random UUIDs, so number them in the order they're used.
+    scenes = {}
+    for path in sorted(output_path.glob('*.json')):
+        if path.name.endswith('_debug.json'):
+            continue
+        ids = {}
+        scenes[path.name] = re.sub(
+            r'[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}',
+            lambda match: ids.setdefault(match.group(0), f'id_{len(ids)}'),
+            path.read_text()
+        )
+    return scenes
+
+
+def test_main_seed_with_workers(monkeypatch, tmp_path):
+    monkeypatch.setattr(ile, 'logger', logging.getLogger(__name__))
+    monkeypatch.setattr(definitions, 'DATASET_SHUFFLE_SEED', None)
+    serial = run_ile_main(tmp_path, 1)
+    assert len(serial) == 4
+    # With a seed, the scenes don't depend on the number of workers.
+    assert run_ile_main(tmp_path, 2) == serial
@@ -563,3 +563,65 @@ def test_valid_path_with_lava_and_holes():
 
     component.update_ile_scene(scene)
     assert component.last_distance == pytest.approx(15, 0.1)
+
+
+def test_valid_path_grid_size_off_by_default():
+    component = ValidPathComponent({'check_valid_path': True})
+    assert component.check_valid_path_grid_size is None
+    assert component.get_check_valid_path_grid_size() is None
+
+
+def test_valid_path_grid_size_invalid():
+    with pytest.raises(ILEException):
+        ValidPathComponent({
+            'check_valid_path': True,
+            'check_valid_path_grid_size': 0
+        })
+
+
+def test_valid_path_grid_no_obstacles():
+    component = ValidPathComponent({
+        'check_valid_path': True,
+        'check_valid_path_grid_size': 0.1
+    })
+    assert component.get_check_valid_path_grid_size() == 0.1
+
+    component.update_ile_scene(prior_scene_with_target(add_to_repo=True))
+    # The grid path is a little longer than the exact path.
+    assert 4.2 <= component.last_distance < 4.6
+    assert component.last_path[0] == (0, 0)
+    assert component.last_path[-1] == (-1.03, 4.08)
+
+
+def test_valid_path_grid_blocked_by_lava():
+    component = ValidPathComponent({
+        'check_valid_path': True,
+        'check_valid_path_grid_size': 0.1
+    })
+    scene = prior_scene_with_target(add_to_repo=True)
+
+    # create blocked by lava
+    scene.lava = [Vector2dInt(x=(i - 5), z=2) for i in range(11)]
+
+    with pytest.raises(ILEException):
+        component.update_ile_scene(scene)
+    assert component.last_path == []
+    assert component.last_distance is None
+
+
+def test_valid_path_grid_with_lava_and_holes():
+    component = ValidPathComponent({
+        'check_valid_path': True,
+        'check_valid_path_grid_size': 0.1
+    })
+    scene = prior_scene_with_target(start_x=-3, start_z=-3, add_to_repo=True)
+    # create blocked by holes
+    holes = scene.holes
+    for i in range(8):
+        holes.append(Vector2dInt(x=(i - 5), z=3))
+
+    scene.lava = [Vector2dInt(x=(i - 3), z=0) for i in range(8)]
+
+    component.update_ile_scene(scene)
+    # The grid path is longer than the exact path (about 15).
+    assert 15 <= component.last_distance < 17
@@ -0,0 +1,67 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+
+# Modules that are slow to import (or that do a lot of work on import) and
+# are only ever needed on first use, so they must not be imported on startup.
+SLOW_MODULES = [
+    'generator.gravity_support_objects_catalog',
+    'generator.intuitive_physics_objects_catalog',
+    'generator.specific_objects_catalog',
+    'matplotlib'
+]
+
+
+def import_times(code: str) -> Dict[str, int]:
+    """Run the given code in a new process with "python -X importtime" and
+    return a dict mapping each imported module to its cumulative import time
+    in microseconds."""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        capture_output=True,
+        cwd=ROOT_DIR,
+        env={**os.environ, 'PYTHONPATH': os.pathsep.join(sys.path)},
+        text=True
+    )
+    assert result.returncode == 0, result.stderr
+    output = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, module = line.split('|')
+        output[module.strip()] = int(cumulative)
+    return output
+
+
+def test_import_generator():
+    output = import_times('import generator')
+    assert 'generator' in output
+    for module in SLOW_MODULES:
+        assert module not in output
+
+
+def test_import_hypercube():
+    # Must not load the movement data (or fail without its JSON file).
+    output = import_times('import hypercube')
+    assert 'hypercube' in output
+    for module in SLOW_MODULES:
+        assert module not in output
+
+
+def test_import_ile():
+    output = import_times('import ile')
+    assert 'ile' in output
+    assert 'matplotlib' not in output
+
+
+def test_import_catalog_on_first_use():
+    output = import_times(
+        'from generator import specific_objects\n'
+        'specific_objects.get_pickupable_definition_dataset()'
+    )
+    assert 'generator.specific_objects_catalog' in output
+    assert 'generator.intuitive_physics_objects_catalog' not in output
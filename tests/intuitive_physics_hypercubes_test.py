@@ -2,7 +2,7 @@ import random
 
 import pytest
 
-from generator import definitions, materials, tags
+from generator import Scene, definitions, materials, tags
 from hypercube import hypercubes, intuitive_physics_hypercubes
 from hypercube.intuitive_physics_test_util import (
     create_goal_template,
@@ -1483,3 +1483,39 @@ def test_SpatioTemporalContinuityHypercubeEval4_scenes_move_across():
             verify_object_tags(scene_dict[j], target_list, 'target', 'target')
             verify_object_tags(scene_dict[j], non_target_list, 'non target',
                                'non_target')
+
+
+@pytest.mark.parametrize('hypercube_class, design_function, tag', [
+    (
+        intuitive_physics_hypercubes.ObjectPermanenceHypercubeEval4,
+        '_design_object_permanence_eval_4_scenes',
+        'OBJECT_PERMANENCE_MOVEMENT'
+    ),
+    (
+        intuitive_physics_hypercubes.SpatioTemporalContinuityHypercubeEval4,
+        '_design_spatio_temporal_continuity_eval_4_scenes',
+        'SPATIO_TEMPORAL_CONTINUITY_MOVEMENT'
+    )
+])
+def test_Eval4_create_intuitive_physics_scenes_tags(
+    monkeypatch,
+    hypercube_class,
+    design_function,
+    tag
+):
+    # Skip the object design (which needs the movement data file) and just
+    # build each scene with its tags.
+    hypercube = hypercube_class.__new__(hypercube_class)
+    monkeypatch.setattr(hypercube, design_function, lambda scenes: scenes)
+    monkeypatch.setattr(
+        hypercube,
+        '_update_hypercube_scene_info_tags',
+        lambda scenes: None
+    )
+    default_scene = Scene(goal=create_goal_template('intuitive physics'))
+    scenes = hypercube._create_intuitive_physics_scenes(default_scene)
+    assert sorted(scenes) == sorted(hypercube._get_scene_ids())
+    for scene in scenes.values():
+        assert scene.goal.scene_info[getattr(tags.TYPES, tag)] == (
+            getattr(tags.CELLS, tag).LINEAR
+        )
@@ -1,4 +1,10 @@
+import math
+
+import pytest
+
+from generator.geometry import occluder_x_to_object_x
 from generator.intuitive_physics_util import (
+    MAX_Z,
     find_off_screen_position_diagonal_away,
     find_off_screen_position_diagonal_toward,
     find_position_behind_occluder_diagonal_away,
@@ -7,6 +13,61 @@ from generator.intuitive_physics_util import (
     retrieve_off_screen_position_y
 )
 
+ANGLES = [1, 5, 10, 15, 20, 30, 45, 60, 75, 89]
+START_X_LIST = [-6.56, -5, -4.16, -0.5, 0.5, 4.16, 5, 6.56]
+START_Z_LIST = [-3, 0, 1.6, 3, 5.6]
+
+
+def scan_off_screen_position_diagonal(start_x, start_z, angle, toward):
+    # The original linear scan, used to verify the vectorized search.
+    if toward:
+        min_x = abs(start_x)
+        max_x = 2 * abs(start_x)
+    else:
+        min_x = 2 * abs(start_x)
+        max_x = retrieve_off_screen_position_x(MAX_Z) + abs(start_x)
+    for i in range(int(min_x * 100), int(max_x * 100)):
+        distance_x = round(i / 100, 2)
+        possible_x = round(distance_x - abs(start_x), 4)
+        distance_z = (-1 if toward else 1) * round(
+            distance_x * math.sin(math.radians(angle)) /
+            math.sin(math.radians(90 - angle)),
+            4
+        )
+        possible_z = round(start_z + distance_z, 2)
+        if retrieve_off_screen_position_x(possible_z) <= possible_x:
+            return possible_x * (-1 if start_x > 0 else 1), possible_z
+    return None, None
+
+
+def scan_position_behind_occluder_diagonal(
+    occluder_x,
+    occluder_z,
+    start_x,
+    start_z,
+    angle,
+    toward
+):
+    # The original linear scan, used to verify the vectorized search.
+    max_z = int(start_z - occluder_z) if toward else int(MAX_Z - start_z)
+    for i in range(0, max_z * 100):
+        distance_z = round(i / 100, 2)
+        possible_x = round(start_x + (1 if start_x < 0 else -1) * (
+            distance_z * math.sin(math.radians(90 - angle)) /
+            math.sin(math.radians(angle))
+        ), 4)
+        possible_z = round(start_z + (distance_z * (-1 if toward else 1)), 2)
+        required_x = occluder_x_to_object_x(
+            occluder_x,
+            occluder_z,
+            possible_z,
+            0,
+            -4.5
+        )
+        if math.isclose(required_x, possible_x, rel_tol=0.1, abs_tol=0.1):
+            return possible_x, round(possible_z, 2)
+    return None, None
+
 
 def test_retrieve_off_screen_position_x():
     assert retrieve_off_screen_position_x(1.6) == 4.16
@@ -83,6 +144,32 @@ def test_find_off_screen_position_diagonal_away():
     assert out == (-7.8, 7.66)
 
 
+@pytest.mark.parametrize('angle', ANGLES)
+def test_find_off_screen_position_diagonal_same_as_scan(angle):
+    for start_x in START_X_LIST:
+        for start_z in START_Z_LIST:
+            assert find_off_screen_position_diagonal_away(
+                start_x,
+                start_z,
+                angle
+            ) == scan_off_screen_position_diagonal(
+                start_x,
+                start_z,
+                angle,
+                False
+            )
+            assert find_off_screen_position_diagonal_toward(
+                start_x,
+                start_z,
+                angle
+            ) == scan_off_screen_position_diagonal(
+                start_x,
+                start_z,
+                angle,
+                True
+            )
+
+
 def test_find_off_screen_position_diagonal_toward():
     out = find_off_screen_position_diagonal_toward(4.16, 1.6, 0)
     assert out == (-4.16, 1.6)
@@ -244,3 +331,39 @@ def test_find_position_behind_occluder_diagonal_toward():
     assert out == (2.6646, 2.15)
     out = find_position_behind_occluder_diagonal_toward(-2, 1, -5, 3, 20)
     assert out == (-2.6646, 2.15)
+
+
+@pytest.mark.parametrize('angle', ANGLES)
+def test_find_position_behind_occluder_diagonal_same_as_scan(angle):
+    for occluder_x in [-2, -0.5, 0, 1, 2.5]:
+        for start_x in START_X_LIST:
+            for start_z in START_Z_LIST:
+                occluder_z = start_z - 2
+                assert find_position_behind_occluder_diagonal_away(
+                    occluder_x,
+                    occluder_z,
+                    start_x,
+                    start_z,
+                    angle
+                ) == scan_position_behind_occluder_diagonal(
+                    occluder_x,
+                    occluder_z,
+                    start_x,
+                    start_z,
+                    angle,
+                    False
+                )
+                assert find_position_behind_occluder_diagonal_toward(
+                    occluder_x,
+                    occluder_z,
+                    start_x,
+                    start_z,
+                    angle
+                ) == scan_position_behind_occluder_diagonal(
+                    occluder_x,
+                    occluder_z,
+                    start_x,
+                    start_z,
+                    angle,
+                    True
+                )
@@ -0,0 +1,64 @@
+import pytest
+
+from generator import pathfinding_cache
+from generator.pathfinding_cache import (
+    clear_pathfinding_cache,
+    find_prepared_environment
+)
+
+BOUNDARY = [(-4.5, -4.5), (4.5, -4.5), (4.5, 4.5), (-4.5, 4.5)]
+HOLE_1 = [(-1, -1), (-1, 1), (1, 1), (1, -1)]
+HOLE_2 = [(2, 2), (2, 3), (3, 3), (3, 2)]
+
+
+@pytest.fixture(autouse=True)
+def run_around_test():
+    clear_pathfinding_cache()
+    yield
+    clear_pathfinding_cache()
+
+
+def test_find_prepared_environment():
+    environment = find_prepared_environment(BOUNDARY, [HOLE_1])
+    assert environment.prepared
+    path, length = environment.find_shortest_path((0, -2), (0, 2))
+    assert path[0] == (0, -2)
+    assert path[-1] == (0, 2)
+    assert length > 4
+
+
+def test_find_prepared_environment_reuses_same_input():
+    environment_1 = find_prepared_environment(BOUNDARY, [HOLE_1])
+    environment_2 = find_prepared_environment(
+        [tuple(point) for point in BOUNDARY],
+        [[(float(x), float(z)) for x, z in HOLE_1]]
+    )
+    assert environment_1 is environment_2
+
+
+def test_find_prepared_environment_different_input():
+    environment_1 = find_prepared_environment(BOUNDARY, [HOLE_1])
+    environment_2 = find_prepared_environment(BOUNDARY, [HOLE_1, HOLE_2])
+    environment_3 = find_prepared_environment(BOUNDARY, [])
+    assert environment_1 is not environment_2
+    assert environment_1 is not environment_3
+    assert environment_2 is not environment_3
+    assert find_prepared_environment(BOUNDARY, [HOLE_1]) is environment_1
+
+
+def test_find_prepared_environment_evicts_least_recently_used(monkeypatch):
+    monkeypatch.setattr(pathfinding_cache, 'PATHFINDING_CACHE_SIZE', 2)
+    environment_1 = find_prepared_environment(BOUNDARY, [HOLE_1])
+    environment_2 = find_prepared_environment(BOUNDARY, [HOLE_2])
+    # Use the first environment again so the second is evicted next.
+    assert find_prepared_environment(BOUNDARY, [HOLE_1]) is environment_1
+    find_prepared_environment(BOUNDARY, [])
+    assert find_prepared_environment(BOUNDARY, [HOLE_1]) is environment_1
+    assert find_prepared_environment(BOUNDARY, [HOLE_2]) is not environment_2
+
+
+def test_find_prepared_environment_error_not_cached():
+    # Boundary coordinates must be counter-clockwise.
+    with pytest.raises(Exception):
+        find_prepared_environment(list(reversed(BOUNDARY)), [])
+    assert len(pathfinding_cache._environment_cache) == 0
@@ -0,0 +1,52 @@
+import json
+
+from pretty_json import PrettyJsonEncoder, PrettyJsonNoIndent
+
+
+def test_pretty_json_encoder():
+    data = {
+        'list': PrettyJsonNoIndent([1, 2.5, 'a']),
+        'nested': {'dict': PrettyJsonNoIndent({'b': None, 'a': True})},
+        'indented': [1, 2]
+    }
+    assert json.dumps(data, cls=PrettyJsonEncoder, indent=2) == (
+        '{\n'
+        '  "list": [1,2.5,"a"],\n'
+        '  "nested": {\n'
+        '    "dict": {"b":null,"a":true}\n'
+        '  },\n'
+        '  "indented": [\n'
+        '    1,\n'
+        '    2\n'
+        '  ]\n'
+        '}'
+    )
+
+
+def test_pretty_json_encoder_nested_no_indent():
+    data = [PrettyJsonNoIndent({'a': [PrettyJsonNoIndent([1, 2])]})]
+    assert json.dumps(data, cls=PrettyJsonEncoder, indent=2) == (
+        '[\n  {"a":[[1,2]]}\n]'
+    )
+
+
+def test_pretty_json_encoder_sort_keys():
+    data = {'b': PrettyJsonNoIndent({'d': 1, 'c': 2}), 'a': 3}
+    assert json.dumps(
+        data,
+        cls=PrettyJsonEncoder,
+        indent=2,
+        sort_keys=True
+    ) == '{\n  "a": 3,\n  "b": {"c":2,"d":1}\n}'
+
+
+def test_pretty_json_encoder_strings():
+    # Strings that look like encoded JSON are still encoded as strings.
+    data = {'a': PrettyJsonNoIndent(['"@@1@@"', 'é']), 'b': '[1,2]'}
+    assert json.dumps(data, cls=PrettyJsonEncoder, indent=2) == (
+        '{\n  "a": ["\\"@@1@@\\"","\\u00e9"],\n  "b": "[1,2]"\n}'
+    )
+    assert json.loads(json.dumps(data, cls=PrettyJsonEncoder)) == {
+        'a': ['"@@1@@"', 'é'],
+        'b': '[1,2]'
+    }
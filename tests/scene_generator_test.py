@@ -0,0 +1,202 @@
+import json
+import random
+
+import pytest
+from machine_common_sense.config_manager import Goal
+
+from generator import Scene, SceneException, definitions
+from hypercube import SceneGenerator
+from hypercube.hypercubes import HypercubeFactory
+from hypercube.scene_generator import _iterate_results
+
+
+@pytest.fixture(autouse=True)
+def dataset_shuffle_seed(monkeypatch):
+    # The scene generator sets the seed for the whole process.
+    monkeypatch.setattr(definitions, 'DATASET_SHUFFLE_SEED', None)
+
+
+class MockHypercube():
+    def __init__(self, index, fail):
+        self.index = index
+        self.fail = fail
+        self.tries = 0
+
+    def generate_scenes(self):
+        self.tries += 1
+        if self.fail and (self.fail is True or self.tries <= self.fail):
+            raise SceneException(f'mock failure {self.index}')
+        return [
+            Scene(
+                goal=Goal(category='mock', scene_info={}),
+                debug={'index': self.index, 'random': random.random()}
+            ) for _ in range(3)
+        ]
+
+    def get_info(self):
+        return f'mock_{self.index}'
+
+
+class MockHypercubeFactory(HypercubeFactory):
+    def __init__(self, fail_list):
+        super().__init__('Mock')
+        self.fail_list = fail_list
+        self.built = 0
+
+    def _build(self, starter_scene):
+        hypercube = MockHypercube(self.built, self.fail_list[self.built])
+        self.built += 1
+        return hypercube
+
+    def iterate_hypercubes(
+        self,
+        total,
+        starter_scene_function,
+        role_to_type,
+        throw_error=False,
+        sort_data=False
+    ):
+        # Like the agent hypercube factories, yield extra hypercubes in case
+        # any fail.
+        for _ in self.fail_list:
+            yield self._build(starter_scene_function())
+
+
+def double(value):
+    return (value, random.random())
+
+
+def read_debug_data(tmp_path):
+    output = {}
+    for path in sorted(tmp_path.glob('*_debug.json')):
+        with open(path) as scene_file:
+            output[path.name] = json.load(scene_file)['debug']
+    return output
+
+
+def run_scene_generator(tmp_path, fail_list, total, workers=1, sort=True):
+    random.seed(1)
+    factory = MockHypercubeFactory(fail_list)
+    SceneGenerator([factory]).generate_scenes(
+        str(tmp_path / 'mock'),
+        total,
+        'Mock',
+        None,
+        sort,
+        False,
+        {},
+        workers
+    )
+    return factory
+
+
+def test_iterate_results():
+    random.seed(1)
+    expected = random.random()
+    random.seed(1)
+    args = ((index,) for index in range(5))
+    results = list(_iterate_results(double, args, 1))
+    assert [result[0] for result in results] == [0, 1, 2, 3, 4]
+    # The function doesn't change the caller's random state.
+    assert [result[1] for result in results] == [expected] * 5
+    assert random.random() == expected
+
+
+def test_iterate_results_workers():
+    # Only the next few args are taken from the iterator at once.
+    taken = []
+
+    def iterate_args():
+        for index in range(20):
+            taken.append(index)
+            yield (index,)
+
+    results = _iterate_results(
+        double,
+        iterate_args(),
+        2,
+        ('INFO', None)
+    )
+    assert next(results)[0] == 0
+    assert taken == [0, 1, 2, 3]
+    assert next(results)[0] == 1
+    assert taken == [0, 1, 2, 3, 4]
+    assert [result[0] for result in results] == list(range(2, 20))
+    assert len(taken) == 20
+
+    # Stopping early doesn't take any more args.
+    taken.clear()
+    results = _iterate_results(
+        double,
+        iterate_args(),
+        2,
+        ('INFO', None)
+    )
+    assert next(results)[0] == 0
+    results.close()
+    assert taken == [0, 1, 2, 3]
+
+
+def test_generate_scenes(tmp_path):
+    factory = run_scene_generator(tmp_path, [False, True, 2, False, False], 3)
+    # Hypercube 1 failed every try, so hypercube 4 was never needed.
+    assert factory.built == 4
+    data = read_debug_data(tmp_path)
+    assert list(data) == [
+        f'mock_{hypercube:04}_{scene:02}_debug.json'
+        for hypercube in range(1, 4) for scene in range(1, 4)
+    ]
+    assert [debug['index'] for debug in data.values()] == [
+        0, 0, 0, 2, 2, 2, 3, 3, 3
+    ]
+    assert data['mock_0002_03_debug.json']['hypercubeNumber'] == 2
+    assert data['mock_0002_03_debug.json']['sceneNumber'] == 3
+    assert (tmp_path / 'mock_0003_02.json').exists()
+
+
+def test_generate_scenes_existing_files(tmp_path):
+    (tmp_path / 'mock_0002_01.json').write_text('{}')
+    run_scene_generator(tmp_path, [False] * 3, 2)
+    assert sorted(path.name for path in tmp_path.glob('*_01.json')) == [
+        'mock_0001_01.json',
+        'mock_0002_01.json',
+        'mock_0003_01.json'
+    ]
+    data = read_debug_data(tmp_path)
+    assert data['mock_0003_01_debug.json']['index'] == 1
+    assert data['mock_0003_01_debug.json']['hypercubeNumber'] == 3
+
+
+def test_generate_scenes_stop_on_error(tmp_path):
+    factory = MockHypercubeFactory([False, True])
+    with pytest.raises(SceneException):
+        SceneGenerator([factory]).generate_scenes(
+            str(tmp_path / 'mock'),
+            2,
+            'Mock',
+            None,
+            True,
+            True,
+            {}
+        )
+    assert (tmp_path / 'mock_0001_01.json').exists()
+
+
+@pytest.mark.parametrize('sort', [True, False])
+def test_generate_scenes_workers(tmp_path, sort):
+    fail_list = [False, True, False, 2, False, False, False]
+    run_scene_generator(tmp_path / 'serial', fail_list, 4, sort=sort)
+    factory = run_scene_generator(
+        tmp_path / 'parallel',
+        fail_list,
+        4,
+        workers=2,
+        sort=sort
+    )
+    # Each hypercube has its own random seed, so the scenes don't depend on
+    # the number of workers.
+    data = read_debug_data(tmp_path / 'serial')
+    assert len(data) == 12
+    assert read_debug_data(tmp_path / 'parallel') == data
+    assert factory.built <= len(fail_list)
+    assert definitions.DATASET_SHUFFLE_SEED is not None
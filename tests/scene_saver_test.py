@@ -1,16 +1,27 @@
 import copy
+import json
 
+import pytest
 from machine_common_sense.config_manager import Goal, Vector3d
 
-from generator import ObjectBounds, Scene, SceneObject
+from generator import (
+    ObjectBounds,
+    PartitionFloor,
+    Scene,
+    SceneException,
+    SceneObject
+)
 from generator.scene_saver import (
-    _convert_non_serializable_data,
+    SceneWriter,
+    _convert_bounding_box,
+    _ready_scene_for_writing,
     _strip_debug_data,
-    _strip_debug_misleading_data,
+    _strip_debug_misleading_movement,
     _strip_debug_object_data,
-    _truncate_floats_in_dict,
-    _truncate_floats_in_list,
-    find_next_filename
+    _truncate_floats,
+    find_next_filename,
+    reserve_next_filename,
+    save_scene_files
 )
 
 
@@ -92,8 +103,62 @@ def test_find_next_filename():
     assert index == 2
 
 
-def test_convert_non_serializable_data():
+def test_reserve_next_filename(tmp_path):
+    prefix = str(tmp_path / 'scene_')
+    filename, index = reserve_next_filename(prefix, 1, '02')
+    assert filename == prefix + '01'
+    assert index == 1
+    assert (tmp_path / 'scene_01.json').exists()
+
+    # The first filename is now reserved, so the next call must skip it.
+    filename, index = reserve_next_filename(prefix, 1, '02')
+    assert filename == prefix + '02'
+    assert index == 2
+
+    filename, index = reserve_next_filename(prefix, 5, '02')
+    assert filename == prefix + '05'
+    assert index == 5
+
+    (tmp_path / 'scene_03.txt').touch()
+    filename, index = reserve_next_filename(prefix, 3, '02', suffix='.txt')
+    assert filename == prefix + '04'
+    assert index == 4
+
+
+def test_reserve_next_filename_creates_folder(tmp_path):
+    prefix = str(tmp_path / 'folder' / 'scene_')
+    filename, index = reserve_next_filename(prefix, 1, '01')
+    assert filename == prefix + '1'
+    assert index == 1
+    assert (tmp_path / 'folder' / 'scene_1.json').exists()
+
+
+def test_convert_bounding_box():
+    bounds = create_test_object()['shows'][0]['boundingBox']
+    expected = [
+        {'x': 2, 'y': 0, 'z': 3},
+        {'x': 2.5, 'y': 0, 'z': 3},
+        {'x': 2.5, 'y': 0, 'z': 3.5},
+        {'x': 2, 'y': 0, 'z': 3.5},
+        {'x': 2, 'y': 1, 'z': 3},
+        {'x': 2.5, 'y': 1, 'z': 3},
+        {'x': 2.5, 'y': 1, 'z': 3.5},
+        {'x': 2, 'y': 1, 'z': 3.5}
+    ]
+    assert _convert_bounding_box(bounds) == expected
+    assert _convert_bounding_box({
+        'box_xz': [
+            {'x': 2, 'z': 3}, {'x': 2.5, 'z': 3}, {'x': 2.5, 'z': 3.5},
+            {'x': 2, 'z': 3.5}
+        ],
+        'max_y': 1,
+        'min_y': 0
+    }) == expected
+
+
+def test_ready_scene_for_writing():
     scene = Scene(objects=[create_test_object()])
+    scene_copy = copy.deepcopy(scene)
     expected_object = create_test_object().data
     expected_object['shows'][0]['boundingBox'] = [
         {'x': 2, 'y': 0, 'z': 3},
@@ -106,8 +171,17 @@ def test_convert_non_serializable_data():
         {'x': 2, 'y': 1, 'z': 3.5}
     ]
     del expected_object['debug']['boundsAtStep']
-    _convert_non_serializable_data(scene)
-    assert scene == Scene(objects=[expected_object])
+    expected = Scene(name='name', objects=[expected_object]).to_dict()
+    actual = _ready_scene_for_writing(scene, 'name')
+    # The debug info list isn't wrapped, so the debug files are written the
+    # same as before.
+    assert isinstance(actual['objects'][0]['debug']['info'], list)
+    assert json.loads(json.dumps(
+        actual,
+        default=lambda data: data.value
+    )) == json.loads(json.dumps(expected))
+    # The scene isn't modified.
+    assert scene == scene_copy
 
 
 def test_strip_debug_data():
@@ -154,11 +228,13 @@ def test_strip_debug_data():
             }
         )
     ).to_dict()
+    scene_copy = copy.deepcopy(scene)
     actual = _strip_debug_data(scene)
     assert actual == expected
+    assert scene == scene_copy
 
 
-def test_strip_debug_misleading_data():
+def test_strip_debug_misleading_movement():
     obj = create_test_object()
     expected = copy.deepcopy(obj.data)
     expected['debug']['movement'] = {
@@ -219,8 +295,10 @@ def test_strip_debug_misleading_data():
             'key': 'value'
         }
     }
-    _strip_debug_misleading_data(Scene(objects=[obj]))
-    assert obj == expected
+    obj_copy = copy.deepcopy(obj.data)
+    actual = _strip_debug_misleading_movement(obj['debug']['movement'])
+    assert actual == expected['debug']['movement']
+    assert obj == obj_copy
 
 
 def test_strip_debug_object_data():
@@ -232,13 +310,14 @@ def test_strip_debug_object_data():
             'stepBegin': 0
         }]
     }
-    _strip_debug_object_data(obj)
-    assert obj == expected
+    obj_copy = copy.deepcopy(obj.data)
+    assert _strip_debug_object_data(obj) == expected
+    assert obj == obj_copy
 
 
 def test_truncate_floats_in_dict():
     data = {'x': 1, 'y': 0.5, 'z': 987654321.123456789, 'tag': 'foobar'}
-    _truncate_floats_in_dict(data)
+    data = _truncate_floats(data)
     assert data['x'] == 1
     assert data['y'] == 0.5
     assert data['z'] == 987654321.1235
@@ -248,17 +327,19 @@ def test_truncate_floats_in_dict():
 def test_truncate_floats_in_dict_recursively():
     nested_data = {'x': 1, 'y': 0.5, 'z': 987654321.123456789, 'tag': 'foobar'}
     data = {'number': 0.987654321, 'nested': nested_data}
-    _truncate_floats_in_dict(data)
+    data = _truncate_floats(data)
     assert data['number'] == 0.9877
     assert data['nested']['x'] == 1
     assert data['nested']['y'] == 0.5
     assert data['nested']['z'] == 987654321.1235
     assert data['nested']['tag'] == 'foobar'
+    # The original data isn't modified.
+    assert nested_data['z'] == 987654321.123456789
 
 
 def test_truncate_floats_in_list():
     data = [1, 0.5, 987654321.123456789, 'foobar']
-    _truncate_floats_in_list(data)
+    data = _truncate_floats(data)
     assert data[0] == 1
     assert data[1] == 0.5
     assert data[2] == 987654321.1235
@@ -268,7 +349,7 @@ def test_truncate_floats_in_list():
 def test_truncate_floats_in_list_recursively():
     nested_data = [1, 0.5, 987654321.123456789, 'foobar']
     data = [0.987654321, nested_data]
-    _truncate_floats_in_list(data)
+    data = _truncate_floats(data)
     assert data[0] == 0.9877
     assert data[1][0] == 1
     assert data[1][1] == 0.5
@@ -276,6 +357,13 @@ def test_truncate_floats_in_list_recursively():
     assert data[1][3] == 'foobar'
 
 
+def test_truncate_floats_in_dataclass():
+    data = {'partition': PartitionFloor(leftHalf=0.123456, rightHalf=1)}
+    assert _truncate_floats(data) == {
+        'partition': {'leftHalf': 0.1235, 'rightHalf': 1}
+    }
+
+
 def test_truncate_floats_advanced():
     nested_a = [1.11111111]
     nested_b = {'number': 2.22222222, 'nested': nested_a}
@@ -286,21 +374,99 @@ def test_truncate_floats_advanced():
     nested_g = {'number': 7.77777777, 'nested': nested_f}
     nested_h = [8.88888888, nested_g]
     data = [nested_d, nested_h]
-    _truncate_floats_in_list(data)
-    assert nested_a == [1.1111]
-    assert nested_b == {'number': 2.2222, 'nested': [1.1111]}
-    assert nested_c == [3.3333, {'number': 2.2222, 'nested': [1.1111]}]
-    assert nested_d == {
+    assert _truncate_floats(data) == [{
         'number': 4.4444,
         'nested': [3.3333, {'number': 2.2222, 'nested': [1.1111]}]
-    }
-    assert nested_e == {'number': 5.5556}
-    assert nested_f == [6.6667, {'number': 5.5556}]
-    assert nested_g == {
-        'number': 7.7778,
-        'nested': [6.6667, {'number': 5.5556}]
-    }
-    assert nested_h == [
+    }, [
         8.8889,
         {'number': 7.7778, 'nested': [6.6667, {'number': 5.5556}]}
-    ]
+    ]]
+
+
+def test_save_scene_files(tmp_path):
+    scene = Scene(
+        debug={'floorColors': ['grey']},
+        objects=[create_test_object()],
+        goal=Goal(
+            category='test',
+            action_list=[['Pass']],
+            scene_info={'id': ['scene_id']},
+            metadata={'target': {'id': 'thing1', 'info': ['a', 'b']}}
+        )
+    )
+    scene_copy = copy.deepcopy(scene)
+    save_scene_files(scene, str(tmp_path / 'scene'))
+    assert scene == scene_copy
+
+    with open(tmp_path / 'scene_scene_id_debug.json') as scene_file:
+        text = scene_file.read()
+        data = json.loads(text)
+    # Lists that shouldn't be indented are on one line.
+    assert '"action_list": [["Pass"]]' in text
+    assert '"materials": []' not in text
+    assert data['name'] == 'scene'
+    assert data['debug'] == {'floorColors': ['grey']}
+    assert data['goal']['sceneInfo'] == {'id': ['scene_id']}
+    assert data['goal']['metadata']['target']['info'] == ['a', 'b']
+    assert data['objects'][0]['debug']['goalString'] == 'abcd'
+    assert 'boundsAtStep' not in data['objects'][0]['debug']
+    assert len(data['objects'][0]['shows'][0]['boundingBox']) == 8
+
+    with open(tmp_path / 'scene.json') as scene_file:
+        data = json.load(scene_file)
+    assert data['name'] == 'scene'
+    assert 'debug' not in data
+    assert 'sceneInfo' not in data['goal']
+    assert data['goal']['metadata']['target'] == {'id': 'thing1'}
+    assert 'debug' not in data['objects'][0]
+    assert data['objects'][0]['shows'] == [{'stepBegin': 0}]
+
+
+def test_scene_writer(tmp_path):
+    scene = Scene(objects=[create_test_object()])
+    with SceneWriter(workers=2, max_pending=2) as writer:
+        for index in range(5):
+            writer.submit(scene, str(tmp_path / f'scene_{index}'))
+        # Changing the scene after submitting it doesn't change its files.
+        scene.objects = []
+    for index in range(5):
+        assert (tmp_path / f'scene_{index}.json').exists()
+        assert (tmp_path / f'scene_{index}_debug.json').exists()
+        with open(tmp_path / f'scene_{index}.json') as scene_file:
+            data = json.load(scene_file)
+        assert data['name'] == f'scene_{index}'
+        assert data['objects'][0]['id'] == 'thing1'
+        assert 'debug' not in data['objects'][0]
+
+
+def test_scene_writer_same_output_as_save_scene_files(tmp_path):
+    scene = Scene(objects=[create_test_object()])
+    save_scene_files(scene, str(tmp_path / 'folder_1' / 'scene'))
+    with SceneWriter() as writer:
+        writer.submit(scene, str(tmp_path / 'folder_2' / 'scene'))
+    for filename in ['scene.json', 'scene_debug.json']:
+        assert (
+            (tmp_path / 'folder_1' / filename).read_text() ==
+            (tmp_path / 'folder_2' / filename).read_text()
+        )
+
+
+def test_scene_writer_error(tmp_path):
+    # Make saving fail by using an existing file as the output folder.
+    (tmp_path / 'file').touch()
+    writer = SceneWriter()
+    writer.submit(Scene(), str(tmp_path / 'file' / 'scene'))
+    with pytest.raises(SceneException):
+        writer.close()
+    with pytest.raises(SceneException):
+        writer.submit(Scene(), str(tmp_path / 'scene'))
+
+
+def test_scene_writer_error_on_submit(tmp_path):
+    (tmp_path / 'file').touch()
+    writer = SceneWriter()
+    writer.submit(Scene(), str(tmp_path / 'file' / 'scene')).exception()
+    # The error is raised on the next call after the failure.
+    with pytest.raises(SceneException):
+        writer.submit(Scene(), str(tmp_path / 'scene'))
+    writer.close()
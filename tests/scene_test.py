@@ -1,3 +1,5 @@
+import copy
+
 from machine_common_sense.config_manager import (
     FloorTexturesConfig,
     Goal,
@@ -6,7 +8,11 @@ from machine_common_sense.config_manager import (
 )
 
 from generator import ObjectBounds, SceneObject, geometry
-from generator.scene import Scene, get_step_limit_from_dimensions
+from generator.scene import (
+    Scene,
+    SceneObjectList,
+    get_step_limit_from_dimensions
+)
 
 from .ile_helper import prior_scene_with_target, prior_scene_with_targets
 
@@ -320,6 +326,86 @@ def test_find_bounds():
     assert scene.find_bounds() == [bounds_4, bounds_3, bounds_1, bounds_2]
 
 
+def test_find_bounds_after_scene_changes():
+    bounds_1 = ObjectBounds(box_xz=[
+        Vector3d(x=1, y=0, z=1),
+        Vector3d(x=2, y=0, z=1),
+        Vector3d(x=2, y=0, z=2),
+        Vector3d(x=1, y=0, z=2)
+    ], max_y=1, min_y=0)
+    bounds_2 = ObjectBounds(box_xz=[
+        Vector3d(x=-1, y=0, z=-1),
+        Vector3d(x=-2, y=0, z=-1),
+        Vector3d(x=-2, y=0, z=-2),
+        Vector3d(x=-1, y=0, z=-2)
+    ], max_y=1, min_y=0)
+    buffer = geometry.FLOOR_FEATURE_BOUNDS_BUFFER
+    bounds_3 = ObjectBounds(box_xz=[
+        Vector3d(x=2.5 + buffer, y=0, z=2.5 + buffer),
+        Vector3d(x=3.5 - buffer, y=0, z=2.5 + buffer),
+        Vector3d(x=3.5 - buffer, y=0, z=3.5 - buffer),
+        Vector3d(x=2.5 + buffer, y=0, z=3.5 - buffer)
+    ], max_y=100, min_y=0)
+
+    scene = Scene(objects=[{'shows': [{'boundingBox': bounds_1}]}])
+    assert scene.find_bounds() == [bounds_1]
+
+    # Modifying the returned list must not modify the scene's cached bounds.
+    bounds_list = scene.find_bounds()
+    bounds_list.append(bounds_2)
+    assert scene.find_bounds() == [bounds_1]
+
+    scene.objects.append({'shows': [{'boundingBox': bounds_2}]})
+    assert scene.find_bounds() == [bounds_1, bounds_2]
+
+    scene.objects = scene.objects[1:]
+    assert scene.find_bounds() == [bounds_2]
+
+    scene.objects[0]['shows'][0]['boundingBox'] = bounds_1
+    assert scene.find_bounds() == [bounds_1]
+
+    scene.holes.append(Vector2dInt(x=3, z=3))
+    assert scene.find_bounds() == [bounds_3, bounds_1]
+    assert scene.find_bounds(ignore_ground=True) == [bounds_1]
+
+    scene.holes = []
+    scene.lava = [Vector2dInt(x=3, z=3)]
+    assert scene.find_bounds() == [bounds_3, bounds_1]
+
+    scene.lava = []
+    assert scene.find_bounds() == [bounds_1]
+
+
+def test_find_bounds_is_indexed():
+    bounds_1 = ObjectBounds(box_xz=[
+        Vector3d(x=1, y=0, z=1),
+        Vector3d(x=2, y=0, z=1),
+        Vector3d(x=2, y=0, z=2),
+        Vector3d(x=1, y=0, z=2)
+    ], max_y=1, min_y=0)
+    bounds_2 = ObjectBounds(box_xz=[
+        Vector3d(x=-1, y=0, z=-1),
+        Vector3d(x=-2, y=0, z=-1),
+        Vector3d(x=-2, y=0, z=-2),
+        Vector3d(x=-1, y=0, z=-2)
+    ], max_y=1, min_y=0)
+    scene = Scene(objects=[
+        {'shows': [{'boundingBox': bounds_1}]},
+        {'shows': [{'boundingBox': bounds_2}]}
+    ])
+    bounds_list = scene.find_bounds()
+    assert bounds_list.find_nearby(bounds_1.box_xz) == [bounds_1]
+    assert bounds_list.find_nearby(bounds_2.box_xz) == [bounds_2]
+
+    # The index is reused (not rebuilt) by each call, with or without the
+    # ground bounds.
+    for ignore_ground in [False, True]:
+        scene.find_bounds(ignore_ground=ignore_ground)
+        index = scene._bounds_index_cache[ignore_ground][2]
+        scene.find_bounds(ignore_ground=ignore_ground)
+        assert scene._bounds_index_cache[ignore_ground][2] is index
+
+
 def test_find_bounds_ignore_id():
     bounds_1 = ObjectBounds(box_xz=[
         Vector3d(x=1, y=0, z=1),
@@ -359,3 +445,150 @@ def test_find_bounds_ignore_id():
         {'id': 'id_2', 'shows': [{'boundingBox': bounds_2}]}
     ])
     assert scene.find_bounds(ignore_ids=['id_1', 'id_2']) == []
+    assert scene.find_bounds(ignore_ids={'id_2'}) == [bounds_1]
+    assert scene.find_bounds(ignore_ids=('id_3',)) == [bounds_1, bounds_2]
+
+
+def test_get_objects_by_id_type_and_role():
+    object_a = {'id': 'a', 'type': 'ball', 'debug': {'role': 'target'}}
+    object_b = {'id': 'b', 'type': 'cube', 'debug': {'role': 'distractor'}}
+    object_c = {'id': 'c', 'type': 'ball', 'debug': {'role': 'distractor'}}
+    scene = Scene(objects=[object_a, object_b])
+    assert isinstance(scene.objects, SceneObjectList)
+    scene.objects.append(object_c)
+
+    assert scene.get_object_by_id('a') is object_a
+    assert scene.get_object_by_id('c') is object_c
+    assert scene.get_object_by_id('d') is None
+    assert scene.get_object_by_id(['a']) is None
+    assert scene.get_objects_by_type('ball') == [object_a, object_c]
+    assert scene.get_objects_by_type('sofa') == []
+    assert scene.get_objects_by_role('distractor') == [object_b, object_c]
+
+    scene.objects.remove(object_a)
+    assert scene.get_object_by_id('a') is None
+    assert scene.get_objects_by_type('ball') == [object_c]
+    del scene.objects[0]
+    assert scene.get_objects_by_role('distractor') == [object_c]
+    scene.objects.insert(0, object_a)
+    scene.objects.extend([object_b])
+    assert scene.get_objects_by_type('ball') == [object_a, object_c]
+    assert scene.get_object_by_id('b') is object_b
+    assert scene.objects.pop() is object_b
+    assert scene.get_object_by_id('b') is None
+
+    # Replacing the list keeps it indexed.
+    scene.objects = [object_b]
+    assert isinstance(scene.objects, SceneObjectList)
+    assert scene.get_object_by_id('b') is object_b
+    scene.objects[:] = [object_a, object_c]
+    assert scene.get_object_by_id('b') is None
+    assert scene.get_objects_by_type('ball') == [object_a, object_c]
+
+
+def test_get_objects_after_changes():
+    object_a = {'id': 'a', 'type': 'ball', 'debug': {'role': 'target'}}
+    object_b = {'id': 'b', 'type': 'cube', 'debug': {}}
+    scene = Scene(objects=[object_a, object_b])
+
+    # A changed ID is found without reindexing.
+    object_a['id'] = 'z'
+    assert scene.get_object_by_id('a') is None
+    assert scene.get_object_by_id('z') is object_a
+    scene.objects.remove(object_a)
+    assert scene.get_object_by_id('z') is None
+
+    # A changed type or role is found after reindexing.
+    object_b['type'] = 'ball'
+    object_b['debug']['role'] = 'target'
+    assert scene.get_objects_by_type('cube') == []
+    assert scene.get_objects_by_type('ball') == []
+    scene.objects.reindex()
+    assert scene.get_objects_by_type('ball') == [object_b]
+    assert scene.get_objects_by_role('target') == [object_b]
+
+    # Copies have their own indexes.
+    for scene_copy in [copy.deepcopy(scene), scene.overlay()]:
+        assert isinstance(scene_copy.objects, SceneObjectList)
+        scene_copy.objects.append(object_a)
+        assert scene_copy.get_object_by_id('z')
+        assert scene.get_object_by_id('z') is None
+
+
+def test_overlay():
+    bounds_1 = ObjectBounds(box_xz=[
+        Vector3d(x=1, y=0, z=1),
+        Vector3d(x=2, y=0, z=1),
+        Vector3d(x=2, y=0, z=2),
+        Vector3d(x=1, y=0, z=2)
+    ], max_y=1, min_y=0)
+    bounds_2 = ObjectBounds(box_xz=[
+        Vector3d(x=-1, y=0, z=-1),
+        Vector3d(x=-2, y=0, z=-1),
+        Vector3d(x=-2, y=0, z=-2),
+        Vector3d(x=-1, y=0, z=-2)
+    ], max_y=1, min_y=0)
+    buffer = geometry.FLOOR_FEATURE_BOUNDS_BUFFER
+    bounds_3 = ObjectBounds(box_xz=[
+        Vector3d(x=2.5 + buffer, y=0, z=2.5 + buffer),
+        Vector3d(x=3.5 - buffer, y=0, z=2.5 + buffer),
+        Vector3d(x=3.5 - buffer, y=0, z=3.5 - buffer),
+        Vector3d(x=2.5 + buffer, y=0, z=3.5 - buffer)
+    ], max_y=100, min_y=0)
+    object_1 = {'id': 'id_1', 'shows': [{'boundingBox': bounds_1}]}
+    object_2 = {'id': 'id_2', 'shows': [{'boundingBox': bounds_2}]}
+    scene = Scene(objects=[object_1], debug={'key': 'a'})
+    objects = scene.objects
+    room_dimensions = scene.room_dimensions
+    assert scene.find_bounds() == [bounds_1]
+
+    overlay = scene.overlay()
+    assert overlay.objects == [object_1]
+    assert overlay.objects[0] is object_1
+    overlay.objects.append(object_2)
+    overlay.lava.append(Vector2dInt(x=3, z=3))
+    overlay.debug['key'] = 'b'
+    overlay.room_dimensions = Vector3d(x=12, y=3, z=12)
+    assert overlay.get_object_by_id('id_2') is object_2
+    assert overlay.find_bounds() == [bounds_3, bounds_1, bounds_2]
+    assert overlay.find_bounds(ignore_ground=True) == [bounds_1, bounds_2]
+    assert overlay.find_bounds(ignore_ids=['id_1']) == [bounds_3, bounds_2]
+
+    # The scene is unchanged.
+    assert scene.objects == [object_1]
+    assert scene.lava == []
+    assert scene.debug == {'key': 'a'}
+    assert scene.room_dimensions is room_dimensions
+    assert scene.find_bounds() == [bounds_1]
+
+    assert overlay.commit() is scene
+    assert scene.objects is objects
+    assert scene.objects == [object_1, object_2]
+    assert scene.lava == [Vector2dInt(x=3, z=3)]
+    assert scene.debug == {'key': 'b'}
+    assert scene.room_dimensions == Vector3d(x=12, y=3, z=12)
+    assert scene.find_bounds() == [bounds_3, bounds_1, bounds_2]
+    assert scene.find_bounds().find_nearby(bounds_2.box_xz) == [bounds_2]
+
+
+def test_overlay_discarded():
+    scene = Scene(objects=[{'id': 'id_1'}, {'id': 'id_2'}])
+    overlay = scene.overlay()
+    overlay.objects.pop(0)
+    overlay.holes.append(Vector2dInt(x=1, z=1))
+    assert overlay.objects == [{'id': 'id_2'}]
+    del overlay
+    assert scene.objects == [{'id': 'id_1'}, {'id': 'id_2'}]
+    assert scene.holes == []
+
+    # Nested overlays are committed to the outer overlay.
+    overlay = scene.overlay()
+    nested = overlay.overlay()
+    nested.objects.pop(0)
+    nested.commit()
+    assert overlay.objects == [{'id': 'id_2'}]
+    assert scene.objects == [{'id': 'id_1'}, {'id': 'id_2'}]
+    assert overlay.to_dict() == {
+        **scene.to_dict(),
+        'objects': [{'id': 'id_2'}]
+    }